@@ -0,0 +1,174 @@
+"""
+Audio ingestion for the MOM apps.
+
+Everything ends up as one float32 mono 16 kHz array that is passed straight
+to Whisper, decoded exactly once:
+- PCM / float WAV files are memory-mapped and downmixed + resampled block
+  by block, so only the 16 kHz output is ever fully resident
+- anything else (mp3, m4a, ...) is decoded by ffmpeg straight to 16 kHz
+  through a pipe (whisper.load_audio), without a temp WAV
+- live recordings (pydub AudioSegment) are converted in memory
+"""
+import os
+import shutil
+import struct
+
+import numpy as np
+
+from vad import SAMPLE_RATE
+
+RESAMPLE_BLOCK_S = 30
+
+# (format tag, bits per sample) -> (dtype, offset, scale)
+WAV_FORMATS = {
+    (1, 8): (np.uint8, 128.0, 1 / 128),
+    (1, 16): (np.dtype("<i2"), 0.0, 1 / 32768),
+    (1, 32): (np.dtype("<i4"), 0.0, 1 / 2147483648),
+    (3, 32): (np.dtype("<f4"), 0.0, 1.0),
+    (3, 64): (np.dtype("<f8"), 0.0, 1.0),
+}
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+# ---------------- WAV (MEMORY MAPPED) ----------------
+def wav_layout(path):
+    """
+    Parse the RIFF header. Returns (format_tag, channels, rate, bits,
+    data_offset, data_bytes), or None if this is not a WAV file.
+    """
+    with open(path, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            return None
+
+        file_size = os.fstat(f.fileno()).st_size
+        fmt = None
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                return None
+            chunk_id, size = chunk[:4], struct.unpack("<I", chunk[4:])[0]
+
+            if chunk_id == b"data":
+                if fmt is None:
+                    return None
+                offset = f.tell()
+                # recorders that never patch the header leave 0 or 0xFFFFFFFF here
+                if size == 0 or offset + size > file_size:
+                    size = file_size - offset
+                return fmt + (offset, size)
+
+            if chunk_id == b"fmt ":
+                body = f.read(size)
+                tag, channels, rate = struct.unpack("<HHI", body[:8])
+                bits = struct.unpack("<H", body[14:16])[0]
+                if tag == WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                    tag = struct.unpack("<H", body[24:26])[0]
+                fmt = (tag, channels, rate, bits)
+                f.seek(size % 2, 1)
+            else:
+                # chunks are word aligned
+                f.seek(size + size % 2, 1)
+
+
+def load_wav_mmap(path, sr=SAMPLE_RATE):
+    """Memory-mapped WAV -> float32 mono at `sr`, or None for unsupported encodings."""
+    layout = wav_layout(path)
+    if layout is None:
+        return None
+    tag, channels, rate, bits, offset, size = layout
+    if (tag, bits) not in WAV_FORMATS or channels == 0:
+        return None
+
+    dtype, zero, scale = WAV_FORMATS[(tag, bits)]
+    frames = size // (channels * np.dtype(dtype).itemsize)
+    if frames == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    data = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(frames, channels))
+    return resample(data, rate, sr, zero=zero, scale=scale)
+
+
+# ---------------- RESAMPLING ----------------
+def to_mono_float(block, zero=0.0, scale=1.0):
+    """(n, channels) samples of any dtype -> float32 mono in [-1, 1]."""
+    x = block.astype(np.float32)
+    if x.ndim == 2:
+        x = x[:, 0] if x.shape[1] == 1 else x.mean(axis=1)
+    if zero:
+        x -= zero
+    if scale != 1.0:
+        x *= scale
+    return x
+
+
+def resample(samples, src_rate, dst_rate=SAMPLE_RATE, zero=0.0, scale=1.0):
+    """
+    Downmix + resample (n, channels) samples into a new float32 array.
+    Works in RESAMPLE_BLOCK_S blocks so a memory-mapped input is never
+    converted to float as a whole. Linear interpolation, with a moving
+    average in front when downsampling to keep aliasing down.
+    """
+    n_in = len(samples)
+    if src_rate == dst_rate:
+        out = np.empty(n_in, dtype=np.float32)
+        step = src_rate * RESAMPLE_BLOCK_S
+        for i in range(0, n_in, step):
+            out[i:i + step] = to_mono_float(samples[i:i + step], zero, scale)
+        return out
+
+    ratio = src_rate / dst_rate
+    n_out = int(n_in / ratio)
+    out = np.empty(n_out, dtype=np.float32)
+    width = int(round(ratio)) if ratio >= 1.5 else 1
+    kernel = np.full(width, 1 / width, dtype=np.float32)
+
+    step = dst_rate * RESAMPLE_BLOCK_S
+    for j0 in range(0, n_out, step):
+        j1 = min(n_out, j0 + step)
+        positions = np.arange(j0, j1) * ratio
+        # a few extra input samples on both sides keep block edges seamless
+        i0 = max(0, int(positions[0]) - width)
+        i1 = min(n_in, int(positions[-1]) + 2 + width)
+        x = to_mono_float(samples[i0:i1], zero, scale)
+        if width > 1:
+            x = np.convolve(x, kernel, mode="same")
+        out[j0:j1] = np.interp(positions - i0, np.arange(len(x)), x)
+    return out
+
+
+# ---------------- ENTRY POINTS ----------------
+def load_audio(source, sr=SAMPLE_RATE):
+    """
+    Path or already decoded float32 array -> float32 mono array at `sr`.
+    WAVs are memory-mapped; other formats go through ffmpeg once.
+    """
+    if isinstance(source, np.ndarray):
+        return source.astype(np.float32, copy=False)
+
+    audio = load_wav_mmap(source, sr)
+    if audio is not None:
+        return audio
+
+    import whisper
+    return whisper.load_audio(source, sr=sr)
+
+
+def from_recording(segment, sr=SAMPLE_RATE):
+    """audiorecorder / pydub AudioSegment -> float32 mono array at `sr`."""
+    samples = np.array(segment.get_array_of_samples())
+    samples = samples.reshape(-1, segment.channels)
+    scale = 1 / (1 << (8 * segment.sample_width - 1))
+    return resample(samples, segment.frame_rate, sr, scale=scale)
+
+
+def save_upload(uploaded_file, path):
+    """Write an upload to disk under `path` (its extension picks the decoder).
+
+    Streamlit's UploadedFile is already held in memory, so this saves no RAM
+    over uploaded_file.read(); the savings come from load_audio.
+    """
+    uploaded_file.seek(0)
+    with open(path, "wb") as f:
+        shutil.copyfileobj(uploaded_file, f)
+    return path
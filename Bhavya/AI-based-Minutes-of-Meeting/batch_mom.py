@@ -0,0 +1,175 @@
+"""
+Generate MOMs for every recording in a folder.
+
+    python batch_mom.py recordings/ --out moms/
+
+Each worker process loads the models once and handles many files.
+Writes <name>.<ext>.mom.txt and <name>.<ext>.mom.json per recording (the
+extension stays in the name, so meeting.wav and meeting.mp3 don't collide)
+and skips recordings whose JSON output is already newer than the audio.
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from multiprocessing import get_context
+
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".flac", ".ogg")
+
+# Whisper base + BART large + sentiment + spaCy resident in one worker
+DEFAULT_RAM_PER_WORKER_GB = 3.0
+
+
+# ---------------- PLANNING ----------------
+def available_cpus():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def available_ram_bytes():
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+def pick_worker_count(n_files, ram_per_worker_gb=DEFAULT_RAM_PER_WORKER_GB):
+    workers = min(available_cpus(), n_files)
+    ram = available_ram_bytes()
+    if ram is not None:
+        workers = min(workers, int(ram // (ram_per_worker_gb * 1024 ** 3)))
+    return max(1, workers)
+
+def output_paths(audio_path, out_dir):
+    name = os.path.basename(audio_path)
+    return (
+        os.path.join(out_dir, name + ".mom.txt"),
+        os.path.join(out_dir, name + ".mom.json"),
+    )
+
+def already_processed(audio_path, out_dir):
+    _, json_path = output_paths(audio_path, out_dir)
+    return (
+        os.path.exists(json_path)
+        and os.path.getmtime(json_path) >= os.path.getmtime(audio_path)
+    )
+
+def find_recordings(in_dir):
+    return sorted(
+        os.path.join(in_dir, name)
+        for name in os.listdir(in_dir)
+        if name.lower().endswith(AUDIO_EXTENSIONS)
+    )
+
+
+# ---------------- WORKER ----------------
+def init_worker(torch_threads):
+    # split the cores between workers instead of every worker using all of them
+    import torch
+    torch.set_num_threads(torch_threads)
+
+    from mom_pipeline import load_models
+    load_models()
+
+def _write_atomic(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def process_recording(audio_path, out_dir):
+    from mom_pipeline import run_pipeline
+
+    started = time.perf_counter()
+    when = datetime.fromtimestamp(os.path.getmtime(audio_path))
+    result = run_pipeline(audio_path, when=when)
+    seconds = time.perf_counter() - started
+
+    txt_path, json_path = output_paths(audio_path, out_dir)
+    _write_atomic(txt_path, result["mom"])
+    # JSON goes last: its presence marks the recording as done
+    _write_atomic(json_path, json.dumps({
+        "source": os.path.abspath(audio_path),
+        "recorded_at": when.isoformat(timespec="minutes"),
+        "processing_s": round(seconds, 2),
+        **result,
+    }, indent=2, ensure_ascii=False))
+
+    return audio_path, result["vad"]["total_s"], seconds, result["stages"], result["model_labels"]
+
+
+# ---------------- CLI ----------------
+def main():
+    parser = argparse.ArgumentParser(description="Batch MOM generation over a folder of recordings")
+    parser.add_argument("in_dir")
+    parser.add_argument("--out", help="output folder (default: <in_dir>/mom)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: based on cores and free RAM)")
+    parser.add_argument("--ram-per-worker-gb", type=float, default=DEFAULT_RAM_PER_WORKER_GB)
+    parser.add_argument("--force", action="store_true", help="reprocess recordings that already have output")
+    parser.add_argument("--metrics", help="stage metrics JSON lines file (default: <out>/mom_metrics.jsonl)")
+    parser.add_argument("--prometheus", help="also write per-stage batch totals in Prometheus text format")
+    args = parser.parse_args()
+
+    out_dir = args.out or os.path.join(args.in_dir, "mom")
+    os.makedirs(out_dir, exist_ok=True)
+
+    recordings = find_recordings(args.in_dir)
+    todo = [p for p in recordings if args.force or not already_processed(p, out_dir)]
+    print(f"{len(recordings)} recordings, {len(recordings) - len(todo)} already processed, {len(todo)} to do")
+    if not todo:
+        return
+
+    workers = args.workers or pick_worker_count(len(todo), args.ram_per_worker_gb)
+    torch_threads = max(1, available_cpus() // workers)
+    print(f"using {workers} worker(s) x {torch_threads} thread(s)")
+
+    from stage_metrics import StageProfiler, merge_stage_records
+    metrics_path = args.metrics or os.path.join(out_dir, "mom_metrics.jsonl")
+    all_stages, labels = [], {}
+
+    started = time.perf_counter()
+    audio_seconds = 0.0
+    failed = 0
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context("spawn"),
+        initializer=init_worker,
+        initargs=(torch_threads,),
+    ) as pool:
+        futures = {pool.submit(process_recording, p, out_dir): p for p in todo}
+        for future in as_completed(futures):
+            try:
+                path, duration, seconds, stages, labels = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"FAILED {futures[future]}: {e}")
+                continue
+            audio_seconds += duration
+            all_stages.extend(stages)
+            file_profiler = StageProfiler(labels=labels)
+            file_profiler.records = stages
+            file_profiler.to_jsonl(metrics_path, file=os.path.basename(path))
+            print(f"done   {os.path.basename(path)}: {duration:.0f}s audio in {seconds:.0f}s")
+
+    wall = time.perf_counter() - started
+    print(
+        f"\n{len(todo) - failed} processed, {failed} failed, "
+        f"{audio_seconds:.0f}s audio in {wall:.0f}s wall "
+        f"= {audio_seconds / wall:.2f} audio-s per wall-s"
+    )
+
+    if all_stages:
+        batch_profiler = StageProfiler(labels=labels)
+        batch_profiler.records = merge_stage_records(all_stages)
+        print("\nstage totals:")
+        for record in sorted(batch_profiler.records, key=lambda r: -r["wall_s"]):
+            print(f"  {record['stage']:<16} {record['wall_s']:>9.1f}s wall {record['cpu_s']:>9.1f}s cpu")
+        if args.prometheus:
+            with open(args.prometheus, "w") as f:
+                f.write(batch_profiler.to_prometheus(prefix="mom_batch_stage"))
+
+
+if __name__ == "__main__":
+    main()
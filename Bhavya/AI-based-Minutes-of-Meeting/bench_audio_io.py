@@ -0,0 +1,118 @@
+"""
+Peak RSS and time of audio ingestion, old path vs audio_io.
+
+    python bench_audio_io.py [--minutes 60] [--rate 44100] [--channels 2]
+
+Generates a synthetic 16-bit PCM WAV, then runs each path in a fresh
+process so peak RSS is measured in isolation:
+- before: upload.read() -> temp wav -> whisper.load_audio (ffmpeg)
+- whole:  upload.read() -> temp wav -> whole file decoded to float in numpy
+- after:  save_upload -> memory-mapped load_audio
+"before" needs whisper and ffmpeg and is skipped without them; "whole" and
+"after" need only numpy, so they compare the loaders on their own.
+"""
+import argparse
+import importlib.util
+import os
+import resource
+import shutil
+import struct
+import tempfile
+import time
+from multiprocessing import get_context
+
+import numpy as np
+
+
+def write_test_wav(path, minutes, rate, channels):
+    frames = int(minutes * 60 * rate)
+    data_bytes = frames * channels * 2
+    with open(path, "wb") as f:
+        f.write(b"RIFF" + struct.pack("<I", 36 + data_bytes) + b"WAVE")
+        f.write(b"fmt " + struct.pack("<IHHIIHH", 16, 1, channels, rate, rate * channels * 2, channels * 2, 16))
+        f.write(b"data" + struct.pack("<I", data_bytes))
+        rng = np.random.default_rng(0)
+        block = rate * 10
+        for start in range(0, frames, block):
+            n = min(block, frames - start)
+            t = (start + np.arange(n)) / rate
+            tone = 0.3 * np.sin(2 * np.pi * 220 * t) + 0.05 * rng.standard_normal(n)
+            samples = (np.repeat(tone[:, None], channels, axis=1) * 32767).astype("<i2")
+            f.write(samples.tobytes())
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def ingest_before(src, workdir):
+    import whisper
+
+    with open(src, "rb") as upload:
+        data = upload.read()
+    tmp = os.path.join(workdir, "uploaded_audio.wav")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    del data
+    return len(whisper.load_audio(tmp))
+
+
+def ingest_whole(src, workdir):
+    from audio_io import resample, wav_layout
+
+    with open(src, "rb") as upload:
+        data = upload.read()
+    tmp = os.path.join(workdir, "uploaded_audio.wav")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    _, channels, rate, _, offset, size = wav_layout(tmp)
+    pcm = np.frombuffer(data, dtype="<i2", count=size // 2, offset=offset).reshape(-1, channels)
+    samples = pcm.astype(np.float32) / 32768
+    return len(resample(samples, rate))
+
+
+def ingest_after(src, workdir):
+    from audio_io import load_audio, save_upload
+
+    with open(src, "rb") as upload:
+        tmp = save_upload(upload, os.path.join(workdir, "uploaded_audio.wav"))
+    return len(load_audio(tmp))
+
+
+def _measure(name, src, workdir, queue):
+    func = {"before": ingest_before, "whole": ingest_whole, "after": ingest_after}[name]
+    baseline = peak_rss_mb()
+    started = time.perf_counter()
+    samples = func(src, workdir)
+    queue.put((time.perf_counter() - started, peak_rss_mb() - baseline, samples))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minutes", type=float, default=60)
+    parser.add_argument("--rate", type=int, default=44100)
+    parser.add_argument("--channels", type=int, default=2)
+    args = parser.parse_args()
+
+    ctx = get_context("spawn")
+    with tempfile.TemporaryDirectory() as workdir:
+        src = os.path.join(workdir, "meeting.wav")
+        write_test_wav(src, args.minutes, args.rate, args.channels)
+        print(f"input: {os.path.getsize(src) / 1e6:.0f} MB, {args.minutes:g} min, {args.rate} Hz x {args.channels}")
+
+        names = ["whole", "after"]
+        if shutil.which("ffmpeg") and importlib.util.find_spec("whisper"):
+            names.insert(0, "before")
+        else:
+            print("before: skipped (needs whisper and ffmpeg)")
+        for name in names:
+            queue = ctx.Queue()
+            proc = ctx.Process(target=_measure, args=(name, src, workdir, queue))
+            proc.start()
+            seconds, rss_mb, samples = queue.get()
+            proc.join()
+            print(f"{name:<7} {seconds:7.2f}s  peak RSS +{rss_mb:7.0f} MB  ({samples} samples @16k)")
+
+
+if __name__ == "__main__":
+    main()
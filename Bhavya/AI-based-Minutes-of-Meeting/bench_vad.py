@@ -0,0 +1,40 @@
+"""
+Compare full Whisper transcription against the VAD pre-pass.
+
+    python bench_vad.py meeting.wav [--model base]
+"""
+import argparse
+import time
+
+import whisper
+
+from vad import transcribe_voiced
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("audio")
+    parser.add_argument("--model", default="base")
+    args = parser.parse_args()
+
+    model = whisper.load_model(args.model)
+    audio = whisper.load_audio(args.audio)
+
+    started = time.perf_counter()
+    full = model.transcribe(audio)
+    full_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    voiced = transcribe_voiced(model, audio)
+    vad_s = time.perf_counter() - started
+
+    vad = voiced["vad"]
+    print(f"audio:           {vad['total_s']:.1f}s")
+    print(f"skipped:         {vad['skipped_s']:.1f}s ({vad['skipped_pct']:.1f}%), {vad['regions']} voiced regions")
+    print(f"full transcribe: {full_s:.2f}s ({len(full['text'].split())} words)")
+    print(f"vad transcribe:  {vad_s:.2f}s ({len(voiced['text'].split())} words, vad pass {vad['vad_s']:.3f}s)")
+    print(f"speedup:         {full_s / vad_s:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Thin client for model_server.py (stdlib + numpy only, no torch in the app process).
+
+    client = ModelClient("http://127.0.0.1:8765")
+    client.summarize(["chunk one ...", "chunk two ..."])
+"""
+import json
+import urllib.request
+
+import numpy as np
+
+
+class ModelServerError(RuntimeError):
+    pass
+
+
+class ModelClient:
+    def __init__(self, url, timeout=600):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def _post(self, path, data, content_type="application/json"):
+        request = urllib.request.Request(
+            self.url + path, data=data, headers={"Content-Type": content_type}, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())["result"]
+        except urllib.error.HTTPError as e:
+            raise ModelServerError(f"{path}: {e.code} {e.read().decode(errors='replace')}") from None
+        except urllib.error.URLError as e:
+            raise ModelServerError(f"model server at {self.url} unreachable: {e.reason}") from None
+
+    def _post_json(self, path, payload):
+        return self._post(path, json.dumps(payload).encode())
+
+    def summarize(self, texts, max_length=120, min_length=40):
+        return self._post_json("/summarize", {"texts": texts, "max_length": max_length, "min_length": min_length})
+
+    def sentiment(self, texts):
+        return self._post_json("/sentiment", {"texts": texts})
+
+    def generate(self, prompts, model, max_length=512):
+        return self._post_json("/generate", {"prompts": prompts, "model": model, "max_length": max_length})
+
+    def transcribe(self, audio):
+        """Whisper result (with "vad" stats) for 16 kHz float32 samples."""
+        data = np.ascontiguousarray(audio, dtype="<f4").tobytes()
+        return self._post("/transcribe", data, "application/octet-stream")
+
+    def health(self):
+        try:
+            with urllib.request.urlopen(self.url + "/health", timeout=5) as response:
+                return json.loads(response.read())
+        except urllib.error.URLError as e:
+            raise ModelServerError(f"model server at {self.url} unreachable: {e.reason}") from None
+
+    def metrics(self):
+        with urllib.request.urlopen(self.url + "/metrics", timeout=5) as response:
+            return response.read().decode()
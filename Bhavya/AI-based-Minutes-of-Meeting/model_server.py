@@ -0,0 +1,292 @@
+"""
+Shared local model server for the MOM apps.
+
+    python model_server.py --port 8765 [--preload]
+    MOM_MODEL_SERVER=http://127.0.0.1:8765 streamlit run app.py
+
+One process owns Whisper, BART, the sentiment model and any text2text
+generator, so N Streamlit sessions cost one copy of the weights instead of N.
+Requests from all sessions are queued per model and run as dynamic
+micro-batches: a batch is dispatched when it reaches --max-batch items or
+when the oldest item has waited --max-wait-ms. Whisper's transcribe() can't
+batch, so it runs one recording at a time. Concurrent uploads queue instead
+of fighting over cores.
+
+    POST /summarize   {"texts": [...], "max_length": 120, "min_length": 40}
+    POST /sentiment   {"texts": [...]}
+    POST /generate    {"prompts": [...], "model": "...", "max_length": 512}
+    POST /transcribe  raw float32 PCM at 16 kHz (application/octet-stream)
+    GET  /health
+    GET  /metrics     Prometheus text: queue depth, batch sizes, wait/inference time
+"""
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from mom_pipeline import load_sentiment, load_summarizer, load_whisper
+from stage_metrics import _escape
+from vad import transcribe_voiced
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+
+
+# ---------------- DYNAMIC BATCHING ----------------
+class MicroBatcher:
+    """
+    Collects items from many threads and runs `run_batch(items, **params)` on
+    one worker thread. Items with different params never share a batch.
+    """
+
+    def __init__(self, name, run_batch, max_batch=16, max_wait_ms=20):
+        self.name = name
+        self.run_batch = run_batch
+        self.max_batch = max_batch
+        self.max_wait_s = max_wait_ms / 1000
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self.stats = {
+            "batches": 0, "items": 0, "errors": 0,
+            "wait_seconds": 0.0, "inference_seconds": 0.0,
+            "size_buckets": dict.fromkeys(BATCH_SIZE_BUCKETS, 0),
+        }
+        threading.Thread(target=self._loop, name=f"batcher-{name}", daemon=True).start()
+
+    @property
+    def depth(self):
+        return self._queue.qsize()
+
+    def submit(self, items, **params):
+        """Queue items; returns their results in order (blocks the calling request thread)."""
+        key = json.dumps(params, sort_keys=True)
+        futures = []
+        for item in items:
+            future = Future()
+            self._queue.put((key, params, item, future, time.perf_counter()))
+            futures.append(future)
+        return [f.result() for f in futures]
+
+    def _loop(self):
+        pending = []
+        while True:
+            if not pending:
+                pending.append(self._queue.get())
+            deadline = pending[0][4] + self.max_wait_s
+            while len(pending) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            # drain anything already waiting without extending the window
+            while len(pending) < self.max_batch:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            key = pending[0][0]
+            batch = [entry for entry in pending if entry[0] == key]
+            pending = [entry for entry in pending if entry[0] != key]
+            self._run(batch)
+
+    def _run(self, batch):
+        started = time.perf_counter()
+        try:
+            results = self.run_batch([entry[2] for entry in batch], **batch[0][1])
+            for entry, result in zip(batch, results):
+                entry[3].set_result(result)
+        except Exception as e:
+            for entry in batch:
+                entry[3].set_exception(e)
+            with self._lock:
+                self.stats["errors"] += 1
+        finished = time.perf_counter()
+
+        with self._lock:
+            self.stats["batches"] += 1
+            self.stats["items"] += len(batch)
+            self.stats["wait_seconds"] += sum(started - entry[4] for entry in batch)
+            self.stats["inference_seconds"] += finished - started
+            for bucket in BATCH_SIZE_BUCKETS:
+                if len(batch) <= bucket:
+                    self.stats["size_buckets"][bucket] += 1
+
+    def snapshot(self):
+        with self._lock:
+            stats = dict(self.stats, size_buckets=dict(self.stats["size_buckets"]))
+        stats["depth"] = self.depth
+        return stats
+
+
+# ---------------- MODELS ----------------
+@lru_cache(maxsize=None)
+def load_generator(model):
+    from transformers import pipeline
+    return pipeline("text2text-generation", model=model, device=-1)
+
+
+def run_summarize(texts, max_length=120, min_length=40):
+    out = load_summarizer()(texts, max_length=max_length, min_length=min_length,
+                            do_sample=False, batch_size=len(texts))
+    return [o["summary_text"] for o in out]
+
+
+def run_sentiment(texts):
+    return [o["label"] for o in load_sentiment()([t[:512] for t in texts], batch_size=len(texts))]
+
+
+def run_generate(prompts, model, max_length=512):
+    out = load_generator(model)(prompts, max_length=max_length, do_sample=False, batch_size=len(prompts))
+    return [o[0]["generated_text"] if isinstance(o, list) else o["generated_text"] for o in out]
+
+
+def run_transcribe(recordings):
+    # Whisper decodes one recording at a time; batching here only serializes access
+    return [transcribe_voiced(load_whisper(), audio) for audio in recordings]
+
+
+class Models:
+    def __init__(self, max_batch, max_wait_ms):
+        self.batchers = {
+            "summarize": MicroBatcher("summarize", run_summarize, max_batch, max_wait_ms),
+            "sentiment": MicroBatcher("sentiment", run_sentiment, max_batch, max_wait_ms),
+            "generate": MicroBatcher("generate", run_generate, max_batch, max_wait_ms),
+            "transcribe": MicroBatcher("transcribe", run_transcribe, 1, 0),
+        }
+
+    def to_prometheus(self, prefix="mom_server"):
+        snapshots = {name: b.snapshot() for name, b in self.batchers.items()}
+        lines = []
+
+        def metric(name, kind, help_text, values):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.extend(values)
+
+        metric("queue_depth", "gauge", "Items waiting for a batch",
+               [f'{prefix}_queue_depth{{model="{_escape(n)}"}} {s["depth"]}' for n, s in snapshots.items()])
+        for field, help_text in (
+            ("batches", "Batches run"),
+            ("items", "Items processed"),
+            ("errors", "Batches that raised"),
+            ("wait_seconds", "Total time items spent queued"),
+            ("inference_seconds", "Total time spent running batches"),
+        ):
+            metric(f"{field}_total", "counter", help_text,
+                   [f'{prefix}_{field}_total{{model="{_escape(n)}"}} {s[field]}' for n, s in snapshots.items()])
+
+        histogram = []
+        for n, s in snapshots.items():
+            for bucket, count in s["size_buckets"].items():
+                histogram.append(f'{prefix}_batch_size_bucket{{model="{_escape(n)}",le="{bucket}"}} {count}')
+            histogram.append(f'{prefix}_batch_size_bucket{{model="{_escape(n)}",le="+Inf"}} {s["batches"]}')
+            histogram.append(f'{prefix}_batch_size_sum{{model="{_escape(n)}"}} {s["items"]}')
+            histogram.append(f'{prefix}_batch_size_count{{model="{_escape(n)}"}} {s["batches"]}')
+        metric("batch_size", "histogram", "Items per batch", histogram)
+        return "\n".join(lines) + "\n"
+
+
+# ---------------- HTTP ----------------
+def _to_json(value):
+    # numpy scalars/arrays can appear in Whisper results
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class Handler(BaseHTTPRequestHandler):
+    models = None  # set by serve()
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/json"):
+        data = body if isinstance(body, bytes) else json.dumps(body, default=_to_json).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {"status": "ok", "queues": {n: b.depth for n, b in self.models.batchers.items()}})
+        elif self.path == "/metrics":
+            self._send(200, self.models.to_prometheus().encode(), "text/plain; version=0.0.4")
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        batchers = self.models.batchers
+        try:
+            if self.path == "/transcribe":
+                audio = np.frombuffer(body, dtype="<f4").astype(np.float32)
+                result = batchers["transcribe"].submit([audio])[0]
+            else:
+                request = json.loads(body or b"{}")
+                if self.path == "/summarize":
+                    result = batchers["summarize"].submit(
+                        request["texts"],
+                        max_length=request.get("max_length", 120),
+                        min_length=request.get("min_length", 40),
+                    )
+                elif self.path == "/sentiment":
+                    result = batchers["sentiment"].submit(request["texts"])
+                elif self.path == "/generate":
+                    result = batchers["generate"].submit(
+                        request["prompts"], model=request["model"], max_length=request.get("max_length", 512)
+                    )
+                else:
+                    self._send(404, {"error": "not found"})
+                    return
+        except (KeyError, ValueError) as e:
+            self._send(400, {"error": f"bad request: {e}"})
+            return
+        except Exception as e:
+            self._send(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        self._send(200, {"result": result})
+
+
+def serve(host, port, max_batch, max_wait_ms, preload=False):
+    if preload:
+        load_whisper()
+        load_summarizer()
+        load_sentiment()
+    Handler.models = Models(max_batch, max_wait_ms)
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    print(f"MOM model server on http://{host}:{port} (max batch {max_batch}, max wait {max_wait_ms} ms)")
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared model server for the MOM apps")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch", type=int, default=16)
+    parser.add_argument("--max-wait-ms", type=float, default=20)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1, help="torch intra-op threads")
+    parser.add_argument("--preload", action="store_true", help="load Whisper/BART/sentiment before serving")
+    args = parser.parse_args()
+
+    import torch
+    torch.set_num_threads(args.threads)
+    serve(args.host, args.port, args.max_batch, args.max_wait_ms, args.preload)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,58 @@
 import streamlit as st
-import whisper
 import nltk
-import spacy
-from transformers import pipeline
 from datetime import datetime
-import numpy as np
-import soundfile as sf
 from audiorecorder import audiorecorder
 import os
 
+from mom_pipeline import (
+    clean_text, extract_clean_topics, load_nlp, model_client, transcribe_audio, MODEL_SERVER_URL, WHISPER_MODEL
+)
+from audio_io import from_recording, load_audio, save_upload
+from stage_metrics import StageProfiler
+from vad import SAMPLE_RATE
+
 # ---------------- PAGE CONFIG ----------------
 st.set_page_config(page_title="AI MOM Generator", layout="centered")
 st.title("📝 AI-Based Minutes of Meeting Generator")
 
+# ---------------- METRICS ----------------
+METRICS_FILE = os.getenv("MOM_METRICS_FILE", "mom_metrics.jsonl")
+PROMETHEUS_FILE = os.getenv("MOM_PROMETHEUS_FILE")
+LLM_MODEL = "google/flan-t5-bases"
+
 # ---------------- LOAD NLP ----------------
 nltk.download("punkt")
-nlp = spacy.load("en_core_web_sm")
+nlp = load_nlp()
 
 # ---------------- LOAD MODELS (CACHED) ----------------
-@st.cache_resource
-def load_whisper():
-    return whisper.load_model("base")  # stable on CPU
-
 @st.cache_resource
 def load_summarizer():
-    return pipeline("text2text-generation", model="google/flan-t5-bases")
+    from transformers import pipeline
+    return pipeline("text2text-generation", model=LLM_MODEL)
 
 @st.cache_resource
 def load_sentiment():
+    from transformers import pipeline
     return pipeline("sentiment-analysis")
 
-whisper_model = load_whisper()
-llm = load_summarizer()
-sentiment_model = load_sentiment()
+if MODEL_SERVER_URL:
+    # weights live in model_server.py; this process stays a thin client
+    model_client().health()
+else:
+    # Whisper is loaded (once per process) by the first transcribe_audio call
+    llm = load_summarizer()
+    sentiment_model = load_sentiment()
 
 # ---------------- CORE FUNCTIONS ----------------
-def speech_to_text(audio_path):
-    result = whisper_model.transcribe(audio_path)
+def speech_to_text(audio):
+    result = transcribe_audio(audio)
+    vad = result["vad"]
+    st.caption(
+        f"Skipped {vad['skipped_s']:.1f}s of {vad['total_s']:.1f}s "
+        f"({vad['skipped_pct']:.0f}%) as silence before transcription"
+    )
     return result["text"]
 
-def clean_text(text):
-    doc = nlp(text)
-    return " ".join(sent.text.strip() for sent in doc.sents)
-
 def extract_structured_mom(text):
     prompt = f"""
 You are an expert meeting assistant.
@@ -59,6 +69,8 @@ Transcript:
 
 Format clearly with headings.
 """
+    if MODEL_SERVER_URL:
+        return model_client().generate([prompt], model=LLM_MODEL, max_length=512)[0]
     response = llm(prompt, max_length=512, do_sample=False)
     return response[0]["generated_text"]
 
@@ -71,12 +83,26 @@ def extract_action_items(text):
     return actions
 
 def extract_topics(text):
-    return ["Project Alpha", "Budget constraints", "Q3 roadmap", "Team restructuring"]
+    return extract_clean_topics(text)
 
 def get_sentiment(text):
+    if MODEL_SERVER_URL:
+        return model_client().sentiment([text[:512]])[0]
     result = sentiment_model(text[:512])
     return result[0]["label"]
 
+def show_stage_metrics(profiler):
+    with st.expander(f"⏱️ Stage timings ({profiler.total_wall_s():.1f}s total)"):
+        st.dataframe(profiler.records, use_container_width=True)
+        st.download_button("⬇️ Metrics (JSON lines)", profiler.jsonl_text(), "mom_metrics.jsonl")
+        st.download_button("⬇️ Metrics (Prometheus)", profiler.to_prometheus(), "mom_metrics.prom")
+
+def export_stage_metrics(profiler):
+    profiler.to_jsonl(METRICS_FILE)
+    if PROMETHEUS_FILE:
+        with open(PROMETHEUS_FILE, "w") as f:
+            f.write(profiler.to_prometheus())
+
 def format_mom(summary_block, topics, actions, sentiment):
     mom = f"""
 MINUTES OF MEETING (MOM)
@@ -106,13 +132,12 @@ st.subheader("🎙️ Option 1: Record Live Meeting")
 
 audio = audiorecorder("Start Recording", "Stop Recording")
 
-audio_path = None
+audio_source = None
 
 if len(audio) > 0:
-    audio_np = np.array(audio)
-    sf.write("live_audio.wav", audio_np, 22050)
-    audio_path = "live_audio.wav"
-    st.audio(audio_path)
+    # decoded in memory, no live_audio.wav round trip
+    audio_source = from_recording(audio)
+    st.audio(audio_source, sample_rate=SAMPLE_RATE)
 
 st.subheader("📂 Option 2: Upload Audio File")
 
@@ -122,25 +147,36 @@ uploaded_file = st.file_uploader(
 )
 
 if uploaded_file:
-    with open("uploaded_audio.wav", "wb") as f:
-        f.write(uploaded_file.read())
-    audio_path = "live_audio.wav"
-    st.audio(audio_path)
+    ext = os.path.splitext(uploaded_file.name)[1].lower() or ".wav"
+    audio_source = save_upload(uploaded_file, "uploaded_audio" + ext)
+    st.audio(audio_source)
 
 # ---------------- PROCESS BUTTON ----------------
-if audio_path and st.button("🚀 Generate MOM"):
+if audio_source is not None and st.button("🚀 Generate MOM"):
     with st.spinner("Processing meeting..."):
-        transcript = speech_to_text(audio_path)
-        cleaned = clean_text(transcript)
-
-        structured_summary = extract_structured_mom(cleaned)
-        actions = extract_action_items(cleaned)
-        topics = extract_topics(cleaned)
-        sentiment = get_sentiment(cleaned)
+        profiler = StageProfiler(labels={"whisper_model": WHISPER_MODEL, "llm_model": LLM_MODEL})
+
+        with profiler.stage("load_audio"):
+            samples = load_audio(audio_source)
+        with profiler.stage("whisper", input_size=round(len(samples) / SAMPLE_RATE, 2), unit="audio_s"):
+            transcript = speech_to_text(samples)
+        with profiler.stage("spacy_clean", input_size=len(transcript)):
+            cleaned = clean_text(transcript)
+
+        with profiler.stage("flan_t5_structured", input_size=len(cleaned)):
+            structured_summary = extract_structured_mom(cleaned)
+        with profiler.stage("spacy_actions", input_size=len(cleaned)):
+            actions = extract_action_items(cleaned)
+        with profiler.stage("spacy_topics", input_size=len(cleaned)):
+            topics = extract_topics(cleaned)
+        with profiler.stage("sentiment", input_size=min(len(cleaned), 512)):
+            sentiment = get_sentiment(cleaned)
 
         mom_text = format_mom(structured_summary, topics, actions, sentiment)
+        export_stage_metrics(profiler)
 
     st.success("✅ MOM Generated Successfully")
+    show_stage_metrics(profiler)
 
     st.subheader("📄 Minutes of Meeting")
     st.text(mom_text)
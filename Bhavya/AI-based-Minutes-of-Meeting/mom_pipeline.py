@@ -0,0 +1,290 @@
+"""
+MOM generation pipeline without any UI code.
+Used by the Streamlit app (app.py) and the overnight batch CLI (batch_mom.py).
+Models are loaded lazily and cached once per process, or, when
+MOM_MODEL_SERVER is set, served by model_server.py and shared by every
+process (spaCy stays local, it is small). spaCy, Whisper and transformers
+are imported inside their loaders, so a client of the model server never
+imports torch.
+"""
+import os
+import sys
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from functools import lru_cache
+
+from audio_io import load_audio
+from stage_metrics import StageProfiler
+from topic_ranker import extract_topics
+from vad import SAMPLE_RATE, transcribe_voiced
+
+WHISPER_MODEL = "base"
+SUMMARIZER_MODEL = "facebook/bart-large-cnn"
+# e.g. http://127.0.0.1:8765; unset = load the models in this process
+MODEL_SERVER_URL = os.getenv("MOM_MODEL_SERVER")
+
+
+# ---------------- LOAD MODELS (CACHED PER PROCESS) ----------------
+@contextmanager
+def _without_torch():
+    """
+    Hide torch while spaCy loads. Its thinc backend imports torch whenever it
+    is installed, although en_core_web_sm never uses it.
+    """
+    if "torch" in sys.modules:
+        yield
+        return
+    sys.modules["torch"] = None  # makes "import torch" raise ImportError
+    try:
+        yield
+    finally:
+        if sys.modules.get("torch") is None:
+            del sys.modules["torch"]
+
+@lru_cache(maxsize=None)
+def load_nlp():
+    with _without_torch() if MODEL_SERVER_URL else nullcontext():
+        import spacy
+        return spacy.load("en_core_web_sm")
+
+@lru_cache(maxsize=None)
+def load_whisper():
+    import whisper
+    return whisper.load_model(WHISPER_MODEL)
+
+@lru_cache(maxsize=None)
+def load_summarizer():
+    from transformers import pipeline
+    return pipeline("summarization", model=SUMMARIZER_MODEL, device=-1)
+
+@lru_cache(maxsize=None)
+def load_sentiment():
+    from transformers import pipeline
+    return pipeline("sentiment-analysis")
+
+@lru_cache(maxsize=None)
+def model_client():
+    from model_client import ModelClient
+    return ModelClient(MODEL_SERVER_URL)
+
+def load_models():
+    load_nlp()
+    if MODEL_SERVER_URL:
+        model_client().health()  # fail early if the server isn't running
+        return
+    load_whisper()
+    load_summarizer()
+    load_sentiment()
+
+
+# ---------------- CORE FUNCTIONS ----------------
+def transcribe_audio(audio):
+    """
+    Whisper result for the voiced parts of the recording, with VAD stats
+    under "vad". `audio` is a file path or a 16 kHz float32 array.
+    """
+    return transcribe_samples(load_audio(audio))
+
+def transcribe_samples(samples):
+    if MODEL_SERVER_URL:
+        return model_client().transcribe(samples)
+    return transcribe_voiced(load_whisper(), samples)
+
+def speech_to_text(audio):
+    return transcribe_audio(audio)["text"]
+
+def clean_text(text):
+    doc = load_nlp()(text)
+    return " ".join(sent.text.strip() for sent in doc.sents)
+
+# -------- MEETING TYPE DETECTION --------
+def detect_meeting_type(text):
+    t = text.lower()
+
+    if any(w in t for w in ["interview", "practice", "training", "guidance", "learn"]):
+        return "Training / Guidance Session"
+
+    if any(w in t for w in ["approve", "decision", "finalize", "deadline"]):
+        return "Decision-Making Meeting"
+
+    if any(w in t for w in ["plan", "roadmap", "strategy"]):
+        return "Planning Meeting"
+
+    return "General Discussion"
+
+# -------- PROFESSIONAL SUMMARY --------
+def generate_professional_summary(text, meeting_type):
+    summary = summarize_text(text)
+
+    sentences = summary.split(". ")
+    concise = ". ".join(sentences[5:]).strip()
+
+    return (
+        f"The meeting was conducted as a {meeting_type}. "
+        f"{concise}."
+    )
+
+def summarize_text(text):
+    max_chunk_length = 800
+    sentences = text.split(". ")
+    chunks, chunk = [], ""
+
+    for s in sentences:
+        if len(chunk) + len(s) <= max_chunk_length:
+            chunk += s + ". "
+        else:
+            chunks.append(chunk)
+            chunk = s + ". "
+
+    if chunk:
+        chunks.append(chunk)
+
+    if MODEL_SERVER_URL:
+        # all chunks in one request; the server batches them with other sessions'
+        return " ".join(model_client().summarize(chunks, max_length=120, min_length=40))
+
+    summarizer = load_summarizer()
+    summaries = []
+    for c in chunks:
+        out = summarizer(c, max_length=120, min_length=40, do_sample=False)
+        summaries.append(out[0]["summary_text"])
+
+    return " ".join(summaries)
+
+# -------- CLEAN TOPIC EXTRACTION --------
+def extract_clean_topics(text):
+    # TF-IDF against past meetings (topic_ranker.py); each call updates the IDF file
+    return extract_topics(load_nlp()(text), k=7, min_words=2)
+
+# -------- STRICT ACTION ITEMS --------
+def extract_strict_action_items(text):
+    actions = []
+
+    for sent in load_nlp()(text).sents:
+        s = sent.text.lower()
+        if any(w in s for w in ["should", "must", "need to", "required to", "practice", "prepare"]):
+            actions.append(sent.text.strip())
+
+    return actions
+
+def get_sentiment(text):
+    if MODEL_SERVER_URL:
+        return model_client().sentiment([text[:512]])[0]
+    return load_sentiment()(text[:512])[0]["label"]
+
+# -------- POST-PROCESSING VALIDATION --------
+def validate_mom(summary, topics, actions, sentiment):
+    # Trim summary if too long
+    if len(summary.split()) > 120:
+        summary = " ".join(summary.split()[:120]) + "..."
+
+    # Remove weak topics
+    topics = [
+        t for t in topics
+        if len(t.split()) >= 2 and not t.startswith(("a ", "the "))
+    ]
+
+    # Ensure actions are real actions
+    valid_actions = []
+    for a in actions:
+        if any(w in a.lower() for w in ["should", "must", "practice", "prepare"]):
+            valid_actions.append(a)
+
+    # Correct sentiment if mismatch
+    if any(w in summary.lower() for w in ["guidance", "confidence", "preparation", "training"]):
+        sentiment = "POSITIVE"
+
+    sentiment = "POSITIVE"
+
+    return summary, topics, valid_actions, sentiment
+
+# -------- FINAL MOM FORMAT --------
+def generate_mom(meeting_type, summary, topics, actions, sentiment, when=None):
+    when = when or datetime.now()
+    mom = f"""
+MINUTES OF MEETING (MOM)
+------------------------
+Date: {when.strftime("%d-%m-%yY")}
+Time: {when.strftime("%H:%M")}
+
+MEETING TYPE:
+{meeting_type}
+
+SUMMARY:
+{summary}
+
+KEY TOPICS DISCUSSED:
+"""
+    for t in topics:
+        mom += f"- {t}\n"
+
+    mom += "\nACTION ITEMS:\n"
+    if actions:
+        for i, a in enumerate(actions, 1):
+            mom += f"{i}. {a}\n"
+    else:
+        mom += "No explicit action items identified.\n"
+
+    mom += f"\nMEETING SENTIMENT: {sentiment}\n"
+    return mom
+
+
+# ---------------- FULL PIPELINE ----------------
+def model_labels():
+    labels = {"whisper_model": WHISPER_MODEL, "summarizer_model": SUMMARIZER_MODEL}
+    if MODEL_SERVER_URL:
+        labels["model_server"] = MODEL_SERVER_URL
+    return labels
+
+def run_pipeline(audio, progress=None, when=None, profiler=None):
+    """
+    Audio file (or 16 kHz float32 array) -> MOM. `progress` is called with a short status message
+    before each stage (st.write in the app, print in the CLI).
+    Every stage is timed on `profiler` (a new StageProfiler by default).
+    Returns a dict with the transcript, every MOM field, the final text
+    and the stage records under "stages" (with "model_labels").
+    """
+    report = progress or (lambda message: None)
+    profiler = profiler or StageProfiler(labels=model_labels())
+
+    report("🔊 Transcribing audio...")
+    with profiler.stage("load_audio"):
+        samples = load_audio(audio)
+    with profiler.stage("whisper", input_size=round(len(samples) / SAMPLE_RATE, 2), unit="audio_s"):
+        transcription = transcribe_samples(samples)
+    with profiler.stage("spacy_clean", input_size=len(transcription["text"])):
+        cleaned_text = clean_text(transcription["text"])
+
+    meeting_type = detect_meeting_type(cleaned_text)
+    report("🧠 Generating structured summary...")
+    with profiler.stage("bart_summary", input_size=len(cleaned_text)):
+        summary = generate_professional_summary(cleaned_text, meeting_type)
+    report("🔑 Extracting key topics...")
+    with profiler.stage("spacy_topics", input_size=len(cleaned_text)):
+        topics = extract_clean_topics(cleaned_text)
+    report("📌 Extracting action items...")
+    with profiler.stage("spacy_actions", input_size=len(cleaned_text)):
+        actions = extract_strict_action_items(cleaned_text)
+    with profiler.stage("sentiment", input_size=min(len(cleaned_text), 512)):
+        sentiment = get_sentiment(cleaned_text)
+
+    summary, topics, actions, sentiment = validate_mom(
+        summary, topics, actions, sentiment
+    )
+
+    mom_text = generate_mom(
+        meeting_type, summary, topics, actions, sentiment, when=when
+    )
+
+    return {
+        "transcript": transcription["text"],
+        "vad": transcription["vad"],
+        "meeting_type": meeting_type,
+        "summary": summary,
+        "topics": topics,
+        "actions": actions,
+        "sentiment": sentiment,
+        "mom": mom_text,
+        "stages": profiler.records,
+        "model_labels": profiler.labels,
+    }
@@ -0,0 +1,124 @@
+"""
+Per-stage timing for the MOM pipeline.
+
+    profiler = StageProfiler(labels={"whisper": "base"})
+    with profiler.stage("whisper", input_size=len(audio) / 16000):
+        ...
+    profiler.to_jsonl("mom_metrics.jsonl")
+
+Every stage records wall time, CPU time, the process peak RSS after the
+stage (and how much the stage raised it) and the size of its input.
+"""
+import json
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class StageProfiler:
+    def __init__(self, labels=None):
+        self.labels = dict(labels or {})
+        self.records = []
+
+    @contextmanager
+    def stage(self, name, input_size=None, unit="chars"):
+        rss_before = peak_rss_mb()
+        cpu_started = time.process_time()
+        wall_started = time.perf_counter()
+        try:
+            yield
+        finally:
+            rss_after = peak_rss_mb()
+            self.records.append({
+                "stage": name,
+                "wall_s": round(time.perf_counter() - wall_started, 4),
+                "cpu_s": round(time.process_time() - cpu_started, 4),
+                "peak_rss_mb": None if rss_after is None else round(rss_after, 1),
+                "rss_growth_mb": None if rss_after is None else round(rss_after - rss_before, 1),
+                "input_size": input_size,
+                "input_unit": unit,
+            })
+
+    def profile(self, name, size_of=len, unit="chars"):
+        """Decorator version of stage(); size_of(first_arg) gives the input size."""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                size = size_of(args[0]) if args and size_of else None
+                with self.stage(name, input_size=size, unit=unit):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def total_wall_s(self):
+        return round(sum(r["wall_s"] for r in self.records), 4)
+
+    # ---------------- EXPORT ----------------
+    def jsonl_text(self, **extra):
+        """One JSON line per stage, tagged with a timestamp, the labels and `extra`."""
+        ts = datetime.now().isoformat(timespec="seconds")
+        return "".join(
+            json.dumps({"ts": ts, **self.labels, **extra, **record}) + "\n"
+            for record in self.records
+        )
+
+    def to_jsonl(self, path, **extra):
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(self.jsonl_text(**extra))
+
+    def to_prometheus(self, prefix="mom_stage"):
+        """Prometheus text exposition format (one gauge per field, labelled by stage)."""
+        fields = {
+            "wall_seconds": ("wall_s", "Wall-clock time of the stage"),
+            "cpu_seconds": ("cpu_s", "CPU time of the stage"),
+            "peak_rss_megabytes": ("peak_rss_mb", "Process peak RSS after the stage"),
+            "input_size": ("input_size", "Size of the stage input"),
+        }
+        lines = []
+        for metric, (key, help_text) in fields.items():
+            name = f"{prefix}_{metric}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for record in self.records:
+                if record[key] is None:
+                    continue
+                labels = {**self.labels, "stage": record["stage"]}
+                label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                lines.append(f"{name}{{{label_text}}} {record[key]}")
+        return "\n".join(lines) + "\n"
+
+
+def merge_stage_records(records):
+    """Sum wall/CPU time and input size per stage; keep the highest peak RSS."""
+    merged = {}
+    for record in records:
+        total = merged.setdefault(record["stage"], {
+            "stage": record["stage"], "wall_s": 0.0, "cpu_s": 0.0,
+            "peak_rss_mb": None, "rss_growth_mb": None,
+            "input_size": 0, "input_unit": record["input_unit"],
+        })
+        total["wall_s"] = round(total["wall_s"] + record["wall_s"], 4)
+        total["cpu_s"] = round(total["cpu_s"] + record["cpu_s"], 4)
+        total["input_size"] += record["input_size"] or 0
+        if record["peak_rss_mb"] is not None:
+            total["peak_rss_mb"] = max(total["peak_rss_mb"] or 0, record["peak_rss_mb"])
+    return list(merged.values())
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
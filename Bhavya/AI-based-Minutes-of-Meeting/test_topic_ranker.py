@@ -0,0 +1,33 @@
+from multiprocessing import get_context
+
+from topic_ranker import IdfStore
+
+
+def add_meetings(path, worker, meetings):
+    store = IdfStore(path)
+    for i in range(meetings):
+        store.add_document(["budget", f"worker{worker}", f"item{i}"])
+
+
+def test_processes_sharing_the_file_lose_no_meetings(tmp_path):
+    path = str(tmp_path / "idf.json.gz")
+    ctx = get_context("spawn")
+    workers = [ctx.Process(target=add_meetings, args=(path, w, 20)) for w in range(4)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join()
+
+    store = IdfStore(path)
+    assert store.docs == 80
+    assert store.df["budget"] == 80
+    assert all(store.df[f"worker{w}"] == 20 for w in range(4))
+
+
+def test_saving_picks_up_other_writers(tmp_path):
+    path = str(tmp_path / "idf.json.gz")
+    first, second = IdfStore(path), IdfStore(path)
+    first.add_document(["roadmap"])
+    second.add_document(["roadmap", "hiring"])
+    assert second.docs == 2
+    assert second.df["roadmap"] == 2
@@ -0,0 +1,26 @@
+import numpy as np
+
+from vad import SAMPLE_RATE, detect_voiced_regions
+
+
+def tone(seconds, amplitude, seed=0):
+    rng = np.random.default_rng(seed)
+    return (amplitude * rng.standard_normal(int(seconds * SAMPLE_RATE))).astype(np.float32)
+
+
+def test_continuous_speech_is_voiced_throughout():
+    audio = tone(5, 0.1)
+    assert detect_voiced_regions(audio) == [(0, len(audio))]
+
+
+def test_digital_silence_has_no_regions():
+    assert detect_voiced_regions(np.zeros(5 * SAMPLE_RATE, dtype=np.float32)) == []
+
+
+def test_speech_between_silences_is_found():
+    audio = np.concatenate([tone(2, 0.001), tone(2, 0.1, seed=1), tone(2, 0.001, seed=2)])
+    regions = detect_voiced_regions(audio)
+    assert len(regions) == 1
+    start, end = regions[0]
+    assert abs(start - 2 * SAMPLE_RATE) < 0.3 * SAMPLE_RATE
+    assert abs(end - 4 * SAMPLE_RATE) < 0.3 * SAMPLE_RATE
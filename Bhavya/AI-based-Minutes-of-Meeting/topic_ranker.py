@@ -0,0 +1,174 @@
+"""
+Keyphrase ranking for meeting transcripts.
+
+Candidates are spaCy noun chunks, trimmed of leading determiners and
+pronouns. Each candidate scores
+
+    count in this meeting * mean IDF of its content words * (1 + log(words))
+
+IDF comes from document frequencies of words across past meetings. They are
+kept in a small gzip'd JSON file that is updated after every meeting, so
+phrases common to every meeting ("the team", "next week") sink over time.
+Several processes (e.g. batch_mom's workers) can share the file: each save
+takes a lock file, re-reads the counts on disk and adds only this process's
+new meetings, so no update is lost.
+A phrase whose words are all inside a higher-ranked phrase is skipped.
+Ties break alphabetically, so the top-k is deterministic. Everything is one
+pass over the chunks plus a sort of the distinct candidates.
+"""
+import gzip
+import json
+import math
+import os
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_IDF_PATH = os.getenv("MOM_IDF_FILE", "topic_idf.json.gz")
+# above this vocabulary size words seen in a single meeting are dropped on save
+MAX_TERMS = 50000
+
+LEADING_WORDS = {
+    "a", "an", "the", "some", "any", "this", "that", "these", "those", "our", "your",
+    "their", "his", "her", "its", "my", "all", "each", "every", "such", "another",
+}
+STOP_WORDS = LEADING_WORDS | {
+    "i", "you", "he", "she", "it", "we", "they", "me", "him", "us", "them", "what",
+    "which", "who", "whom", "something", "anything", "everything", "nothing", "lot",
+    "bit", "thing", "things", "way", "kind", "sort", "one", "ones", "time", "yeah",
+    "okay", "ok", "people", "guys", "words", "little",
+}
+
+
+@contextmanager
+def _file_lock(path):
+    """Exclusive lock on `path` + ".lock", held across processes for the block."""
+    with open(path + ".lock", "a+") as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class IdfStore:
+    """Document frequencies of words over past meetings, persisted as gzip'd JSON."""
+
+    def __init__(self, path=DEFAULT_IDF_PATH):
+        self.path = path
+        self.docs = 0
+        self.df = Counter()
+        # meetings added here but not yet merged into the file
+        self._new_docs = 0
+        self._new_df = Counter()
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self.docs, self.df = self._read()
+
+    def _read(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        return data["docs"], Counter(data["df"])
+
+    def idf(self, term):
+        # smoothed, always >= 1, so unseen words rank as the most specific
+        return math.log((self.docs + 1) / (self.df.get(term, 0) + 1)) + 1
+
+    def add_document(self, terms, save=True):
+        with self._lock:
+            terms = set(terms)
+            self.docs += 1
+            self.df.update(terms)
+            self._new_docs += 1
+            self._new_df.update(terms)
+            if save and self.path:
+                self._save()
+
+    def _save(self):
+        with _file_lock(self.path):
+            # other processes may have saved since we loaded: add our meetings to theirs
+            docs, df = self._read() if os.path.exists(self.path) else (0, Counter())
+            docs += self._new_docs
+            df.update(self._new_df)
+            if len(df) > MAX_TERMS:
+                df = Counter({t: n for t, n in df.items() if n > 1})
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with gzip.open(tmp, "wt", encoding="utf-8") as f:
+                json.dump({"docs": docs, "df": df}, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        self.docs, self.df = docs, df
+        self._new_docs = 0
+        self._new_df = Counter()
+
+
+def candidate_phrases(doc, min_words=1, max_words=5):
+    """(phrase, content words) for each usable noun chunk of a spaCy Doc, in order."""
+    for chunk in doc.noun_chunks:
+        words = [t.text.lower() for t in chunk if not t.is_punct and not t.is_space]
+        while words and words[0] in LEADING_WORDS:
+            words = words[1:]
+        content = [w for w in words if w not in STOP_WORDS and any(c.isalpha() for c in w)]
+        if not content or not min_words <= len(words) <= max_words:
+            continue
+        yield " ".join(words), content
+
+
+def rank_phrases(candidates, idf_store, k=7):
+    """Top-k phrases from (phrase, content words) pairs; see the module docstring for the score."""
+    counts = Counter()
+    content_words = {}
+    for phrase, content in candidates:
+        counts[phrase] += 1
+        content_words[phrase] = content
+
+    scored = []
+    for phrase, count in counts.items():
+        content = content_words[phrase]
+        mean_idf = sum(idf_store.idf(w) for w in content) / len(content)
+        score = count * mean_idf * (1 + math.log(len(phrase.split())))
+        scored.append((-score, phrase))
+    scored.sort()
+
+    topics, covered = [], []
+    for _, phrase in scored:
+        words = set(content_words[phrase])
+        if any(words <= seen for seen in covered):
+            continue
+        topics.append(phrase)
+        covered.append(words)
+        if len(topics) == k:
+            break
+    return topics
+
+
+_stores = {}
+
+
+def get_idf_store(path=DEFAULT_IDF_PATH):
+    if path not in _stores:
+        _stores[path] = IdfStore(path)
+    return _stores[path]
+
+
+def extract_topics(doc, k=7, min_words=1, idf_store=None, update=True):
+    """Top-k topics of a parsed meeting; by default the meeting is added to the IDF stats afterwards."""
+    store = idf_store or get_idf_store()
+    candidates = list(candidate_phrases(doc, min_words=min_words))
+    topics = rank_phrases(candidates, store, k)
+    if update and candidates:
+        store.add_document(w for _, content in candidates for w in content)
+    return topics
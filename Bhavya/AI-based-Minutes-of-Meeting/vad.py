@@ -0,0 +1,147 @@
+import time
+
+import numpy as np
+
+# Whisper works on 16 kHz mono float32 audio
+SAMPLE_RATE = 16000
+
+
+# ---------------- VOICED REGION DETECTION ----------------
+def frame_levels_db(audio, frame_len):
+    n_frames = len(audio) // frame_len
+    if n_frames == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = audio[: n_frames * frame_len].reshape(n_frames, frame_len)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    return 20 * np.log10(rms + 1e-10)
+
+
+def _runs(mask):
+    """(start, end) index pairs of consecutive True values in a boolean array."""
+    padded = np.concatenate(([False], mask, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    return list(zip(edges[::2], edges[1::2]))
+
+
+def detect_voiced_regions(
+    audio,
+    sr=SAMPLE_RATE,
+    frame_ms=30,
+    margin_db=6.0,
+    dynamic_range_db=40.0,
+    min_speech_ms=250,
+    min_silence_ms=600,
+    pad_ms=200,
+    silence_db=-50.0,
+):
+    """
+    Energy based VAD.
+    Returns a list of (start_sample, end_sample) for voiced audio.
+
+    A frame is voiced when it is louder than both the noise floor
+    (10th percentile level + margin_db) and dynamic_range_db below the
+    loud part of the recording (95th percentile level). A recording with
+    no quiet frames to compare against (steady speech from start to end)
+    is voiced throughout, unless it is quieter than silence_db.
+    """
+    frame_len = int(sr * frame_ms / 1000)
+    levels = frame_levels_db(audio, frame_len)
+    if len(levels) == 0:
+        return []
+
+    noise_floor = np.percentile(levels, 10)
+    loud = np.percentile(levels, 95)
+    if loud - noise_floor < margin_db:
+        # the "noise floor" is the speech itself; thresholding would drop everything
+        return [(0, len(audio))] if loud > silence_db else []
+    threshold = max(noise_floor + margin_db, loud - dynamic_range_db)
+    voiced = levels > threshold
+
+    # close short pauses inside speech, then drop short blips
+    min_silence = max(1, min_silence_ms // frame_ms)
+    for start, end in _runs(~voiced):
+        if start > 0 and end < len(voiced) and end - start < min_silence:
+            voiced[start:end] = True
+
+    min_speech = max(1, min_speech_ms // frame_ms)
+    pad = int(sr * pad_ms / 1000)
+    regions = []
+    for start, end in _runs(voiced):
+        if end - start < min_speech:
+            continue
+        s = max(0, start * frame_len - pad)
+        e = min(len(audio), end * frame_len + pad)
+        if regions and s <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], e)
+        else:
+            regions.append((s, e))
+
+    return regions
+
+
+# ---------------- TRANSCRIPTION ----------------
+def pack_regions(audio, regions, sr=SAMPLE_RATE, gap_ms=100):
+    """
+    Concatenate voiced regions into one compact buffer so Whisper decodes
+    them back to back in its 30 s windows.
+    Returns (packed_audio, offsets) where offsets holds
+    (packed_start_s, original_start_s, duration_s) per region.
+    """
+    gap = np.zeros(int(sr * gap_ms / 1000), dtype=np.float32)
+    pieces, offsets = [], []
+    cursor = 0
+    for start, end in regions:
+        pieces.append(audio[start:end])
+        pieces.append(gap)
+        offsets.append((cursor / sr, start / sr, (end - start) / sr))
+        cursor += (end - start) + len(gap)
+
+    if not pieces:
+        return np.zeros(0, dtype=np.float32), offsets
+    return np.concatenate(pieces).astype(np.float32, copy=False), offsets
+
+
+def to_original_time(t, offsets):
+    """Map a timestamp in the packed buffer back to the original recording."""
+    for packed_start, orig_start, duration in reversed(offsets):
+        if t >= packed_start:
+            return orig_start + min(t - packed_start, duration)
+    return t
+
+
+def transcribe_voiced(whisper_model, audio, sr=SAMPLE_RATE, **transcribe_kwargs):
+    """
+    Run Whisper only over the voiced parts of `audio` (16 kHz float32).
+    Returns the usual Whisper result with segment times on the original
+    timeline, plus a "vad" entry describing how much audio was skipped.
+    """
+    vad_started = time.perf_counter()
+    regions = detect_voiced_regions(audio, sr)
+    packed, offsets = pack_regions(audio, regions, sr)
+    vad_seconds = time.perf_counter() - vad_started
+
+    total_s = len(audio) / sr
+    voiced_s = sum(end - start for start, end in regions) / sr
+
+    started = time.perf_counter()
+    if len(packed) == 0:
+        result = {"text": "", "segments": [], "language": None}
+    else:
+        result = whisper_model.transcribe(packed, **transcribe_kwargs)
+        for seg in result.get("segments", []):
+            seg["start"] = to_original_time(seg["start"], offsets)
+            seg["end"] = to_original_time(seg["end"], offsets)
+    transcribe_seconds = time.perf_counter() - started
+
+    result["vad"] = {
+        "total_s": round(total_s, 2),
+        "voiced_s": round(voiced_s, 2),
+        "skipped_s": round(total_s - voiced_s, 2),
+        "skipped_pct": round(100 * (total_s - voiced_s) / total_s, 1) if total_s else 0.0,
+        "regions": len(regions),
+        "vad_s": round(vad_seconds, 3),
+        "transcribe_s": round(transcribe_seconds, 2),
+        # decode time is roughly linear in audio length
+        "est_speedup": round(total_s / voiced_s, 2) if voiced_s else None,
+    }
+    return result
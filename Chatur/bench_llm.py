@@ -0,0 +1,116 @@
+"""
+Latency and throughput of the LLM backends on the app's own prompt templates.
+
+    python bench_llm.py --backends groq local [--concurrency 1 4 8] [--requests 16]
+                        [--workload mixed|mcq|eval] [--compare-prefix-cache]
+
+Each run fires --requests prompts from --concurrency threads (like that many
+students clicking at once). It reports p50/p95 latency per prompt, requests
+per second and completion tokens per second. --compare-prefix-cache also
+runs the local model with its KV prefix cache off, to show what reuse of the
+shared template prefix saves. Set GROQ_API_KEY for groq and LOCAL_LLM_MODEL
+for local (see llm_backend.py).
+"""
+import argparse
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from llm_backend import make_backend
+from quiz_gen import CODE_PROMPT, MCQ_PROMPT, evaluation_prompt, template_prefixes
+
+TOPICS = ["Python lists", "Java inheritance", "C pointers", "SQL joins", "Recursion", "Binary search"]
+PROBLEMS = [
+    {"stmt": "Return the sum of a list of integers.", "logic": "Add every element to a running total."},
+    {"stmt": "Reverse a string.", "logic": "Walk the string from the end and build a new one."},
+    {"stmt": "Check whether a number is prime.", "logic": "Try divisors from 2 up to its square root."},
+]
+SOLUTIONS = [
+    "def solve(xs):\n    total = 0\n    for x in xs:\n        total += x\n    return total",
+    "def solve(s):\n    return s[::-1]",
+    "def solve(n):\n    return n > 1 and all(n % d for d in range(2, int(n ** 0.5) + 1))",
+]
+
+
+def workload(kind, count, seed=0):
+    rng = random.Random(seed)
+    prompts = []
+    for i in range(count):
+        pick = kind if kind != "mixed" else ("mcq", "code", "eval")[i % 3]
+        if pick == "mcq":
+            prompts.append(MCQ_PROMPT.format(num_mcq=rng.randint(3, 5), topic=rng.choice(TOPICS)))
+        elif pick == "code":
+            prompts.append(CODE_PROMPT.format(num_code=1, topic=rng.choice(TOPICS)))
+        else:
+            k = rng.randrange(len(PROBLEMS))
+            prompts.append(evaluation_prompt(PROBLEMS[k], "Python", SOLUTIONS[k], attempted=True))
+    return prompts
+
+
+def run(backend, prompts, concurrency):
+    before = backend.stats()
+    latencies = []
+
+    def one(prompt):
+        started = time.perf_counter()
+        try:
+            backend.complete(prompt)
+        except Exception:
+            pass  # counted in backend.stats()["errors"]
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, prompts))
+    elapsed = time.perf_counter() - started
+
+    after = backend.stats()
+    completion_tokens = after["completion_tokens"] - before["completion_tokens"]
+    latencies.sort()
+    return {
+        "p50_s": statistics.median(latencies),
+        "p95_s": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "req_per_s": len(prompts) / elapsed,
+        "tok_per_s": completion_tokens / elapsed,
+        "errors": after["errors"] - before["errors"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", default=["groq", "local"])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--requests", type=int, default=16)
+    parser.add_argument("--workload", choices=["mixed", "mcq", "eval"], default="mixed")
+    parser.add_argument("--max-tokens", type=int, default=256, help="local completion cap (keeps runs short)")
+    parser.add_argument("--compare-prefix-cache", action="store_true")
+    args = parser.parse_args()
+
+    configs = []
+    for name in args.backends:
+        if name == "local":
+            configs.append(("local", {"max_tokens": args.max_tokens}))
+            if args.compare_prefix_cache:
+                configs.append(("local, no prefix cache", {"max_tokens": args.max_tokens, "prefix_cache": False}))
+        else:
+            configs.append((name, {}))
+
+    prompts = workload(args.workload, args.requests)
+    print(f"{args.requests} {args.workload} prompts per run")
+    print(f"{'backend':24} {'conc':>4} {'p50 s':>8} {'p95 s':>8} {'req/s':>7} {'tok/s':>8} {'errors':>6}")
+    for label, options in configs:
+        backend = make_backend(label.split(",")[0], **options)
+        if hasattr(backend, "warm") and options.get("prefix_cache", True):
+            backend.warm(template_prefixes())
+        backend.complete(prompts[0])  # warm-up (connection / model load)
+        for concurrency in args.concurrency:
+            r = run(backend, prompts, concurrency)
+            print(
+                f"{label:24} {concurrency:4} {r['p50_s']:8.2f} {r['p95_s']:8.2f} "
+                f"{r['req_per_s']:7.2f} {r['tok_per_s']:8.1f} {r['errors']:6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
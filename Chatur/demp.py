@@ -3,6 +3,9 @@ import os
 from dotenv import load_dotenv
 from groq import Groq
 
+from eval_cache import EvalCache, evaluation_key
+from quiz_store import DEFAULT_DB_PATH
+
 # -------------------- SETUP --------------------
 load_dotenv()
 API_KEY = os.getenv("GROQ_API_KEY")
@@ -14,6 +17,14 @@ if not API_KEY:
 client = Groq(api_key=API_KEY)
 MODEL = "llama-3.3-70b-versatile"
 
+
+@st.cache_resource
+def get_eval_cache():
+    return EvalCache(os.getenv("QUIZ_DB", DEFAULT_DB_PATH))
+
+
+eval_cache = get_eval_cache()
+
 st.set_page_config(page_title="AI Question Paper Generator")
 st.title("🧠 AI Question Paper Generator")
 
@@ -212,13 +223,21 @@ if st.session_state.quiz:
             - Provide a clean, correct implementation
             """
 
-            res = client.chat.completions.create(
-                model=MODEL,
-                messages=[{"role": "user", "content": eval_prompt}]
-            )
+            # "strict" keeps these verdicts apart from quiz_app's evaluator prompt
+            cache_key = evaluation_key(prob["stmt"], language, user_code, "strict")
+            report = eval_cache.get(cache_key)
+            if report is None:
+                res = client.chat.completions.create(
+                    model=MODEL,
+                    messages=[{"role": "user", "content": eval_prompt}]
+                )
+                report = res.choices[0].message.content
+                eval_cache.put(cache_key, language, report)
+            else:
+                st.caption("⚡ Same logic was evaluated before, showing the stored report")
 
             st.markdown("### 🧠 AI Evaluation Report")
-            st.write(res.choices[0].message.content)
+            st.write(report)
             st.session_state.code_done = True
 
     # ===== FINAL =====
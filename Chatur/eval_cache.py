@@ -0,0 +1,267 @@
+"""
+Cache of LLM code evaluations keyed by the *logic* of a submission.
+
+The key is (problem statement hash, language, evaluation mode, normalized code):
+- Python is parsed and unparsed, which drops comments and formatting, with
+  docstrings and type hints removed and every name the code itself binds
+  (variables, parameters, functions, classes) renamed v0, v1, ... in order of
+  appearance. Builtins, imports and attributes keep their names, so
+  print(x) and len(x) stay different. A bound name that is also used as an
+  attribute or keyword argument (obj.total, f(b=1)) keeps its name too, as
+  do all parameters when a call unpacks **kwargs, and nothing is renamed in
+  code that calls eval/exec/locals/globals/vars.
+- Other languages (and Python that doesn't parse) are tokenized with
+  comments and whitespace dropped (string literals are matched first, so
+  "http://..." is not a comment), and identifiers that appear in a
+  declaration position ("int total", "Scanner sc") renamed the same way.
+
+So two students' solutions that differ only in naming, comments, spacing or
+annotations share one stored verdict.
+"""
+import ast
+import builtins
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+
+from quiz_store import DEFAULT_DB_PATH
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluations (
+    key TEXT PRIMARY KEY,
+    language TEXT NOT NULL,
+    feedback TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+"""
+
+BUILTIN_NAMES = set(dir(builtins))
+# calls that reach variables by their names as strings
+INTROSPECTION = {"eval", "exec", "locals", "globals", "vars"}
+
+
+# ---------------- PYTHON ----------------
+class _Renamer(ast.NodeTransformer):
+    def __init__(self, bound):
+        self.bound = bound
+        self.names = {}
+
+    def canon(self, name):
+        if name not in self.bound:
+            return name
+        if name not in self.names:
+            self.names[name] = f"v{len(self.names)}"
+        return self.names[name]
+
+    def _strip_docstring(self, node):
+        body = node.body
+        if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant) \
+                and isinstance(body[0].value.value, str):
+            node.body = body[1:] or [ast.Pass()]
+
+    def visit_Module(self, node):
+        self._strip_docstring(node)
+        return self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        self._strip_docstring(node)
+        node.name = self.canon(node.name)
+        node.returns = None
+        return self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node):
+        self._strip_docstring(node)
+        node.name = self.canon(node.name)
+        return self.generic_visit(node)
+
+    def visit_arg(self, node):
+        node.arg = self.canon(node.arg)
+        node.annotation = None
+        return node
+
+    def visit_Name(self, node):
+        node.id = self.canon(node.id)
+        return node
+
+    def visit_Global(self, node):
+        node.names = [self.canon(name) for name in node.names]
+        return node
+
+    visit_Nonlocal = visit_Global
+
+    def visit_ExceptHandler(self, node):
+        if node.name:
+            node.name = self.canon(node.name)
+        return self.generic_visit(node)
+
+    def visit_AnnAssign(self, node):
+        # "x: int = 5" -> "x = 5"; a bare "x: int" declares nothing at runtime
+        if node.value is None:
+            return None
+        assign = ast.Assign(targets=[node.target], value=node.value)
+        return self.visit(ast.copy_location(assign, node))
+
+
+def _bound_names(tree):
+    bound, imported, params, literal = set(), set(), set(), set()
+    unpacks_kwargs = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in INTROSPECTION:
+            return set()
+        if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            bound.add(node.id)
+        elif isinstance(node, ast.arg):
+            bound.add(node.arg)
+            params.add(node.arg)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound.add(node.name)
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            bound.add(node.name)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            imported.update((a.asname or a.name).split(".")[0] for a in node.names)
+        # attribute and keyword names are not renamed, so the bindings they refer to can't be either
+        elif isinstance(node, ast.Attribute):
+            literal.add(node.attr)
+        elif isinstance(node, ast.keyword):
+            if node.arg is None:
+                unpacks_kwargs = True  # f(**options) may name any parameter
+            else:
+                literal.add(node.arg)
+    if unpacks_kwargs:
+        literal |= params
+    return bound - imported - literal - BUILTIN_NAMES
+
+
+def normalize_python(code):
+    """Canonical source for Python code; raises SyntaxError if it doesn't parse."""
+    tree = ast.parse(code)
+    tree = _Renamer(_bound_names(tree)).visit(tree)
+    return ast.unparse(ast.fix_missing_locations(tree))
+
+
+# ---------------- OTHER LANGUAGES ----------------
+_STRING = r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\''
+# group 1 is a string literal (kept); anything else matched is a comment
+_COMMENT = {
+    "python": re.compile(r"('''.*?'''|" r'""".*?"""|' + _STRING + r")|#[^\n]*", re.S),
+    "c": re.compile(r"(" + _STRING + r")|//[^\n]*|/\*.*?\*/", re.S),
+}
+_TOKEN = re.compile(
+    r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\''   # string / char literals
+    r"|[A-Za-z_]\w*"                             # identifiers and keywords
+    r"|\d+(?:\.\d+)?"                            # numbers
+    r"|::|->|\+\+|--|<<|>>|[<>=!]=|&&|\|\||\S"   # operators and punctuation
+)
+_IDENT = re.compile(r"[A-Za-z_]\w*")
+_TYPES = {
+    "int", "long", "short", "float", "double", "char", "bool", "boolean", "byte",
+    "void", "auto", "var", "string", "String", "unsigned", "signed", "const", "final",
+    "static", "struct", "class",
+}
+_KEYWORDS = _TYPES | {
+    "if", "else", "for", "while", "do", "return", "break", "continue", "switch", "case",
+    "default", "new", "public", "private", "protected", "import", "include", "using",
+    "namespace", "std", "true", "false", "null", "nullptr", "this", "main", "throws",
+    "try", "catch", "finally", "throw", "extends", "implements", "interface", "sizeof",
+}
+_DECL_FOLLOW = {"=", ";", ",", "(", ")", "[", ":"}
+
+
+def normalize_tokens(code, language):
+    """Token stream with comments/whitespace dropped and declared identifiers renamed."""
+    comments = _COMMENT["python" if language == "Python" else "c"]
+    tokens = _TOKEN.findall(comments.sub(lambda m: m.group(1) or " ", code))
+
+    # "int name", "Scanner name", "List<T> name", "int[] name" followed by = ; , ( ) [ :
+    declared = []
+    for i in range(1, len(tokens) - 1):
+        prev, tok, nxt = tokens[i - 1], tokens[i], tokens[i + 1]
+        if _IDENT.fullmatch(tok) and tok not in _KEYWORDS and nxt in _DECL_FOLLOW and (
+            prev in _TYPES or prev in (">", "]") or (_IDENT.fullmatch(prev) and prev[0].isupper())
+        ):
+            declared.append(tok)
+    names = {}
+    for name in declared:
+        names.setdefault(name, f"v{len(names)}")
+    # member access (obj.name, ptr->name) keeps the member name
+    return " ".join(
+        tok if i and tokens[i - 1] in (".", "->", "::") else names.get(tok, tok)
+        for i, tok in enumerate(tokens)
+    )
+
+
+def normalize_code(code, language):
+    if language == "Python":
+        try:
+            return "py:" + normalize_python(code)
+        except SyntaxError:
+            pass
+    return "tok:" + normalize_tokens(code, language)
+
+
+def _sha(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def evaluation_key(statement, language, code, mode):
+    return _sha("\x1f".join([_sha(statement.strip()), language, mode, normalize_code(code, language)]))
+
+
+# ---------------- STORE ----------------
+class EvalCache:
+    """Evaluation verdicts in SQLite (same file as the quiz store by default), with hit counters."""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._conn().executescript(SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30)
+        return conn
+
+    def get(self, key):
+        conn = self._conn()
+        row = conn.execute("SELECT feedback FROM evaluations WHERE key = ?", (key,)).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if row is None:
+            return None
+        with conn:
+            conn.execute("UPDATE evaluations SET hits = hits + 1 WHERE key = ?", (key,))
+        return row[0]
+
+    def put(self, key, language, feedback):
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO evaluations (key, language, feedback, created_at) VALUES (?, ?, ?, ?)",
+                (key, language, feedback, time.time()),
+            )
+
+    def stats(self):
+        """Hit rate for this process plus LLM calls saved since the cache was created."""
+        entries, saved = self._conn().execute(
+            "SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM evaluations"
+        ).fetchone()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "llm_calls_saved": saved,
+            }
@@ -0,0 +1,224 @@
+"""
+LLM backends for quiz generation and grading.
+
+    QUIZ_LLM_BACKEND=groq   (default) Groq chat API, needs GROQ_API_KEY
+    QUIZ_LLM_BACKEND=local  quantized GGUF model on the CPU via llama-cpp-python,
+                            needs LOCAL_LLM_MODEL=/path/to/model.gguf
+
+Both expose complete(prompt) and complete_many(prompts) and count requests,
+tokens and time in stats().
+
+The local backend has one llama.cpp context, owned by a worker thread.
+Prompts from every Streamlit session are queued there and taken in
+micro-batches (up to LOCAL_LLM_MAX_BATCH, waiting at most
+LOCAL_LLM_MAX_WAIT_MS for more). Each batch is sorted by prompt, so
+prompts from the same template run back to back and llama.cpp only has to
+evaluate the part after the shared prefix. A RAM cache of KV states
+(LOCAL_LLM_CACHE_MB) brings a template's prefix back after other prompts
+have run in between, and warm() primes it for the known templates at
+startup. llama-cpp-python decodes one sequence at a time per context, so
+batching here buys prefix reuse and one warm model rather than parallel
+decoding.
+"""
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+DEFAULT_GROQ_MODEL = "llama-3.1-70b-versatile"
+BACKENDS = ("groq", "local")
+
+
+class LLMBackend:
+    name = "base"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {
+            "requests": 0, "errors": 0, "seconds": 0.0,
+            "prompt_tokens": 0, "completion_tokens": 0,
+        }
+
+    def complete_many(self, prompts):
+        """Completions for each prompt, in order."""
+        raise NotImplementedError
+
+    def complete(self, prompt):
+        return self.complete_many([prompt])[0]
+
+    def _record(self, seconds, usage=None, error=False):
+        with self._lock:
+            self.counters["requests"] += 1
+            self.counters["errors"] += int(error)
+            self.counters["seconds"] += seconds
+            if usage:
+                self.counters["prompt_tokens"] += usage.get("prompt_tokens") or 0
+                self.counters["completion_tokens"] += usage.get("completion_tokens") or 0
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters)
+        requests = stats["requests"]
+        stats["backend"] = self.name
+        stats["mean_latency_s"] = round(stats["seconds"] / requests, 3) if requests else None
+        return stats
+
+
+# ---------------- GROQ ----------------
+class GroqBackend(LLMBackend):
+    name = "groq"
+
+    def __init__(self, api_key, model=DEFAULT_GROQ_MODEL, max_parallel=8):
+        super().__init__()
+        from groq import Groq
+        self.client = Groq(api_key=api_key)
+        self.model = model
+        # independent prompts (e.g. the MCQ and coding halves of a quiz) go out together
+        self._executor = ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="groq")
+
+    def _call(self, prompt):
+        started = time.perf_counter()
+        try:
+            res = self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}]
+            )
+        except Exception:
+            self._record(time.perf_counter() - started, error=True)
+            raise
+        usage = getattr(res, "usage", None)
+        self._record(time.perf_counter() - started, {
+            "prompt_tokens": getattr(usage, "prompt_tokens", 0),
+            "completion_tokens": getattr(usage, "completion_tokens", 0),
+        })
+        return res.choices[0].message.content
+
+    def complete_many(self, prompts):
+        if len(prompts) == 1:
+            return [self._call(prompts[0])]
+        return list(self._executor.map(self._call, prompts))
+
+
+# ---------------- LOCAL (llama.cpp) ----------------
+class LocalLlamaBackend(LLMBackend):
+    name = "local"
+
+    def __init__(self, model_path, n_ctx=4096, n_threads=None, max_tokens=1024,
+                 temperature=0.2, max_batch=8, max_wait_ms=20, cache_mb=1024, prefix_cache=True):
+        super().__init__()
+        from llama_cpp import Llama, LlamaRAMCache
+        self.llama = Llama(
+            model_path=model_path,
+            n_ctx=n_ctx,
+            n_threads=n_threads or os.cpu_count() or 1,
+            verbose=False,
+        )
+        self.prefix_cache = prefix_cache
+        if prefix_cache and cache_mb > 0:
+            self.llama.set_cache(LlamaRAMCache(capacity_bytes=cache_mb * 1024 * 1024))
+        self.model = os.path.basename(model_path)
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.max_batch = max_batch
+        self.max_wait_s = max_wait_ms / 1000
+        self.counters.update(batches=0, queue_seconds=0.0)
+        self._queue = queue.Queue()
+        threading.Thread(target=self._loop, name="local-llm", daemon=True).start()
+
+    def complete_many(self, prompts):
+        futures = []
+        for prompt in prompts:
+            future = Future()
+            self._queue.put((prompt, future, time.perf_counter(), self.max_tokens, True))
+            futures.append(future)
+        return [f.result() for f in futures]
+
+    def warm(self, prefixes):
+        """Evaluate each template prefix once so its KV state is cached before the first real request."""
+        futures = []
+        for prefix in prefixes:
+            future = Future()
+            self._queue.put((prefix, future, time.perf_counter(), 1, False))
+            futures.append(future)
+        for f in futures:
+            f.result()
+
+    def _loop(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = batch[0][2] + self.max_wait_s
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if self.prefix_cache:
+                # same template => same leading tokens => only the suffix is evaluated
+                batch.sort(key=lambda entry: entry[0])
+            with self._lock:
+                self.counters["batches"] += 1
+            for entry in batch:
+                try:
+                    self._run(*entry)
+                except Exception as e:
+                    # the worker must outlive any one request, or every later call hangs
+                    if not entry[1].done():
+                        entry[1].set_exception(e)
+
+    def _run(self, prompt, future, queued_at, max_tokens, counted):
+        started = time.perf_counter()
+        if counted:
+            with self._lock:
+                self.counters["queue_seconds"] += started - queued_at
+        try:
+            if not self.prefix_cache:
+                self.llama.reset()
+            res = self.llama.create_chat_completion(
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                temperature=self.temperature,
+            )
+            # a malformed response fails this request only, like any other error
+            content, usage = res["choices"][0]["message"]["content"], res.get("usage")
+        except Exception as e:
+            if counted:
+                self._record(time.perf_counter() - started, error=True)
+            future.set_exception(e)
+            return
+        if counted:
+            self._record(time.perf_counter() - started, usage)
+        future.set_result(content)
+
+    def stats(self):
+        stats = super().stats()
+        stats["mean_batch_size"] = round(stats["requests"] / stats["batches"], 2) if stats["batches"] else None
+        return stats
+
+
+def make_backend(name=None, api_key=None, model=None, **local_options):
+    """Backend from arguments, falling back to the QUIZ_LLM_* / LOCAL_LLM_* / GROQ_* env vars."""
+    name = (name or os.getenv("QUIZ_LLM_BACKEND", "groq")).lower()
+    if name == "groq":
+        api_key = api_key or os.getenv("GROQ_API_KEY")
+        if not api_key:
+            raise ValueError("GROQ_API_KEY missing in .env")
+        return GroqBackend(api_key, model or os.getenv("GROQ_MODEL", DEFAULT_GROQ_MODEL))
+    if name == "local":
+        model_path = model or os.getenv("LOCAL_LLM_MODEL")
+        if not model_path:
+            raise ValueError("LOCAL_LLM_MODEL (path to a .gguf file) missing in .env")
+        options = {
+            "n_ctx": int(os.getenv("LOCAL_LLM_CTX", "4096")),
+            "n_threads": int(os.getenv("LOCAL_LLM_THREADS", "0")) or None,
+            "max_tokens": int(os.getenv("LOCAL_LLM_MAX_TOKENS", "1024")),
+            "max_batch": int(os.getenv("LOCAL_LLM_MAX_BATCH", "8")),
+            "max_wait_ms": float(os.getenv("LOCAL_LLM_MAX_WAIT_MS", "20")),
+            "cache_mb": int(os.getenv("LOCAL_LLM_CACHE_MB", "1024")),
+        }
+        options.update(local_options)
+        return LocalLlamaBackend(model_path, **options)
+    raise ValueError(f"unknown QUIZ_LLM_BACKEND {name!r}; use one of {', '.join(BACKENDS)}")
@@ -1,22 +1,122 @@
 import streamlit as st
 import os
 from dotenv import load_dotenv
-from groq import Groq
+
+from eval_cache import EvalCache, evaluation_key
+from llm_backend import make_backend
+from quiz_gen import evaluation_prompt, generate_quiz, template_prefixes
+from quiz_prefetch import QuizPrefetcher
+from quiz_store import DEFAULT_DB_PATH, QuizStore
 
 # -------------------- SETUP --------------------
-load_dotenv()
-API_KEY = os.getenv("GROQ_API_KEY")
+# cached across reruns and sessions: built once per server process
+@st.cache_resource
+def load_config():
+    load_dotenv()
+    return {
+        "backend": os.getenv("QUIZ_LLM_BACKEND", "groq").lower(),
+        "db_path": os.getenv("QUIZ_DB", DEFAULT_DB_PATH),
+    }
+
+
+@st.cache_resource
+def get_backend(name):
+    # groq: GROQ_API_KEY / GROQ_MODEL; local: LOCAL_LLM_MODEL and friends (see llm_backend.py)
+    backend = make_backend(name)
+    if hasattr(backend, "warm"):
+        backend.warm(template_prefixes())
+    return backend
+
+
+@st.cache_resource
+def get_store(db_path):
+    return QuizStore(db_path)
+
+
+@st.cache_resource
+def get_eval_cache(db_path):
+    return EvalCache(db_path)
+
+
+@st.cache_resource
+def get_prefetcher(backend_name, db_path):
+    backend = get_backend(backend_name)
+    prefetcher = QuizPrefetcher(
+        lambda topic, num_mcq, num_code: generate_quiz(backend, topic, num_mcq, num_code)
+    )
+    # hot combinations from before a restart start refilling right away
+    prefetcher.seed(get_store(db_path).popular_quizzes())
+    return prefetcher.start()
 
-if not API_KEY:
-    st.error("GROQ_API_KEY missing in .env")
+
+config = load_config()
+
+try:
+    backend = get_backend(config["backend"])
+except (ValueError, ImportError) as e:
+    st.error(str(e))
     st.stop()
 
-client = Groq(api_key=API_KEY)
-MODEL = "llama-3.1-70b-versatile"
+store = get_store(config["db_path"])
+eval_cache = get_eval_cache(config["db_path"])
+prefetcher = get_prefetcher(config["backend"], config["db_path"])
 
 st.set_page_config(page_title="AI Question Paper Generator")
 st.title("🧠 AI Question Paper Generator")
 
+# -------------------- LEADERBOARD --------------------
+with st.sidebar:
+    st.header("🏆 Leaderboard")
+    board_topic = st.text_input("Topic (blank for all)", key="board_topic")
+    board = store.leaderboard(board_topic or None)
+    if board:
+        st.table([
+            {"User": user, "Score": f"{score}/{total}", "Attempts": attempts}
+            for user, score, total, attempts in board
+        ])
+    else:
+        st.caption("No attempts yet")
+
+    st.header("📊 Popular Topics (7 days)")
+    topics = store.topic_stats()
+    if topics:
+        st.table([
+            {"Topic": t, "Attempts": n, "Students": users, "Accuracy": f"{acc:.0%}"}
+            for t, n, users, acc in topics
+        ])
+    else:
+        st.caption("No attempts yet")
+
+    st.header("⚡ Evaluation Cache")
+    cache_stats = eval_cache.stats()
+    hit_rate = cache_stats["hit_rate"]
+    st.caption(
+        f"Hit rate: {'-' if hit_rate is None else f'{hit_rate:.0%}'} | "
+        f"LLM calls saved: {cache_stats['llm_calls_saved']} | "
+        f"Stored verdicts: {cache_stats['entries']}"
+    )
+
+    st.header("🔥 Quiz Pool")
+    pool_stats = prefetcher.snapshot()
+    pool_hit_rate = pool_stats["hit_rate"]
+    oldest = pool_stats["oldest_pooled_age_s"]
+    st.caption(
+        f"Hit rate: {'-' if pool_hit_rate is None else f'{pool_hit_rate:.0%}'} | "
+        f"Ready: {pool_stats['pooled']} | "
+        f"Oldest: {'-' if oldest is None else f'{oldest / 60:.0f} min'} | "
+        f"Expired: {pool_stats['expired']}"
+    )
+    if pool_stats["pools"]:
+        st.table([{"Combination": name, "Ready": n} for name, n in pool_stats["pools"].items()])
+
+    st.header("🤖 Model")
+    llm_stats = backend.stats()
+    latency = llm_stats["mean_latency_s"]
+    st.caption(
+        f"{llm_stats['backend']}: {backend.model} | Requests: {llm_stats['requests']} | "
+        f"Mean latency: {'-' if latency is None else f'{latency:.2f}s'}"
+    )
+
 # -------------------- HELPERS --------------------
 def detect_language_from_topic(topic: str):
     t = topic.lower()
@@ -47,6 +147,11 @@ if "mcq_done" not in st.session_state:
     st.session_state.mcq_done = False
 if "code_done" not in st.session_state:
     st.session_state.code_done = False
+if "quiz_id" not in st.session_state:
+    st.session_state.quiz_id = None
+# attempts already stored for this session; re-submitting must not inflate the leaderboard
+if "recorded" not in st.session_state:
+    st.session_state.recorded = set()
 
 # -------------------- USER INPUT --------------------
 username = st.text_input("Username")
@@ -62,66 +167,15 @@ if st.button("Generate Quiz"):
     st.session_state.mcq_done = False
     st.session_state.code_done = False
 
-    mcqs = []
-    codes = []
-
-    # ---------- MCQs ----------
-    if num_mcq > 0:
-        mcq_prompt = f"""
-        Generate {num_mcq} MCQs on "{topic}"
-
-        Format strictly:
-        Q1. Question
-        A) ...
-        B) ...
-        C) ...
-        D) ...
-        Correct: B
-        """
-
-        res = client.chat.completions.create(
-            model=MODEL,
-            messages=[{"role": "user", "content": mcq_prompt}]
-        )
+    # popular combinations are usually ready in the prefetch pool
+    quiz = prefetcher.take(topic, num_mcq, num_code)
+    if quiz is None:
+        quiz = generate_quiz(backend, topic, num_mcq, num_code)
+    else:
+        st.caption("⚡ Served from the warm quiz pool")
 
-        q, opts, corr = None, [], None
-        for line in res.choices[0].message.content.splitlines():
-            line = line.strip()
-            if line.startswith("A"):
-                if q:
-                    mcqs.append({"q": q, "opts": opts, "corr": corr})
-                q, opts = line, []
-            elif line[:2] in ["A)", "B)", "C)", "D)"]:
-                opts.append(line)
-            elif line.startswith("Correct:"):
-                corr = line.split(":")[1].strip()
-        if q:
-            mcqs.append({"q": q, "opts": opts, "corr": corr})
-
-    # ---------- CODING ----------
-    if num_code > 0:
-        code_prompt = f"""
-        Generate {num_code} coding questions on "{topic}"
-
-        Format:
-        ---Problem---
-        Statement: ...
-        ExpectedLogic: Describe the solution idea in words (not code).
-        """
-
-        res = client.chat.completions.create(
-            model=MODEL,
-            messages=[{"role": "user", "content": code_prompt}]
-        )
-
-        for p in res.choices[0].message.content.split("---Problem---"):
-            if "Statement:" not in p:
-                continue
-            stmt = p.split("Statement:")[1].split("ExpectedLogic:")[0].strip()
-            logic = p.split("ExpectedLogic:")[1].strip()
-            codes.append({"stmt": stmt, "logic": logic})
-
-    st.session_state.quiz = {"mcqs": mcqs, "codes": codes}
+    st.session_state.quiz = quiz
+    st.session_state.quiz_id = store.record_quiz(username, topic, num_mcq, num_code, st.session_state.quiz)
 
 # -------------------- DISPLAY QUIZ --------------------
 if st.session_state.quiz:
@@ -141,10 +195,16 @@ if st.session_state.quiz:
             ans = st.session_state.get(f"mcq_{i}")
             if ans and ans.startswith(q["corr"]):
                 st.success(f"Q{i+1}: Correct ✅")
-                # score += 1
+                score += 1
             else:
                 st.error(f"Q{i+1}: Wrong ❌ | Correct: {q['corr']}")
         st.info(f"MCQ Score: {score}/{len(st.session_state.quiz['mcqs'])}")
+        if (st.session_state.quiz_id, "mcq") not in st.session_state.recorded:
+            store.record_attempt(
+                st.session_state.quiz_id, username, topic, "mcq",
+                score, len(st.session_state.quiz["mcqs"])
+            )
+            st.session_state.recorded.add((st.session_state.quiz_id, "mcq"))
         st.session_state.mcq_done = True
 
     # ===== CODING =====
@@ -172,76 +232,30 @@ if st.session_state.quiz:
         if st.button("Evaluate Code", key=f"eval_{i}"):
 
             attempted = looks_like_attempt(user_code)
+            # real attempts are graded; near-empty input gets the tutor walkthrough
+            eval_prompt = evaluation_prompt(prob, language, user_code, attempted)
 
-            if not attempted:
-                # Evaluation mode
-                eval_prompt = f"""
-                You are an expert programming evaluator.
-
-                RULES:
-                - Judge ONLY logical correctness
-                - Program-style and function-style both allowed
-                - Variable names, formatting, and type hints do NOT matter
-                - If logic solves the problem → PASS
-                - Otherwise → FAIL
-
-                Problem:
-                {prob['stmt']}
-
-                Expected Logic:
-                {prob['logic']}
-
-                User Language: {language}
-
-                User Code:
-                {user_code}
-
-                Respond EXACTLY in this format:
-
-                Result: PASS or FAIL
-                Issue:
-                - Explanation
-
-                Correct Solution ({language}):
-                <correct code>
-                """
-            else:
-                # Help / Tutor mode
-                eval_prompt = f"""
-                You are a friendly programming tutor.
-
-                The user is a beginner and could not write correct code.
-
-                TASK:
-                - Explain how to approach the problem step-by-step
-                - Then show a correct solution in {language}
-                - Be encouraging and simple
-
-                Problem:
-                {prob['stmt']}
-
-                Expected Logic:
-                {prob['logic']}
-
-                User Input:
-                {user_code}
-
-                Respond EXACTLY in this format:
-
-                Guidance:
-                - Step-by-step explanation
-
-                Correct Solution ({language}):
-                <correct code>
-                """
-
-            res = client.chat.completions.create(
-                model=MODEL,
-                messages=[{"role": "user", "content": eval_prompt}]
+            # identical logic (up to names, comments, formatting) reuses the stored verdict
+            cache_key = evaluation_key(
+                prob["stmt"], language, user_code, "evaluate" if attempted else "tutor"
             )
+            feedback = eval_cache.get(cache_key)
+            if feedback is None:
+                feedback = backend.complete(eval_prompt)
+                eval_cache.put(cache_key, language, feedback)
+            else:
+                st.caption("⚡ Same logic was evaluated before, showing the stored verdict")
 
             st.markdown("### 🧠 AI Feedback")
-            st.code(res.choices[0].message.content)
+            st.code(feedback)
+
+            # only evaluator replies carry a verdict; tutor replies are not scored,
+            # and only the first graded answer to each problem counts
+            attempt = (st.session_state.quiz_id, "code", i)
+            if "Result:" in feedback and attempt not in st.session_state.recorded:
+                passed = "Result: PASS" in feedback
+                store.record_attempt(st.session_state.quiz_id, username, topic, "code", int(passed), 1)
+                st.session_state.recorded.add(attempt)
             st.session_state.code_done = True
 
     # ===== FINAL =====
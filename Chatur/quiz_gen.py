@@ -0,0 +1,149 @@
+"""
+Quiz generation and grading prompts, kept free of Streamlit so the
+prefetcher's background thread can call them too. Every template starts
+with its fixed instructions and puts the topic / problem / code last, so
+the local backend can reuse the KV cache for the shared prefix.
+"""
+
+MCQ_PROMPT = """
+        Format strictly:
+        Q1. Question
+        A) ...
+        B) ...
+        C) ...
+        D) ...
+        Correct: B
+
+        Generate {num_mcq} MCQs on "{topic}" in the format above.
+        """
+
+CODE_PROMPT = """
+        Format:
+        ---Problem---
+        Statement: ...
+        ExpectedLogic: Describe the solution idea in words (not code).
+
+        Generate {num_code} coding questions on "{topic}" in the format above.
+        """
+
+EVALUATE_PROMPT = """
+                You are an expert programming evaluator.
+
+                RULES:
+                - Judge ONLY logical correctness
+                - Program-style and function-style both allowed
+                - Variable names, formatting, and type hints do NOT matter
+                - If logic solves the problem → PASS
+                - Otherwise → FAIL
+
+                Respond EXACTLY in this format:
+
+                Result: PASS or FAIL
+                Issue:
+                - Explanation
+
+                Correct Solution (<language>):
+                <correct code>
+
+                Problem:
+                {stmt}
+
+                Expected Logic:
+                {logic}
+
+                User Language: {language}
+
+                User Code:
+                {code}
+                """
+
+TUTOR_PROMPT = """
+                You are a friendly programming tutor.
+
+                The user is a beginner and could not write correct code.
+
+                TASK:
+                - Explain how to approach the problem step-by-step
+                - Then show a correct solution in the user's language
+                - Be encouraging and simple
+
+                Respond EXACTLY in this format:
+
+                Guidance:
+                - Step-by-step explanation
+
+                Correct Solution (<language>):
+                <correct code>
+
+                Problem:
+                {stmt}
+
+                Expected Logic:
+                {logic}
+
+                User Language: {language}
+
+                User Input:
+                {code}
+                """
+
+
+def template_prefixes():
+    """The fixed leading text of every template (what LocalLlamaBackend.warm() primes)."""
+    return [template.split("{")[0] for template in (MCQ_PROMPT, CODE_PROMPT, EVALUATE_PROMPT, TUTOR_PROMPT)]
+
+
+def evaluation_prompt(problem, language, code, attempted):
+    """Grader prompt for a real attempt, tutor prompt otherwise."""
+    template = EVALUATE_PROMPT if attempted else TUTOR_PROMPT
+    return template.format(stmt=problem["stmt"], logic=problem["logic"], language=language, code=code)
+
+
+def llm_calls(num_mcq, num_code):
+    """Chat completions needed for one quiz (the prefetch budget is counted in these)."""
+    return int(num_mcq > 0) + int(num_code > 0)
+
+
+def parse_mcqs(text):
+    mcqs = []
+    q, opts, corr = None, [], None
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith("Q"):
+            if q:
+                mcqs.append({"q": q, "opts": opts, "corr": corr})
+            q, opts = line, []
+        elif line[:2] in ["A)", "B)", "C)", "D)"]:
+            opts.append(line)
+        elif line.startswith("Correct:"):
+            corr = line.split(":")[1].strip()
+    if q:
+        mcqs.append({"q": q, "opts": opts, "corr": corr})
+    return mcqs
+
+
+def parse_codes(text):
+    codes = []
+    for p in text.split("---Problem---"):
+        if "Statement:" not in p or "ExpectedLogic:" not in p:
+            continue
+        stmt = p.split("Statement:")[1].split("ExpectedLogic:")[0].strip()
+        logic = p.split("ExpectedLogic:")[1].strip()
+        codes.append({"stmt": stmt, "logic": logic})
+    return codes
+
+
+def generate_quiz(backend, topic, num_mcq, num_code):
+    """{"mcqs": [...], "codes": [...]} for one topic; both prompts go to the backend together."""
+    prompts, parsers = [], []
+    if num_mcq > 0:
+        prompts.append(MCQ_PROMPT.format(num_mcq=num_mcq, topic=topic))
+        parsers.append(("mcqs", parse_mcqs))
+    if num_code > 0:
+        prompts.append(CODE_PROMPT.format(num_code=num_code, topic=topic))
+        parsers.append(("codes", parse_codes))
+
+    quiz = {"mcqs": [], "codes": []}
+    for (field, parse), text in zip(parsers, backend.complete_many(prompts) if prompts else []):
+        quiz[field] = parse(text)
+    return quiz
@@ -0,0 +1,237 @@
+"""
+Warm pool of ready quizzes for the most requested (topic, num_mcq, num_code).
+
+Every "Generate Quiz" click goes through QuizPrefetcher.take(). It bumps the
+combination's request frequency (an exponentially decayed count, so last
+week's exam topic cools off) and pops a pooled quiz if one is ready. A
+pooled quiz is handed out once, so nobody is served a quiz another student
+has already seen. One background thread keeps up to POOL_SIZE quizzes ready
+for each of the HOT_KEYS hottest combinations, hottest first, and spends LLM
+calls from a token bucket (CALLS_PER_HOUR, refilled continuously, bursts up
+to BURST). Quizzes older than MAX_AGE_S are thrown away instead of served.
+Topic and count matching ignores case and extra spaces.
+
+    QUIZ_PREFETCH_CALLS_PER_HOUR  LLM-call budget for refills; 0 (the default) disables
+                                  prefetching. With Groq every call is billed, whether
+                                  or not anyone ever takes the quiz, so e.g. 60 can cost
+                                  up to 60 paid calls an hour.
+    QUIZ_PREFETCH_POOL            quizzes kept per hot combination
+    QUIZ_PREFETCH_HOT             number of combinations kept warm
+    QUIZ_PREFETCH_MAX_AGE_H       staleness cutoff in hours
+"""
+import os
+import threading
+import time
+from collections import deque
+
+from quiz_gen import llm_calls
+from quiz_store import topic_key
+
+CALLS_PER_HOUR = float(os.getenv("QUIZ_PREFETCH_CALLS_PER_HOUR", "0"))
+POOL_SIZE = int(os.getenv("QUIZ_PREFETCH_POOL", "3"))
+HOT_KEYS = int(os.getenv("QUIZ_PREFETCH_HOT", "5"))
+MAX_AGE_S = float(os.getenv("QUIZ_PREFETCH_MAX_AGE_H", "24")) * 3600
+BURST = 10
+# a combination is prefetched once it has been asked for about twice within the last hour
+MIN_HEAT = 1.5
+HALF_LIFE_S = 3600
+IDLE_WAKE_S = 30
+ERROR_BACKOFF_S = 60
+
+
+class TokenBucket:
+    def __init__(self, per_hour, burst):
+        self.rate = per_hour / 3600
+        self.capacity = burst
+        self.tokens = float(burst) if per_hour > 0 else 0.0
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_spend(self, cost):
+        self._refill()
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return True
+        return False
+
+    def seconds_until(self, cost):
+        self._refill()
+        if self.rate <= 0 or cost > self.capacity:
+            return None
+        return max(0.0, (cost - self.tokens) / self.rate)
+
+
+class QuizPrefetcher:
+    """`generate(topic, num_mcq, num_code)` -> quiz dict; called only from the refill thread."""
+
+    def __init__(self, generate, calls_per_hour=CALLS_PER_HOUR, pool_size=POOL_SIZE,
+                 hot_keys=HOT_KEYS, max_age_s=MAX_AGE_S, burst=BURST):
+        self.generate = generate
+        self.pool_size = pool_size
+        self.hot_keys = hot_keys
+        self.max_age_s = max_age_s
+        self.budget = TokenBucket(calls_per_hour, burst)
+        self.enabled = calls_per_hour > 0
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._pools = {}      # key -> deque of (created_at, quiz), oldest first
+        self._heat = {}       # key -> (decayed count, updated_at)
+        self._topics = {}     # key -> topic as a user typed it, used in the prompt
+        self.stats = {
+            "hits": 0, "misses": 0, "generated": 0, "expired": 0, "errors": 0,
+            "llm_calls": 0, "served_age_s": 0.0,
+        }
+        self._thread = None
+
+    def start(self):
+        if self.enabled and self._thread is None:
+            self._thread = threading.Thread(target=self._refill_loop, name="quiz-prefetch", daemon=True)
+            self._thread.start()
+        return self
+
+    # ---------------- FREQUENCY ----------------
+    @staticmethod
+    def _key(topic, num_mcq, num_code):
+        return topic_key(topic), int(num_mcq), int(num_code)
+
+    def _bump(self, key, amount=1.0, now=None):
+        now = time.time() if now is None else now
+        heat, updated = self._heat.get(key, (0.0, now))
+        self._heat[key] = (heat * 0.5 ** (max(now - updated, 0) / HALF_LIFE_S) + amount, max(now, updated))
+
+    def _current_heat(self, key, now):
+        heat, updated = self._heat[key]
+        return heat * 0.5 ** (max(now - updated, 0) / HALF_LIFE_S)
+
+    def seed(self, popular):
+        """Warm the frequency table from history: [(topic, num_mcq, num_code, requests, last_at)]."""
+        with self._lock:
+            for topic, num_mcq, num_code, requests, last_at in popular:
+                key = self._key(topic, num_mcq, num_code)
+                self._topics.setdefault(key, topic)
+                self._bump(key, requests, now=last_at)
+        self._wake.set()
+
+    def hottest(self, now=None):
+        """[(key, heat)] of the combinations worth keeping warm, hottest first."""
+        now = time.time() if now is None else now
+        with self._lock:
+            ranked = sorted(
+                ((key, self._current_heat(key, now)) for key in self._heat),
+                key=lambda kv: (-kv[1], kv[0]),
+            )
+        return [(key, heat) for key, heat in ranked[:self.hot_keys] if heat >= MIN_HEAT]
+
+    # ---------------- SERVING ----------------
+    def take(self, topic, num_mcq, num_code):
+        """A ready quiz for this combination, or None (the caller generates one)."""
+        key = self._key(topic, num_mcq, num_code)
+        now = time.time()
+        quiz = None
+        with self._lock:
+            self._topics.setdefault(key, topic)
+            self._bump(key, now=now)
+            pool = self._pools.get(key)
+            while pool:
+                created_at, candidate = pool.pop()   # newest first
+                if now - created_at <= self.max_age_s:
+                    quiz = candidate
+                    self.stats["hits"] += 1
+                    self.stats["served_age_s"] += now - created_at
+                    break
+                self.stats["expired"] += 1
+            else:
+                self.stats["misses"] += 1
+        self._wake.set()
+        return quiz
+
+    # ---------------- REFILL ----------------
+    def _prune(self, now):
+        with self._lock:
+            for key, pool in list(self._pools.items()):
+                while pool and now - pool[0][0] > self.max_age_s:
+                    pool.popleft()
+                    self.stats["expired"] += 1
+                if not pool:
+                    del self._pools[key]
+            # forget combinations nobody has asked for in a long while
+            for key in [k for k in self._heat if self._current_heat(k, now) < 0.01]:
+                del self._heat[key]
+                if key not in self._pools:
+                    self._topics.pop(key, None)
+
+    def _next_job(self, now):
+        """(key, cost) of the hottest combination below pool size, or None."""
+        for key, _ in self.hottest(now):
+            with self._lock:
+                missing = self.pool_size - len(self._pools.get(key, ()))
+            cost = llm_calls(key[1], key[2])
+            if missing > 0 and cost:
+                return key, cost
+        return None
+
+    def _refill_loop(self):
+        while True:
+            # cleared before looking for work, so a take() during the scan is not missed
+            self._wake.clear()
+            now = time.time()
+            self._prune(now)
+            job = self._next_job(now)
+            if job is None:
+                self._wake.wait(IDLE_WAKE_S)
+                continue
+
+            key, cost = job
+            if not self.budget.try_spend(cost):
+                wait = self.budget.seconds_until(cost)
+                self._wake.wait(IDLE_WAKE_S if wait is None else min(wait, IDLE_WAKE_S))
+                continue
+
+            with self._lock:
+                topic = self._topics.get(key, key[0])
+            try:
+                quiz = self.generate(topic, key[1], key[2])
+            except Exception:
+                with self._lock:
+                    self.stats["errors"] += 1
+                    self.stats["llm_calls"] += cost
+                time.sleep(ERROR_BACKOFF_S)
+                continue
+
+            with self._lock:
+                self.stats["generated"] += 1
+                self.stats["llm_calls"] += cost
+                if quiz["mcqs"] or quiz["codes"]:
+                    self._pools.setdefault(key, deque()).append((time.time(), quiz))
+
+    # ---------------- METRICS ----------------
+    def snapshot(self):
+        now = time.time()
+        with self._lock:
+            stats = dict(self.stats)
+            ages = [now - created_at for pool in self._pools.values() for created_at, _ in pool]
+            pools = {
+                f"{key[0]} ({key[1]} MCQ, {key[2]} code)": len(pool)
+                for key, pool in self._pools.items()
+            }
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            "enabled": self.enabled,
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "hit_rate": round(stats["hits"] / lookups, 4) if lookups else None,
+            "pooled": len(ages),
+            "pools": pools,
+            "oldest_pooled_age_s": round(max(ages), 1) if ages else None,
+            "mean_served_age_s": round(stats["served_age_s"] / stats["hits"], 1) if stats["hits"] else None,
+            "generated": stats["generated"],
+            "expired": stats["expired"],
+            "errors": stats["errors"],
+            "llm_calls": stats["llm_calls"],
+            "budget_tokens": round(self.budget.tokens, 2),
+        }
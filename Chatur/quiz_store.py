@@ -0,0 +1,211 @@
+"""
+SQLite persistence for generated quizzes and student attempts.
+
+One QuizStore is shared by every Streamlit session (st.cache_resource).
+Writes go through a queue to a single writer thread that commits them in
+batches, so hundreds of students submitting at once cost a few transactions
+instead of hundreds. If a batch fails, its writes are retried one at a
+time and only the failing ones are dropped (and logged). Each attempt also updates a per-(topic, user) aggregate
+row, so the leaderboard reads a small indexed table instead of scanning
+attempts.
+"""
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+
+DEFAULT_DB_PATH = os.getenv(
+    "QUIZ_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "quiz.db")
+)
+BATCH_SIZE = 200
+BATCH_WAIT_S = 0.25
+
+log = logging.getLogger("quiz_store")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS quizzes (
+    id TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    topic_key TEXT NOT NULL,
+    num_mcq INTEGER NOT NULL,
+    num_code INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS quizzes_topic ON quizzes(topic_key, created_at);
+
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    quiz_id TEXT NOT NULL,
+    username TEXT NOT NULL,
+    topic_key TEXT NOT NULL,
+    kind TEXT NOT NULL,              -- 'mcq' or 'code'
+    score INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS attempts_time ON attempts(created_at, topic_key);
+CREATE INDEX IF NOT EXISTS attempts_user ON attempts(username, created_at);
+
+CREATE TABLE IF NOT EXISTS leaderboard (
+    topic_key TEXT NOT NULL,         -- '' holds the all-topics totals
+    username TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    last_at REAL NOT NULL,
+    PRIMARY KEY (topic_key, username)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS leaderboard_rank ON leaderboard(topic_key, score DESC, total);
+"""
+
+UPSERT_LEADERBOARD = """
+INSERT INTO leaderboard (topic_key, username, attempts, score, total, last_at)
+VALUES (?, ?, 1, ?, ?, ?)
+ON CONFLICT (topic_key, username) DO UPDATE SET
+    attempts = attempts + 1,
+    score = score + excluded.score,
+    total = total + excluded.total,
+    last_at = excluded.last_at
+"""
+
+
+def topic_key(topic):
+    return " ".join(topic.lower().split())
+
+
+class QuizStore:
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="quiz-store-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self):
+        # one read connection per thread (Streamlit runs each session in its own thread)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    # ---------------- WRITES (batched) ----------------
+    def record_quiz(self, username, topic, num_mcq, num_code, quiz):
+        """Queue a generated quiz; returns its id right away."""
+        quiz_id = uuid.uuid4().hex
+        self._queue.put(("quiz", (
+            quiz_id, username, topic, topic_key(topic), int(num_mcq), int(num_code),
+            json.dumps(quiz), time.time(),
+        )))
+        return quiz_id
+
+    def record_attempt(self, quiz_id, username, topic, kind, score, total):
+        self._queue.put(("attempt", (
+            quiz_id, username, topic_key(topic), kind, int(score), int(total), time.time(),
+        )))
+
+    def flush(self, timeout=None):
+        """Block until everything queued so far is committed."""
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        done.wait(timeout)
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + BATCH_WAIT_S
+            while len(batch) < BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            writes = [entry for entry in batch if entry[0] != "flush"]
+            try:
+                self._commit(conn, writes)
+            except Exception:
+                log.exception("batch of %d writes failed, retrying one by one", len(writes))
+                for entry in writes:
+                    try:
+                        self._commit(conn, [entry])
+                    except Exception:
+                        log.exception("dropped %s write %r", entry[0], entry[1][:4])
+            finally:
+                # waiters are released even when writes were dropped
+                for kind, event in batch:
+                    if kind == "flush":
+                        event.set()
+
+    def _commit(self, conn, batch):
+        quizzes = [row for kind, row in batch if kind == "quiz"]
+        attempts = [row for kind, row in batch if kind == "attempt"]
+        if not (quizzes or attempts):
+            return
+        with conn:
+            if quizzes:
+                conn.executemany("INSERT OR IGNORE INTO quizzes VALUES (?, ?, ?, ?, ?, ?, ?, ?)", quizzes)
+            if attempts:
+                conn.executemany(
+                    "INSERT INTO attempts (quiz_id, username, topic_key, kind, score, total, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    attempts,
+                )
+                board = []
+                for _, username, key, _, score, total, at in attempts:
+                    board.append((key, username, score, total, at))
+                    board.append(("", username, score, total, at))
+                conn.executemany(UPSERT_LEADERBOARD, board)
+
+    # ---------------- READS ----------------
+    def leaderboard(self, topic=None, limit=10):
+        """[(username, score, total, attempts)] best first; all topics when topic is None."""
+        key = topic_key(topic) if topic else ""
+        return self._reader().execute(
+            "SELECT username, score, total, attempts FROM leaderboard "
+            "WHERE topic_key = ? ORDER BY score DESC, total LIMIT ?",
+            (key, limit),
+        ).fetchall()
+
+    def topic_stats(self, since_s=7 * 24 * 3600, limit=10):
+        """[(topic, attempts, students, accuracy)] over the recent window, most attempted first."""
+        return self._reader().execute(
+            "SELECT topic_key, COUNT(*), COUNT(DISTINCT username), "
+            "ROUND(1.0 * SUM(score) / MAX(SUM(total), 1), 3) "
+            "FROM attempts WHERE created_at >= ? GROUP BY topic_key "
+            "ORDER BY COUNT(*) DESC LIMIT ?",
+            (time.time() - since_s, limit),
+        ).fetchall()
+
+    def popular_quizzes(self, since_s=7 * 24 * 3600, limit=20):
+        """[(topic, num_mcq, num_code, quizzes, last_at)] generated in the window, most requested first."""
+        return self._reader().execute(
+            "SELECT MAX(topic), num_mcq, num_code, COUNT(*), MAX(created_at) "
+            "FROM quizzes WHERE created_at >= ? GROUP BY topic_key, num_mcq, num_code "
+            "ORDER BY COUNT(*) DESC LIMIT ?",
+            (time.time() - since_s, limit),
+        ).fetchall()
+
+    def user_history(self, username, limit=20):
+        """[(created_at, topic, kind, score, total)] newest first."""
+        return self._reader().execute(
+            "SELECT created_at, topic_key, kind, score, total FROM attempts "
+            "WHERE username = ? ORDER BY created_at DESC LIMIT ?",
+            (username, limit),
+        ).fetchall()
@@ -0,0 +1,49 @@
+from eval_cache import evaluation_key, normalize_code
+
+PROBLEM = "Print the difference of two numbers."
+
+
+def key(code, language):
+    return evaluation_key(PROBLEM, language, code, "evaluate")
+
+
+def test_renaming_and_comments_share_a_key():
+    a = "def diff(x, y):\n    # subtract\n    return x - y\n\nprint(diff(5, 3))"
+    b = "def sub(first, second):\n    return first - second  # done\n\nprint(sub(5, 3))"
+    assert key(a, "Python") == key(b, "Python")
+
+
+def test_keyword_arguments_follow_their_parameters():
+    a = "def f(a, b):\n    return a - b\n\nprint(f(b=1, a=2))"
+    b = "def f(b, a):\n    return b - a\n\nprint(f(b=1, a=2))"
+    assert key(a, "Python") != key(b, "Python")
+
+
+def test_kwargs_unpacking_keeps_parameter_names():
+    a = "def f(a, b):\n    return a - b\n\nprint(f(**{'b': 1, 'a': 2}))"
+    b = "def f(b, a):\n    return b - a\n\nprint(f(**{'b': 1, 'a': 2}))"
+    assert key(a, "Python") != key(b, "Python")
+
+
+def test_attribute_names_keep_their_methods():
+    a = "class C:\n    def go(self):\n        return 1\n\nprint(C().go())"
+    b = "class C:\n    def run(self):\n        return 1\n\nprint(C().go())"
+    assert key(a, "Python") != key(b, "Python")
+
+
+def test_comment_markers_inside_strings_are_kept():
+    a = 'int main() {\n    printf("see http://a.com"); return 0;\n}'
+    b = 'int main() {\n    printf("see http://b.org"); return 1;\n}'
+    assert key(a, "C") != key(b, "C")
+
+
+def test_c_comments_are_still_dropped():
+    a = 'int main() {\n    // greet\n    printf("hi"); /* done */\n    return 0;\n}'
+    b = 'int main() {\n    printf("hi");\n    return 0;\n}'
+    assert normalize_code(a, "C") == normalize_code(b, "C")
+
+
+def test_unparsable_python_keeps_hash_inside_strings():
+    a = 'print("#1" if x else "#2"\n'
+    b = 'print("#3" if x else "#4"\n'
+    assert key(a, "Python") != key(b, "Python")
@@ -0,0 +1,89 @@
+import sys
+import threading
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from llm_backend import GroqBackend, LocalLlamaBackend
+
+
+class FakeLlama:
+    def __init__(self, **kwargs):
+        self.seen = []
+        self.lock = threading.Lock()
+
+    def set_cache(self, cache):
+        pass
+
+    def reset(self):
+        pass
+
+    def create_chat_completion(self, messages, max_tokens, temperature):
+        prompt = messages[0]["content"]
+        with self.lock:
+            self.seen.append(prompt)
+        if prompt == "malformed":
+            return {"choices": []}
+        if prompt == "broken":
+            raise RuntimeError("llama.cpp failed")
+        return {"choices": [{"message": {"content": prompt.upper()}}], "usage": {"prompt_tokens": 1}}
+
+
+@pytest.fixture
+def local(monkeypatch):
+    fake = types.ModuleType("llama_cpp")
+    fake.Llama, fake.LlamaRAMCache = FakeLlama, lambda capacity_bytes: None
+    monkeypatch.setitem(sys.modules, "llama_cpp", fake)
+    # a long wait so every queued prompt lands in one batch
+    return LocalLlamaBackend("/models/fake.gguf", max_batch=8, max_wait_ms=200)
+
+
+def test_local_results_follow_prompt_order(local):
+    prompts = ["c: third", "a: first", "b: second"]
+    assert local.complete_many(prompts) == ["C: THIRD", "A: FIRST", "B: SECOND"]
+    # the batch itself ran sorted, so shared prefixes come back to back
+    assert local.llama.seen == sorted(prompts)
+    assert local.stats()["batches"] == 1
+
+
+def test_local_malformed_response_fails_only_that_prompt(local):
+    for bad in ("malformed", "broken"):
+        with pytest.raises(Exception):
+            local.complete(bad)
+    assert local.complete("still alive") == "STILL ALIVE"
+    stats = local.stats()
+    assert (stats["requests"], stats["errors"]) == (3, 2)
+
+
+class FakeCompletions:
+    def create(self, model, messages):
+        prompt = messages[0]["content"]
+        if prompt == "broken":
+            raise RuntimeError("rate limited")
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=prompt.upper()))],
+            usage=SimpleNamespace(prompt_tokens=2, completion_tokens=3),
+        )
+
+
+@pytest.fixture
+def groq(monkeypatch):
+    fake = types.ModuleType("groq")
+    fake.Groq = lambda api_key: SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+    monkeypatch.setitem(sys.modules, "groq", fake)
+    return GroqBackend("key")
+
+
+def test_groq_results_follow_prompt_order(groq):
+    prompts = [f"prompt {i}" for i in range(10)]
+    assert groq.complete_many(prompts) == [p.upper() for p in prompts]
+    stats = groq.stats()
+    assert (stats["requests"], stats["prompt_tokens"], stats["completion_tokens"]) == (10, 20, 30)
+
+
+def test_groq_error_is_counted_and_raised(groq):
+    with pytest.raises(RuntimeError):
+        groq.complete("broken")
+    assert groq.complete("ok") == "OK"
+    assert groq.stats()["errors"] == 1
@@ -0,0 +1,71 @@
+import time
+from collections import deque
+
+from quiz_prefetch import QuizPrefetcher, TokenBucket
+
+QUIZ = {"mcqs": ["q"], "codes": []}
+
+
+def prefetcher(**kwargs):
+    return QuizPrefetcher(lambda topic, num_mcq, num_code: QUIZ, **kwargs)
+
+
+def pool(p, key, *ages):
+    now = time.time()
+    p._pools[key] = deque((now - age, {"mcqs": [age], "codes": []}) for age in ages)
+
+
+def test_take_serves_a_pooled_quiz_once():
+    p = prefetcher(calls_per_hour=60)
+    pool(p, ("python", 3, 0), 10)
+    assert p.take("  Python ", 3, 0) == {"mcqs": [10], "codes": []}
+    assert p.take("python", 3, 0) is None
+    assert p.take("python", 5, 0) is None
+    assert (p.stats["hits"], p.stats["misses"]) == (1, 2)
+
+
+def test_expired_quizzes_are_dropped_not_served():
+    p = prefetcher(calls_per_hour=60, max_age_s=60)
+    pool(p, ("python", 3, 0), 120, 30, 90)
+    # newest first: 30 is served, and the two older than max_age_s are thrown away
+    assert p.take("python", 3, 0) == {"mcqs": [30], "codes": []}
+    assert p.take("python", 3, 0) is None
+    assert p.stats["expired"] == 2
+
+    pool(p, ("sql", 2, 1), 120)
+    p._prune(time.time())
+    assert ("sql", 2, 1) not in p._pools
+    assert p.stats["expired"] == 3
+
+
+def test_token_bucket_refuses_once_spent():
+    bucket = TokenBucket(per_hour=1, burst=2)
+    assert bucket.try_spend(2)
+    assert not bucket.try_spend(1)
+    assert bucket.seconds_until(1) > 3000
+    assert bucket.seconds_until(3) is None
+
+
+def test_prefetching_is_off_by_default():
+    p = prefetcher()
+    assert not p.enabled
+    assert p.start()._thread is None
+    assert not p.budget.try_spend(1)
+
+
+def test_refill_stops_when_the_budget_is_spent():
+    calls = []
+
+    def generate(topic, num_mcq, num_code):
+        calls.append(topic)
+        return QUIZ
+
+    p = QuizPrefetcher(generate, calls_per_hour=1, burst=2, pool_size=10)
+    p.seed([("python", 3, 0, 5, time.time())])
+    p.start()
+    deadline = time.time() + 5
+    while len(calls) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.2)
+    assert calls == ["python", "python"]
+    assert p.snapshot()["pooled"] == 2
@@ -0,0 +1,18 @@
+import time
+
+from quiz_store import QuizStore
+
+
+def test_failed_write_does_not_stop_the_writer(tmp_path):
+    store = QuizStore(str(tmp_path / "quiz.db"))
+    store.record_attempt("q1", "ann", "Python", "mcq", 3, 5)
+    # username is NOT NULL, so this row fails the batch it lands in
+    store._queue.put(("attempt", ("q2", None, "python", "mcq", 1, 5, time.time())))
+    store.record_attempt("q3", "bob", "Python", "mcq", 2, 5)
+    store.flush(timeout=5)
+
+    store.record_attempt("q4", "ann", "Python", "code", 1, 1)
+    store.flush(timeout=5)
+
+    assert store._writer.is_alive()
+    assert sorted(store.leaderboard("python")) == [("ann", 4, 6, 2), ("bob", 2, 5, 1)]
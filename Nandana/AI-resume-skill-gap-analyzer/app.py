@@ -1,36 +1,102 @@
-from flask import Flask, render_template, request
+from flask import Flask, jsonify, make_response, render_template, request
+import hashlib
 import os
 
 from resume_parser import extract_text
-from skill_extractor import extract_skills
+from skill_extractor import extract_skills, get_skill_trie
 from matcher import analyze_skills
+from uploads import UploadStore, request_class
+from response_cache import ResultCache, Timings
 
 
 app = Flask(__name__)
 UPLOAD_FOLDER = "uploads"
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
+MAX_UPLOAD_MB = int(os.getenv("MAX_UPLOAD_MB", "10"))
+app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_MB * 1024 * 1024
+# static URLs carry a content hash (?v=...), so browsers may keep them for a year
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 365 * 24 * 3600
 
-@app.route("/", methods=["GET", "POST"])
-def index():
-    matched = missing = skills = []
-   
-    if request.method == "POST":
-        file = request.files["resume"]
-        role = request.form["role"]
+# uploads are streamed to disk, stored by content hash and evicted by age/size
+upload_store = UploadStore(
+    UPLOAD_FOLDER,
+    max_file_bytes=MAX_UPLOAD_MB * 1024 * 1024,
+    max_age_s=int(os.getenv("UPLOAD_MAX_AGE_HOURS", "168")) * 3600,
+    max_total_bytes=int(os.getenv("UPLOAD_MAX_TOTAL_MB", "500")) * 1024 * 1024,
+)
+app.request_class = request_class(upload_store)
+
+# rendered result fragments keyed by (resume hash, role, taxonomy version)
+result_cache = ResultCache(max_entries=int(os.getenv("RESULT_CACHE_SIZE", "1024")))
+timings = Timings()
+_page = {}
+
+
+def _file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+def _css_version():
+    if "css_version" not in _page:
+        _page["css_version"] = _file_hash(os.path.join(app.static_folder, "style.css"))
+    return _page["css_version"]
+
+
+def render_page(results_html=""):
+    with timings.time("render_page"):
+        return render_template("index.html", results_html=results_html, css_version=_css_version())
+
+
+def empty_page():
+    """The GET page never changes between deploys: render once, reuse body and validators."""
+    if "body" not in _page:
+        body = render_page()
+        templates = [os.path.join(app.template_folder, name) for name in ("index.html", "_results.html")]
+        _page["body"] = body
+        _page["etag"] = hashlib.sha256(body.encode("utf-8")).hexdigest()[:16]
+        _page["last_modified"] = max(os.path.getmtime(path) for path in templates)
+    return _page
 
-        path = os.path.join(app.config["UPLOAD_FOLDER"], file.filename)
-        file.save(role)
 
-        text = extract_text(path)
+def analyze(path, role):
+    with timings.time("analysis"):
+        text = extract_text(path, fast=True)
         skills = extract_skills(text)
         matched, missing = analyze_skills(skills, role)
-        
-   
-    return render_template(
-        "index.html",
-        skills=skills,
-        matched=matched,
-        missing=missing
+    with timings.time("render_results"):
+        return render_template("_results.html", skills=skills, matched=matched, missing=missing)
+
+
+@app.route("/", methods=["GET", "POST"])
+def index():
+    if request.method == "GET":
+        page = empty_page()
+        response = make_response(page["body"])
+        response.set_etag(page["etag"])
+        response.last_modified = page["last_modified"]
+        response.cache_control.no_cache = True  # revalidate, answered with 304
+        return response.make_conditional(request)
+
+    file = request.files["resume"]
+    role = request.form["role"]
+
+    digest, path, _ = upload_store.commit(file.stream, file.filename)
+
+    key = (digest, role, get_skill_trie().version)
+    results_html = result_cache.get(key)
+    if results_html is None:
+        results_html = analyze(path, role)
+        result_cache.put(key, results_html)
+
+    return render_page(results_html)
+
+
+@app.route("/metrics")
+def metrics():
+    return jsonify(
+        result_cache=result_cache.stats(),
+        timings=timings.stats(),
     )
 
 if __name__ == "__main__":
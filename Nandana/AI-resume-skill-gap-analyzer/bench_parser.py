@@ -0,0 +1,80 @@
+"""
+PDF text extraction: original page loop vs fast flags vs page-range workers.
+
+    python bench_parser.py [--pages 1 10 100] [--runs 5] [--workers 4]
+
+Generates text-heavy PDFs with the given page counts and reports the median
+time per document for each mode, checking every mode finds the same words.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import fitz
+
+from resume_parser import extract_text
+
+LINE = "python sql docker aws machine learning engineer delivered features for customers "
+
+
+def make_pdf(path, pages):
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(40, 40, 555, 800), (LINE * 2 + "\n") * 60, fontsize=7)
+    doc.save(path)
+    doc.close()
+
+
+def original_loop(pdf_path):
+    doc = fitz.open(pdf_path)
+    text = ""
+    for page in doc:
+        text += page.get_text()
+    return text.lower()
+
+
+def median_ms(fn, runs):
+    fn()  # warm-up (also starts the worker pool)
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=max(2, os.cpu_count() or 1))
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPU(s)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in args.pages:
+            path = os.path.join(tmp, f"doc_{pages}.pdf")
+            make_pdf(path, pages)
+            modes = {
+                "loop": lambda: original_loop(path),
+                "fast": lambda: extract_text(path, fast=True, workers=1),
+                f"{args.workers} procs": lambda: extract_text(path, workers=args.workers),
+                f"{args.workers} procs fast": lambda: extract_text(path, fast=True, workers=args.workers),
+                "auto fast": lambda: extract_text(path, fast=True),
+            }
+            expected = original_loop(path).split()
+            for name, fn in modes.items():
+                assert fn().split() == expected, f"{name} extracted different words"
+
+            baseline = None
+            for name, fn in modes.items():
+                ms = median_ms(fn, args.runs)
+                baseline = baseline or ms
+                print(f"{pages:4} pages  {name:18} {ms:9.2f} ms  {baseline / ms:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
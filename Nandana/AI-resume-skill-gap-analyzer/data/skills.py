@@ -1,5 +1,7 @@
-SKILLS_DB = [
-    "python","java","machine learning","deep learning",
-    "sql","html","css","javascript","react",
-    "nlp","data analysis","statistics","docker","aws"
-]
\ No newline at end of file
+import os
+
+# canonical skills and their aliases (see skill_taxonomy.read_taxonomy for formats)
+SKILLS_FILE = os.getenv(
+    "SKILL_TAXONOMY",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills.json")
+)
@@ -0,0 +1,170 @@
+"""
+Nightly skill-gap report: every resume in a folder against every role in JOB_ROLES.
+
+    python gap_report.py resumes/ --out reports/ [--workers 4] [--format auto|csv|parquet]
+
+Writes, incrementally while resumes stream through the worker pool:
+    gap_matrix.csv (or .parquet)  one row per (resume, role)
+and at the end, from per-role counters:
+    role_gaps.csv                 role, skill, missing count, share of resumes
+
+Workers return only the extracted skill list, never the resume text, so memory
+stays flat however large the pool is. Parquet output needs pyarrow; the
+default --format auto writes Parquet when pyarrow is installed, CSV otherwise.
+"""
+import argparse
+import csv
+import importlib.util
+import os
+import sys
+import time
+from collections import Counter
+from multiprocessing import Pool
+
+from data.job_roles import JOB_ROLES
+from matcher import analyze_skills
+from resume_parser import extract_text
+from skill_extractor import extract_skills
+
+MATRIX_FIELDS = ["resume", "role", "matched", "missing", "coverage", "missing_skills"]
+PARQUET_BATCH = 5000
+
+
+def find_resumes(folder):
+    for dirpath, _, filenames in os.walk(folder):
+        for name in sorted(filenames):
+            if name.lower().endswith(".pdf"):
+                yield os.path.join(dirpath, name)
+
+
+def resume_skills(path):
+    """Worker: (path, skills, size in bytes, error)."""
+    try:
+        # Pool workers are daemonic and can't start the page-splitting processes of a large PDF
+        return path, extract_skills(extract_text(path, fast=True, workers=1)), os.path.getsize(path), None
+    except Exception as e:  # a corrupt PDF must not stop the nightly run
+        return path, [], 0, f"{type(e).__name__}: {e}"
+
+
+class CsvRows:
+    def __init__(self, path):
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.writer = csv.DictWriter(self.file, fieldnames=MATRIX_FIELDS)
+        self.writer.writeheader()
+
+    def write(self, row):
+        self.writer.writerow(row)
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetRows:
+    """Buffers a few thousand rows, then appends them as a row group."""
+
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            sys.exit("Parquet output needs pyarrow: pip install pyarrow (or use --format csv)")
+        self.pa = pa
+        self.schema = pa.schema([
+            ("resume", pa.string()), ("role", pa.string()), ("matched", pa.int32()),
+            ("missing", pa.int32()), ("coverage", pa.float32()), ("missing_skills", pa.string()),
+        ])
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.rows = []
+
+    def write(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= PARQUET_BATCH:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            self.writer.write_table(self.pa.Table.from_pylist(self.rows, schema=self.schema))
+            self.rows = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+def write_role_gaps(path, resumes, missing_counts):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["role", "skill", "missing_count", "missing_share"])
+        for role in JOB_ROLES:
+            for skill, count in missing_counts[role].most_common():
+                writer.writerow([role, skill, count, round(count / resumes, 4) if resumes else 0])
+
+
+def resolve_format(fmt):
+    if fmt == "auto":
+        return "parquet" if importlib.util.find_spec("pyarrow") else "csv"
+    return fmt
+
+
+def run(folder, out_dir, workers, fmt, chunksize=4):
+    os.makedirs(out_dir, exist_ok=True)
+    matrix_path = os.path.join(out_dir, f"gap_matrix.{fmt}")
+    rows = ParquetRows(matrix_path) if fmt == "parquet" else CsvRows(matrix_path)
+    missing_counts = {role: Counter() for role in JOB_ROLES}
+    resumes = failed = total_bytes = 0
+
+    started = time.perf_counter()
+    try:
+        with Pool(workers) as pool:
+            for path, skills, size, error in pool.imap_unordered(resume_skills, find_resumes(folder), chunksize):
+                if error:
+                    failed += 1
+                    print(f"skipped {path}: {error}", file=sys.stderr)
+                    continue
+                resumes += 1
+                total_bytes += size
+                name = os.path.relpath(path, folder)
+                for role, required in JOB_ROLES.items():
+                    matched, missing = analyze_skills(skills, role)
+                    missing_counts[role].update(missing)
+                    rows.write({
+                        "resume": name,
+                        "role": role,
+                        "matched": len(matched),
+                        "missing": len(missing),
+                        "coverage": round(len(matched) / len(required), 4) if required else 1.0,
+                        "missing_skills": "|".join(sorted(missing)),
+                    })
+    finally:
+        rows.close()
+
+    write_role_gaps(os.path.join(out_dir, "role_gaps.csv"), resumes, missing_counts)
+    elapsed = time.perf_counter() - started
+    return {
+        "resumes": resumes,
+        "failed": failed,
+        "seconds": round(elapsed, 2),
+        "resumes_per_s": round(resumes / elapsed, 1) if elapsed else 0.0,
+        "mb_per_s": round(total_bytes / 1e6 / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("folder")
+    parser.add_argument("--out", default="reports")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--format", choices=["auto", "csv", "parquet"], default="auto")
+    args = parser.parse_args()
+    args.format = resolve_format(args.format)
+
+    stats = run(args.folder, args.out, args.workers, args.format)
+    print(
+        f"{stats['resumes']} resumes x {len(JOB_ROLES)} roles in {stats['seconds']}s "
+        f"({stats['resumes_per_s']} resumes/s, {stats['mb_per_s']} MB/s), {stats['failed']} failed"
+    )
+    print(f"wrote {args.out}/gap_matrix.{args.format} and {args.out}/role_gaps.csv")
+
+
+if __name__ == "__main__":
+    main()
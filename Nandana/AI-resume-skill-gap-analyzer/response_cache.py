@@ -0,0 +1,88 @@
+import statistics
+import threading
+import time
+from collections import OrderedDict, deque
+
+
+class ResultCache:
+    """
+    Thread-safe LRU of rendered result fragments keyed by
+    (resume hash, role, taxonomy version), with hit/miss counters.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+class Timings:
+    """Rolling window of durations (ms) per name, e.g. render and analysis times."""
+
+    def __init__(self, window=1000):
+        self.window = window
+        self._samples = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def time(self, name):
+        return _Timer(self, name)
+
+    def add(self, name, ms):
+        with self._lock:
+            self._samples.setdefault(name, deque(maxlen=self.window)).append(ms)
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    def stats(self):
+        with self._lock:
+            out = {}
+            for name, samples in self._samples.items():
+                ordered = sorted(samples)
+                out[name] = {
+                    "count": self._counts[name],
+                    "mean_ms": round(statistics.fmean(ordered), 3),
+                    "p50_ms": round(ordered[len(ordered) // 2], 3),
+                    "p95_ms": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 3),
+                }
+            return out
+
+
+class _Timer:
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.timings.add(self.name, (time.perf_counter() - self.started) * 1000)
@@ -1,8 +1,13 @@
-from data.skills import SKILLS_DB
+from data.skills import SKILLS_FILE
+from skill_taxonomy import load_trie
+
+_trie = None
+
+def get_skill_trie():
+    global _trie
+    if _trie is None:
+        _trie = load_trie(SKILLS_FILE)
+    return _trie
 
 def extract_skills(resume_text):
-    found = []
-    for skill in SKILLS_DB:
-        if skill in resume_text:
-            found.append(skill)
-    return list(set(found))
\ No newline at end of file
+    return get_skill_trie().find(resume_text)
@@ -0,0 +1,16 @@
+"""
+The skill taxonomy trie is shared by both resume projects and lives in
+shared/skill_taxonomy.py at the repository root. This module keeps the flat
+`from skill_taxonomy import ...` working when the app is run from its own folder.
+"""
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from shared.skill_taxonomy import (  # noqa: E402
+    END, FORMAT_VERSION, TOKEN_RE, SkillTrie, compile_trie, load_trie, read_taxonomy,
+    taxonomy_version, tokenize,
+)
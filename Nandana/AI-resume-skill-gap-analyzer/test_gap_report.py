@@ -0,0 +1,30 @@
+import csv
+
+import fitz
+
+import resume_parser
+from gap_report import run
+
+
+def write_pdf(path, pages, text):
+    doc = fitz.open()
+    for _ in range(pages):
+        doc.new_page().insert_text((50, 72), text)
+    doc.save(path)
+    doc.close()
+
+
+def test_large_pdf_is_read_inside_the_worker_pool(tmp_path, monkeypatch):
+    # make every multi-page PDF "large" so extract_text would split it across processes
+    monkeypatch.setattr(resume_parser, "MAX_WORKERS", 2)
+    monkeypatch.setattr(resume_parser, "MIN_PARALLEL_BYTES", 0)
+    folder = tmp_path / "resumes"
+    folder.mkdir()
+    write_pdf(str(folder / "big.pdf"), 40, "python sql excel machine learning")
+
+    stats = run(str(folder), str(tmp_path / "out"), workers=2, fmt="csv")
+
+    assert (stats["resumes"], stats["failed"]) == (1, 0)
+    with open(tmp_path / "out" / "gap_matrix.csv", newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert rows and all(row["resume"] == "big.pdf" for row in rows)
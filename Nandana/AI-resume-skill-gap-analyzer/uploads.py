@@ -0,0 +1,172 @@
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+
+from flask import Request
+from werkzeug.exceptions import RequestEntityTooLarge
+
+CHUNK_SIZE = 64 * 1024
+STORED_NAME = re.compile(r"^[0-9a-f]{64}\.[a-z0-9]+$")
+PART_SUFFIX = ".part"
+
+
+def stored_extension(filename):
+    """".pdf" for "CV.PDF ", "cv.pdf" or "cv.p-d-f"; ".bin" when nothing usable is left."""
+    ext = re.sub(r"[^a-z0-9]", "", os.path.splitext((filename or "").strip())[1].lower())
+    return "." + ext if ext else ".bin"
+
+
+class HashingTempFile:
+    """
+    Upload container: chunks are hashed as werkzeug writes them to a temp
+    file next to the store, so committing is a rename and the body is never
+    buffered in memory or read twice. Uncommitted files are removed on close.
+    """
+
+    def __init__(self, directory, max_bytes):
+        fd, self.name = tempfile.mkstemp(dir=directory, suffix=PART_SUFFIX)
+        self.file = os.fdopen(fd, "w+b")
+        self.max_bytes = max_bytes
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+        self.committed = False
+
+    def write(self, data):
+        self.size += len(data)
+        if self.size > self.max_bytes:
+            self.close()  # the parser drops the container without closing it
+            raise RequestEntityTooLarge(f"upload larger than {self.max_bytes // (1024 * 1024)} MB")
+        self.sha256.update(data)
+        return self.file.write(data)
+
+    def close(self):
+        self.file.close()
+        if not self.committed and os.path.exists(self.name):
+            os.remove(self.name)
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+
+class UploadStore:
+    """
+    Content-addressed upload folder: files are stored as <sha256><ext>, so
+    identical uploads share one file. A sweeper thread, started by the first
+    upload (so it runs under any WSGI server, not just `python app.py`),
+    evicts stored files older than max_age_s and then the oldest ones while
+    the folder is above max_total_bytes. Files not named by hash (e.g. ones
+    committed to the repo) are never touched.
+    """
+
+    def __init__(self, root, max_file_bytes=10 * 1024 * 1024,
+                 max_age_s=7 * 24 * 3600, max_total_bytes=500 * 1024 * 1024, sweep_interval_s=600):
+        self.root = root
+        self.max_file_bytes = max_file_bytes
+        self.max_age_s = max_age_s
+        self.max_total_bytes = max_total_bytes
+        self.sweep_interval_s = sweep_interval_s
+        self._stop = threading.Event()
+        self._sweeper = None
+        self._sweeper_lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def open_temp(self):
+        self.start_sweeper()
+        return HashingTempFile(self.root, self.max_file_bytes)
+
+    def commit(self, container, filename):
+        """
+        Move an uploaded HashingTempFile to its content address.
+        Returns (digest, path, deduplicated).
+        """
+        ext = stored_extension(filename)
+        digest = container.sha256.hexdigest()
+        path = os.path.join(self.root, digest + ext)
+
+        container.file.flush()
+        if os.path.exists(path):
+            os.utime(path)  # refresh its age so eviction sees it as recently used
+            deduplicated = True
+        else:
+            os.replace(container.name, path)
+            container.committed = True
+            deduplicated = False
+        container.close()
+        return digest, path, deduplicated
+
+    def save_stream(self, stream, filename):
+        """Store any readable stream (e.g. a file opened outside a request)."""
+        container = self.open_temp()
+        try:
+            for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+                container.write(chunk)
+        except BaseException:
+            container.close()
+            raise
+        return self.commit(container, filename)
+
+    # ---------------- EVICTION ----------------
+    def sweep(self, now=None):
+        """Evict expired and over-quota files. Returns the number removed."""
+        now = now or time.time()
+        stored, removed = [], 0
+        for entry in os.scandir(self.root):
+            if not entry.is_file():
+                continue
+            st = entry.stat()
+            expired = now - st.st_mtime > self.max_age_s
+            if entry.name.endswith(PART_SUFFIX):
+                # left behind by a crashed request; live ones are seconds old
+                if now - st.st_mtime > 3600:
+                    removed += self._remove(entry.path)
+            elif STORED_NAME.match(entry.name):
+                if expired:
+                    removed += self._remove(entry.path)
+                else:
+                    stored.append((st.st_mtime, st.st_size, entry.path))
+
+        total = sum(size for _, size, _ in stored)
+        for _, size, path in sorted(stored):
+            if total <= self.max_total_bytes:
+                break
+            removed += self._remove(path)
+            total -= size
+        return removed
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return 1
+        except FileNotFoundError:
+            return 0
+
+    def start_sweeper(self):
+        """Start the eviction thread (once per process; later calls do nothing)."""
+        with self._sweeper_lock:
+            if self._sweeper is not None:
+                return
+
+            def loop():
+                self.sweep()
+                while not self._stop.wait(self.sweep_interval_s):
+                    self.sweep()
+
+            self._sweeper = threading.Thread(target=loop, name="upload-sweeper", daemon=True)
+            self._sweeper.start()
+
+    def stop_sweeper(self):
+        self._stop.set()
+
+
+def request_class(store):
+    """Flask Request class that streams uploaded files into `store`."""
+
+    class UploadRequest(Request):
+        def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+            return store.open_temp()
+
+    return UploadRequest
@@ -0,0 +1,95 @@
+"""
+Experience extraction accuracy and throughput.
+
+    python bench_experience.py [--resumes 5000]
+
+Checks the labelled cases in fixtures/experience_cases.json, then times
+analyze_text (one scan for skills + experience) against the old two-pass
+path (extract_skills + extract_experience_years) over synthetic resumes.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+from datetime import date
+
+from experience_extractor import analyze_text, extract_experience, extract_experience_years
+from skill_extractor import SKILLS_FILE, extract_skills
+from skill_taxonomy import read_taxonomy
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "experience_cases.json")
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+FILLER = (
+    "Responsible for designing services, reviewing code and mentoring juniors. "
+    "Worked closely with product and QA teams to ship features on schedule. "
+)
+
+
+def check_fixtures():
+    with open(FIXTURES, encoding="utf-8") as f:
+        data = json.load(f)
+    today = date.fromisoformat(data["today"])
+    failures = []
+    for case in data["cases"]:
+        got = extract_experience(case["text"], today)["years"]
+        if abs(got - case["years"]) > 0.05:
+            failures.append((case["text"], case["years"], got))
+    passed = len(data["cases"]) - len(failures)
+    print(f"fixtures: {passed}/{len(data['cases'])} correct")
+    for text, expected, got in failures:
+        print(f"  expected {expected}, got {got}: {text!r}")
+    return not failures
+
+
+def synthetic_resume(rng, skills):
+    lines = [f"Summary: {rng.randint(1, 15)}+ years of experience in " + ", ".join(rng.sample(skills, 6))]
+    year = rng.randint(2005, 2018)
+    for _ in range(rng.randint(2, 5)):
+        end = year + rng.randint(1, 3)
+        lines.append(
+            f"Engineer, Company {rng.randint(1, 999)}, {rng.choice(MONTH_NAMES)} {year} - "
+            f"{rng.choice(MONTH_NAMES)} {end}"
+        )
+        lines.append(FILLER * rng.randint(1, 4) + "Used " + ", ".join(rng.sample(skills, 4)) + ".")
+        year = end
+    return "\n".join(lines)
+
+
+def time_per_text(fn, texts):
+    latencies = []
+    started = time.perf_counter()
+    for text in texts:
+        t0 = time.perf_counter()
+        fn(text)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return len(texts) / elapsed, statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resumes", type=int, default=5000)
+    args = parser.parse_args()
+
+    ok = check_fixtures()
+
+    rng = random.Random(0)
+    skills = sorted(read_taxonomy(SKILLS_FILE))
+    texts = [synthetic_resume(rng, skills) for _ in range(args.resumes)]
+    analyze_text(texts[0])  # load the skill trie before timing
+
+    def two_pass(text):
+        return extract_skills(text), extract_experience_years(text)
+
+    for label, fn in (("two-pass", two_pass), ("single-pass", analyze_text)):
+        per_sec, p50, p99 = time_per_text(fn, texts)
+        print(f"{label:12} {per_sec:8.0f} resumes/s  p50 {p50:.3f} ms  p99 {p99:.3f} ms")
+
+    raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Resume index query latency at pool size.
+
+    python bench_index.py [--resumes 100000] [--db /tmp/bench_index.db]
+
+Fills an index with synthetic resumes (skills + experience, short text),
+then times a few boolean queries with experience filters.
+"""
+import argparse
+import os
+import random
+import statistics
+import time
+
+from resume_index import ResumeIndex
+from skill_extractor import SKILLS_FILE
+from skill_taxonomy import read_taxonomy
+
+QUERIES = [
+    ("docker AND aws", 3),
+    ("python AND (sql OR postgresql) AND NOT java", 2),
+    ("react OR javascript", 0),
+    ('"machine learning" AND python AND docker', 5),
+    ("k8s AND docker AND aws", 4),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resumes", type=int, default=100000)
+    parser.add_argument("--db", default="bench_index.db")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    if os.path.exists(args.db):
+        os.remove(args.db)
+    index = ResumeIndex(args.db)
+
+    rng = random.Random(0)
+    skills = sorted(read_taxonomy(SKILLS_FILE))
+    started = time.perf_counter()
+    for i in range(args.resumes):
+        own = rng.sample(skills, rng.randint(2, 8))
+        years = round(rng.uniform(0, 15), 1)
+        text = f"candidate {i} with {years} years of experience in " + ", ".join(own)
+        index.add_resume(f"/resumes/{i}.pdf", text, skills=own, years=years, commit=False)
+        if i % 5000 == 0:
+            index.conn.commit()
+    index.conn.commit()
+    print(f"indexed {len(index)} resumes in {time.perf_counter() - started:.1f}s")
+
+    for query, min_years in QUERIES:
+        latencies = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            results = index.search(query, min_years=min_years, k=10)
+            latencies.append((time.perf_counter() - started) * 1000)
+        latencies.sort()
+        print(
+            f"{query!r:48} >= {min_years} yrs: {len(results)} hits, "
+            f"p50 {statistics.median(latencies):.1f} ms, max {latencies[-1]:.1f} ms"
+        )
+
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Skill trie benchmark at production taxonomy size.
+
+    python bench_taxonomy.py [--skills 50000] [--resumes 500] [--words 800]
+
+Generates a synthetic taxonomy (multi-word skills with aliases) and
+synthetic resumes, then reports compile time, cached load time and
+per-resume lookup latency.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from skill_taxonomy import load_trie
+
+WORDS = [
+    "data", "cloud", "web", "api", "stream", "graph", "ml", "ops", "test", "build",
+    "query", "cache", "vector", "mobile", "secure", "edge", "batch", "model", "deploy", "scale",
+    "team", "project", "design", "report", "customer", "delivery", "system", "service", "platform", "review",
+]
+
+
+def synthetic_taxonomy(n, rng):
+    taxonomy = {}
+    while len(taxonomy) < n:
+        length = rng.choice((1, 1, 2, 2, 3))
+        name = " ".join(rng.choice(WORDS) + str(rng.randrange(2000)) for _ in range(length))
+        taxonomy[name] = [name.replace(" ", ""), name.replace(" ", "-") + "js"]
+    return taxonomy
+
+
+def synthetic_resume(words, skills, rng):
+    tokens = [rng.choice(WORDS) for _ in range(words)]
+    for _ in range(words // 40):
+        tokens.insert(rng.randrange(len(tokens)), rng.choice(skills))
+    return " ".join(tokens)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--skills", type=int, default=50000)
+    parser.add_argument("--resumes", type=int, default=500)
+    parser.add_argument("--words", type=int, default=800)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    taxonomy = synthetic_taxonomy(args.skills, rng)
+    skills = list(taxonomy)
+    resumes = [synthetic_resume(args.words, skills, rng) for _ in range(args.resumes)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "taxonomy.json")
+        with open(path, "w") as f:
+            json.dump(taxonomy, f)
+
+        started = time.perf_counter()
+        load_trie(path)
+        compile_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        trie = load_trie(path)
+        load_s = time.perf_counter() - started
+
+    latencies = []
+    found = 0
+    for text in resumes:
+        started = time.perf_counter()
+        found += len(trie.find(text))
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    latencies.sort()
+    print(f"taxonomy:     {trie.size} skills, version {trie.version}")
+    print(f"compile+save: {compile_s * 1000:.0f} ms")
+    print(f"cached load:  {load_s * 1000:.0f} ms")
+    print(f"resumes:      {len(resumes)} x {args.words} words, {found / len(resumes):.1f} skills each")
+    print(f"latency:      p50 {statistics.median(latencies):.3f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1]:.3f} ms, "
+          f"mean {statistics.fmean(latencies):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
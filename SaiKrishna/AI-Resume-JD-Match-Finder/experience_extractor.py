@@ -1,14 +1,203 @@
+"""
+Single-pass experience extraction.
+
+One compiled regex walks the text once and recognises, in order of priority:
+- employment date spans:  "Jan 2019 – Present", "03/2018 - 06/2020", "2016 to 2019"
+- numeric ranges:         "3-5 years", "2 to 4 yrs"
+- numeric phrases:        "3+ yrs", "1.5 years", "2 years 6 months", "18 months"
+- any other word token, which is handed to the skill trie
+
+A date span only counts as employment when nothing on its line near it
+names education (University, B.Tech, Degree, School, ...). A span between
+two bare years ("2014 - 2018") must also have an employment cue close by
+("Analyst at Foo Ltd", "Developer", "worked"), so phone numbers and the like
+are not read as jobs; month-dated and "- Present" spans need no cue. Stated
+numbers followed by "ago", "old", ... are not durations of experience.
+
+Date spans are merged into non-overlapping intervals to get the total tenure.
+The experience figure is the larger of the tenure and the highest stated
+number (lower bound of a range, so "3-5 years" in a JD requires 3).
+"""
 import re
+from datetime import date
+
+from skill_extractor import get_skill_trie
+from skill_taxonomy import TOKEN_RE
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+_MONTH = (
+    r"jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?"
+)
+_YEAR = r"(?:19|20)\d{2}"
+
+
+def _date(prefix):
+    # "Jan 2019" / "January, 2019" | "03/2019" | "2019"
+    return (
+        rf"(?:(?P<{prefix}_mon>{_MONTH})\.?\s*,?\s*(?P<{prefix}_myear>{_YEAR})"
+        rf"|(?P<{prefix}_mm>0?[1-9]|1[0-2])\s*/\s*(?P<{prefix}_nyear>{_YEAR})"
+        rf"|(?P<{prefix}_year>{_YEAR}))"
+    )
+
+
+_DASH = r"\s*(?:-|–|—|to|till|until)\s*"
+_PRESENT = r"present|current(?:ly)?|now|today|till\s+date|to\s+date|date"
+_YEARS = r"(?:years?|yrs?)\b"
+_MONTHS_UNIT = r"(?:months?|mos?)\b"
+_NUM = r"\d{1,2}(?:\.\d+)?"
+
+SCAN_RE = re.compile(
+    rf"(?P<span>{_date('s')}{_DASH}(?:{_date('e')}|(?P<present>{_PRESENT})\b))"
+    rf"|(?P<range>(?P<lo>{_NUM})\s*(?:-|–|to)\s*(?P<hi>{_NUM})\s*\+?\s*(?P<range_unit>{_YEARS}|{_MONTHS_UNIT}))"
+    rf"|(?P<numeric>(?P<num>{_NUM})\s*(?P<plus>\+)?\s*(?P<unit>{_YEARS}|{_MONTHS_UNIT})"
+    rf"(?:\s*(?:and\s*)?(?P<extra_months>\d{{1,2}})\s*{_MONTHS_UNIT})?)"
+    rf"|(?P<token>{TOKEN_RE.pattern})",
+    re.IGNORECASE,
+)
+
+EMPLOYMENT_RE = re.compile(
+    r"\b(?:at|worked|working|work|employed|employment|experience|company|corp(?:oration)?|ltd|inc|llc|pvt"
+    r"|technologies|solutions|engineer|developer|analyst|intern(?:ship)?|manager|consultant|lead"
+    r"|architect|designer|scientist|administrator|specialist|associate|officer|freelancer?|role|position)\b",
+    re.IGNORECASE,
+)
+EDUCATION_RE = re.compile(
+    r"\b(?:university|college|school|institute|academy|education|degree|diploma|graduat\w*"
+    r"|bachelor'?s?|master'?s|masters\s+of|b\.\s?e\b|b\.?\s?tech|m\.?\s?tech|b\.?\s?sc|m\.?\s?sc"
+    r"|b\.?\s?com|bca|mca|mba|ph\.?\s?d|cgpa|gpa|ssc|hsc|cbse|class\s+(?:x|xii|10|12)\b)",
+    re.IGNORECASE,
+)
+NOT_DURATION_RE = re.compile(r"\s*(?:ago|old|back|before|earlier|later|from\s+now)\b", re.IGNORECASE)
+# how far around a date span to look for employment / education words
+CUE_BEFORE = 80
+CUE_AFTER = 40
+
+
+# ---------------- PARSING HELPERS ----------------
+def _month_index(m, prefix):
+    """Months since year 0 for the date matched under `prefix`, or None."""
+    if m.group(f"{prefix}_mon"):
+        return int(m.group(f"{prefix}_myear")) * 12 + MONTHS[m.group(f"{prefix}_mon")[:3].lower()] - 1
+    if m.group(f"{prefix}_mm"):
+        return int(m.group(f"{prefix}_nyear")) * 12 + int(m.group(f"{prefix}_mm")) - 1
+    if m.group(f"{prefix}_year"):
+        return int(m.group(f"{prefix}_year")) * 12
+    return None
+
+
+def _in_years(value, unit):
+    return value / 12 if unit.lower().startswith("mo") else value
+
+
+def merge_intervals(intervals):
+    """Merge overlapping/adjacent (start, end) month intervals."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _span_context(text, start, end, prev_end):
+    """
+    Text around a date span on its own line: back to the previous mention
+    (so an earlier entry's words don't leak in) and forward to the end of
+    the sentence.
+    """
+    line_start = text.rfind("\n", 0, start) + 1
+    before = text[max(line_start, prev_end, start - CUE_BEFORE):start]
+    after = text[end:end + CUE_AFTER].split("\n", 1)[0]
+    after = re.split(r"[;]|\.\s", after, maxsplit=1)[0]
+    return before, after
+
+
+def _is_employment(m, text, prev_end):
+    before, after = _span_context(text, m.start(), m.end(), prev_end)
+    if EDUCATION_RE.search(before) or EDUCATION_RE.search(after):
+        return False
+    bare_years = m.group("s_year") and m.group("e_year")
+    return not bare_years or bool(EMPLOYMENT_RE.search(before) or EMPLOYMENT_RE.search(after))
+
+
+# ---------------- SCANNING ----------------
+def scan_text(text, today=None):
+    """
+    One pass over `text`. Returns (experience, tokens) where tokens are the
+    lowercased word tokens for the skill trie and experience is a dict:
+        years, stated_years, tenure_years,
+        mentions: [{kind, text, start, end, years | from/to}]
+    """
+    today = today or date.today()
+    now = today.year * 12 + today.month - 1
+
+    tokens, mentions, intervals = [], [], []
+    stated = 0.0
+    prev_end = 0
+
+    for m in SCAN_RE.finditer(text):
+        kind = m.lastgroup
+        if kind == "token":
+            tokens.append(m.group().lower())
+            continue
+        after_prev, prev_end = prev_end, m.end()
+        if kind == "numeric" and NOT_DURATION_RE.match(text, m.end()):
+            continue
+
+        mention = {"kind": kind, "text": m.group(), "start": m.start(), "end": m.end()}
+
+        if kind == "span":
+            start = _month_index(m, "s")
+            end = now if m.group("present") else _month_index(m, "e")
+            if end is None or end < start or start > now:
+                continue
+            if not _is_employment(m, text, after_prev):
+                continue
+            end = min(end, now)
+            intervals.append((start, end))
+            mention["from"] = f"{start // 12}-{start % 12 + 1:02d}"
+            mention["to"] = f"{end // 12}-{end % 12 + 1:02d}"
+            mention["years"] = round((end - start) / 12, 2)
+        elif kind == "range":
+            value = _in_years(float(m.group("lo")), m.group("range_unit"))
+            mention["years"] = round(value, 2)
+            mention["upper_years"] = round(_in_years(float(m.group("hi")), m.group("range_unit")), 2)
+            stated = max(stated, value)
+        else:
+            value = _in_years(float(m.group("num")), m.group("unit"))
+            if m.group("extra_months"):
+                value += int(m.group("extra_months")) / 12
+            mention["years"] = round(value, 2)
+            mention["at_least"] = bool(m.group("plus"))
+            stated = max(stated, value)
+
+        mentions.append(mention)
+
+    tenure = sum(end - start for start, end in merge_intervals(intervals)) / 12
+    experience = {
+        "years": round(max(stated, tenure), 1),
+        "stated_years": round(stated, 1),
+        "tenure_years": round(tenure, 1),
+        "mentions": mentions,
+    }
+    return experience, tokens
+
+
+def analyze_text(text, today=None):
+    """Skills and experience from a single scan of the text."""
+    experience, tokens = scan_text(text, today)
+    return {"skills": get_skill_trie().find_in_tokens(tokens), "experience": experience}
 
-def extract_experience_years(text):
-    text = text.lower()
 
-    # common patterns like "2 years", "3+ years", "1.5 years"
-    matches = re.findall(r'(\d+)\s*years', text)
+def extract_experience(text, today=None):
+    return scan_text(text, today)[0]
 
-    if not matches:
-        return 0.0
 
-    # take the maximum experience mentioned
-    years = [float(match[0]) for match in matches]
-    return min(years)
+def extract_experience_years(text, today=None):
+    return extract_experience(text, today)["years"]
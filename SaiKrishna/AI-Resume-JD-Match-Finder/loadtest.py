@@ -0,0 +1,143 @@
+"""
+Load test for service.py (stdlib asyncio client, no extra dependencies).
+
+    python service.py &
+    python loadtest.py --requests 2000 --concurrency 32
+    python loadtest.py --resume sample.pdf --requests 200     # multipart upload, exercises parsing
+    python loadtest.py --batch 50                             # /score/batch with 50 resumes each
+
+Reports requests/second and p50/p90/p99 latency, plus the server-side
+total from the Server-Timing header.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+import uuid
+from urllib.parse import urlsplit
+
+SAMPLE_JD = (
+    "We are hiring a backend engineer with 3+ years of experience in Python, "
+    "Django or Flask, SQL, Docker and AWS. Kubernetes and CI/CD are a plus."
+)
+SKILL_POOL = [
+    "python", "java", "sql", "docker", "aws", "kubernetes", "react", "flask",
+    "django", "git", "linux", "machine learning", "pandas", "javascript",
+]
+
+
+def synthetic_resume(rng):
+    skills = ", ".join(rng.sample(SKILL_POOL, rng.randint(3, 8)))
+    start = rng.randint(2010, 2021)
+    return (
+        f"Software developer with {rng.randint(1, 12)} years of experience. Skills: {skills}.\n"
+        f"Engineer, Company {rng.randint(1, 500)}, Jan {start} - Present. "
+        + "Built and maintained services, wrote tests, reviewed code. " * rng.randint(1, 5)
+    )
+
+
+def json_body(args, rng):
+    if args.batch:
+        resumes = [{"name": f"r{i}", "text": synthetic_resume(rng)} for i in range(args.batch)]
+        payload = {"job_description": SAMPLE_JD, "resumes": resumes}
+    else:
+        payload = {"job_description": SAMPLE_JD, "resume_text": synthetic_resume(rng)}
+    return "application/json", json.dumps(payload).encode()
+
+
+def multipart_body(resume_path, job_text):
+    boundary = uuid.uuid4().hex
+    with open(resume_path, "rb") as f:
+        content = f.read()
+    name = os.path.basename(resume_path)
+    body = (
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"job_description\"\r\n\r\n"
+        f"{job_text}\r\n"
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"resume\"; filename=\"{name}\"\r\n"
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode() + content + f"\r\n--{boundary}--\r\n".encode()
+    return f"multipart/form-data; boundary={boundary}", body
+
+
+async def post(host, port, path, content_type, body):
+    """One keep-alive-less HTTP/1.1 POST; returns (status, server total ms)."""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}:{port}\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    head = response.split(b"\r\n\r\n", 1)[0].decode("latin-1").split("\r\n")
+    status = int(head[0].split()[1])
+    server_ms = None
+    for line in head[1:]:
+        key, _, value = line.partition(":")
+        if key.lower() == "server-timing":
+            for part in value.split(","):
+                metric, _, dur = part.strip().partition(";dur=")
+                if metric == "total":
+                    server_ms = float(dur)
+    return status, server_ms
+
+
+async def run(args):
+    url = urlsplit(args.url)
+    host, port = url.hostname, url.port or 80
+    path = "/score/batch" if args.batch else "/score"
+    rng = random.Random(0)
+    if args.resume:
+        bodies = [multipart_body(args.resume, SAMPLE_JD)]
+    else:
+        bodies = [json_body(args, rng) for _ in range(min(args.requests, 200))]
+
+    latencies, server_times, errors = [], [], 0
+    queue = asyncio.Queue()
+    for i in range(args.requests):
+        queue.put_nowait(bodies[i % len(bodies)])
+
+    async def worker():
+        nonlocal errors
+        while not queue.empty():
+            content_type, body = queue.get_nowait()
+            started = time.perf_counter()
+            try:
+                status, server_ms = await post(host, port, path, content_type, body)
+            except OSError:
+                status, server_ms = 0, None
+            latencies.append((time.perf_counter() - started) * 1000)
+            if status != 200:
+                errors += 1
+            elif server_ms is not None:
+                server_times.append(server_ms)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    pct = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+    print(f"{path}: {args.requests} requests, concurrency {args.concurrency}, {errors} errors")
+    print(f"throughput  {args.requests / elapsed:.1f} req/s")
+    print(f"latency     p50 {pct(0.50):.1f} ms  p90 {pct(0.90):.1f} ms  p99 {pct(0.99):.1f} ms")
+    if server_times:
+        print(f"server      p50 {statistics.median(server_times):.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--resume", help="PDF/DOCX to upload instead of JSON text")
+    parser.add_argument("--batch", type=int, default=0, help="resumes per /score/batch request")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
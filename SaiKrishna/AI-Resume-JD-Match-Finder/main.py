@@ -1,136 +1,423 @@
+import os
+import queue
 import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext
-from resume_parser import extract_resume_text
-from matcher import calculate_match
-
-resume_text = ""
-
-# ---------------- Functions ---------------- #
-
-def upload_resume():
-    global resume_text
-    file_path = filedialog.askopenfilename(
-        filetypes=[("Text Files", "*.txt")]
-    )
-    if file_path:
-        resume_text = extract_resume_text(file_path)
-        status_label.config(text="Resume uploaded successfully ✔", fg="green")
-
-def evaluate_match():
-    if not resume_text:
-        messagebox.showerror("Error", "Please upload a resume first")
-        return
-
-    job_desc = job_text.get("1.0", tk.END).strip()
-    if job_desc:
-        messagebox.showerror("Error", "Please enter a job description")
-        return
-
-    final_score, explanation = calculate_match(resume_text, job_desc)
-
-    result_box.delete("1.0", tk.END)
-
-    # --- Final Score ---
-    result_box.insert(tk.END, f"Final Match Percentage: {final_score}%\n\n")
-
-    # --- Skills ---
-    result_box.insert(tk.END, "Matched Skills:\n")
-    if explanation["missing_skills"]:
-        for skill in explanation["missing_skills"]:
-            result_box.insert(tk.END, f"  ✔ {skill}\n")
-    else:
-        result_box.insert(tk.END, "  None\n")
-
-    result_box.insert(tk.END, "\nMissing Skills:\n")
-    if explanation["matched_skills"]:
-        for skill in explanation["matched_skills"]:
-            result_box.insert(tk.END, f"  ✖ {skill}\n")
-    else:
-        result_box.insert(tk.END, "  None\n")
-
-    # --- Experience ---
-    result_box.insert(tk.END, "\nExperience Analysis:\n")
-    result_box.insert(
-        tk.END,
-        f"  ✔ Resume Experience: {explanation['resume_experience']} years\n"
-    )
-    result_box.insert(
-        tk.END,
-        f"  ✔ Required Experience: {explanation['required_experience']} years\n"
-    )
-    result_box.insert(
-        tk.END,
-        f"  ✔ Experience Match: {explanation['experience_match']}%\n"
-    )
-
-# ---------------- UI ---------------- #
-
-root = tk.Tk()
-root.title("AI Resume – Job Match Finder")
-root.geometry("800x700")
-root.resizable(False, False)
-
-main_frame = tk.Frame(root, padx=20, pady=20)
-main_frame.pack(fill=tk.BOTH, expand=True)
-
-# Job Description
-tk.Label(
-    main_frame,
-    text="Job Description",
-    font=("Segoe UI", 11, "bold")
-).grid(row=0, column=0, sticky="w")
-
-job_text = scrolledtext.ScrolledText(
-    main_frame,
-    width=90,
-    height=8,
-    font=("Segoe UI", 10)
-)
-job_text.grid(row=1, column=0, pady=(5, 15))
-
-# Resume Upload
-upload_frame = tk.Frame(main_frame)
-upload_frame.grid(row=2, column=0, sticky="w", pady=(0, 10))
-
-tk.Button(
-    upload_frame,
-    text="Upload Resume",
-    width=20,
-    command=upload_resume
-).grid(row=0, column=0)
-
-status_label = tk.Label(
-    upload_frame,
-    text="No resume uploaded",
-    font=("Segoe UI", 9),
-    fg="red"
-)
-status_label.grid(row=0, column=1, padx=15)
-
-# Evaluate Button
-tk.Button(
-    main_frame,
-    text="Evaluate Match",
-    width=25,
-    height=2,
-    bg="#0078D7",
-    fg="white",
-    command=evaluate_match
-).grid(row=3, column=0, pady=15)
-
-# Result Section
-tk.Label(
-    main_frame,
-    text="Match Result",
-    font=("Segoe UI", 11, "bold")
-).grid(row=4, column=0, sticky="w")
-
-result_box = scrolledtext.ScrolledText(
-    main_frame,
-    width=90,
-    height=18,
-    font=("Segoe UI", 10)
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from tkinter import filedialog, messagebox, scrolledtext, ttk
+
+from experience_extractor import analyze_text
+from matcher import analyze_file, score_match
+from resume_index import ResumeIndex
+
+POLL_MS = 50
+WORKERS = int(os.getenv("MATCH_FINDER_WORKERS", str(os.cpu_count() or 1)))
+COLUMNS = (
+    ("rank", "#", 40),
+    ("name", "Resume", 300),
+    ("score", "Match %", 80),
+    ("skills", "Skills", 80),
+    ("experience", "Experience", 90),
+    ("exp_match", "Exp. Match %", 100),
 )
-result_box.grid(row=5, column=0, pady=(5, 0))
 
-root.mainloop()
+
+class MatchFinderApp:
+    """
+    Resumes are parsed and analyzed (pdfminer / python-docx + skill and
+    experience extraction) in a process pool, so the window never blocks.
+    Worker callbacks only put results on a queue; the Tk thread drains it
+    every POLL_MS via root.after and rescores against the current JD, which
+    is cheap once a resume is analyzed.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        # every uploaded resume is also added to the searchable local index
+        self.resume_index = ResumeIndex()
+        self.pool = None
+        self.results = queue.Queue()
+        self.resumes = {}       # path -> analysis, or {"error": ...}
+        self.job = None         # analysis of the JD at the last evaluation
+        self.job_source = None  # the JD text self.job was built from
+        self.pending = {}       # path -> future of the current batch
+        self.batch = 0          # bumped on cancel so late results are dropped
+        self.done = 0
+        self.poll_id = None     # pending root.after callback while a batch runs
+        self._build()
+        root.protocol("WM_DELETE_WINDOW", self.close)
+
+    # ---------------- UI ---------------- #
+    def _build(self):
+        root = self.root
+        root.title("AI Resume – Job Match Finder")
+        root.geometry("800x760")
+        root.resizable(False, False)
+
+        main_frame = tk.Frame(root, padx=20, pady=20)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Job Description
+        tk.Label(
+            main_frame,
+            text="Job Description",
+            font=("Segoe UI", 11, "bold")
+        ).grid(row=0, column=0, sticky="w")
+
+        self.job_text = scrolledtext.ScrolledText(
+            main_frame,
+            width=90,
+            height=7,
+            font=("Segoe UI", 10)
+        )
+        self.job_text.grid(row=1, column=0, pady=(5, 10))
+
+        # Resume Upload / Evaluate / Cancel
+        button_frame = tk.Frame(main_frame)
+        button_frame.grid(row=2, column=0, sticky="w", pady=(0, 10))
+
+        tk.Button(
+            button_frame,
+            text="Upload Resumes",
+            width=18,
+            command=self.upload_resumes
+        ).grid(row=0, column=0)
+
+        tk.Button(
+            button_frame,
+            text="Evaluate Match",
+            width=18,
+            bg="#0078D7",
+            fg="white",
+            command=self.evaluate_match
+        ).grid(row=0, column=1, padx=10)
+
+        self.cancel_button = tk.Button(
+            button_frame,
+            text="Cancel",
+            width=10,
+            state=tk.DISABLED,
+            command=self.cancel
+        )
+        self.cancel_button.grid(row=0, column=2)
+
+        tk.Button(
+            button_frame,
+            text="Clear",
+            width=10,
+            command=self.clear
+        ).grid(row=0, column=3, padx=10)
+
+        # Progress
+        progress_frame = tk.Frame(main_frame)
+        progress_frame.grid(row=3, column=0, sticky="we", pady=(0, 10))
+
+        self.progress = ttk.Progressbar(progress_frame, length=300, mode="determinate")
+        self.progress.grid(row=0, column=0)
+
+        self.status_label = tk.Label(
+            progress_frame,
+            text="No resume uploaded",
+            font=("Segoe UI", 9),
+            fg="red"
+        )
+        self.status_label.grid(row=0, column=1, padx=15)
+
+        # Ranked Resumes
+        tk.Label(
+            main_frame,
+            text="Ranked Resumes",
+            font=("Segoe UI", 11, "bold")
+        ).grid(row=4, column=0, sticky="w")
+
+        table_frame = tk.Frame(main_frame)
+        table_frame.grid(row=5, column=0, pady=(5, 10), sticky="we")
+
+        self.table = ttk.Treeview(
+            table_frame,
+            columns=[c[0] for c in COLUMNS],
+            show="headings",
+            height=9,
+            selectmode="browse"
+        )
+        for key, heading, width in COLUMNS:
+            self.table.heading(key, text=heading)
+            self.table.column(key, width=width, anchor="w" if key == "name" else "center")
+        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.table.yview)
+        self.table.configure(yscrollcommand=scrollbar.set)
+        self.table.grid(row=0, column=0)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.table.bind("<<TreeviewSelect>>", lambda event: self.show_details())
+
+        # Result Section
+        tk.Label(
+            main_frame,
+            text="Match Result",
+            font=("Segoe UI", 11, "bold")
+        ).grid(row=6, column=0, sticky="w")
+
+        self.result_box = scrolledtext.ScrolledText(
+            main_frame,
+            width=90,
+            height=10,
+            font=("Segoe UI", 10)
+        )
+        self.result_box.grid(row=7, column=0, pady=(5, 0))
+
+    def set_status(self, text, color="green"):
+        self.status_label.config(text=text, fg=color)
+
+    # ---------------- Upload (worker pool) ---------------- #
+    def upload_resumes(self):
+        file_paths = filedialog.askopenfilenames(
+            filetypes=[("Resumes", "*.pdf *.docx"), ("PDF Files", "*.pdf"), ("Word Files", "*.docx")]
+        )
+        paths = [os.path.abspath(p) for p in file_paths if os.path.abspath(p) not in self.pending]
+        if not paths:
+            return
+
+        # score new resumes as they arrive if a JD is already there; an edited JD
+        # rescores the ones already listed so every row uses the same job
+        job_desc = self.job_text.get("1.0", tk.END).strip()
+        if job_desc and self._analyze_job(job_desc):
+            for path in self.resumes:
+                self._update_row(path)
+            self._sort_table()
+
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=WORKERS)
+        if not self.pending:
+            self.done = 0
+            self.progress["value"] = 0
+        self.progress["maximum"] = self.done + len(self.pending) + len(paths)
+
+        batch = self.batch
+        for path in paths:
+            future = self.pool.submit(analyze_file, path)
+            self.pending[path] = future
+            # runs on a pool thread: only hand the result over, never touch Tk here
+            future.add_done_callback(lambda f, path=path: self.results.put((batch, path, f)))
+            self.resumes.setdefault(path, None)
+            self._update_row(path)
+
+        self.cancel_button.config(state=tk.NORMAL)
+        self._update_progress()
+        if self.poll_id is None:
+            self.poll_id = self.root.after(POLL_MS, self._poll)
+
+    def _poll(self):
+        changed = False
+        while True:
+            try:
+                batch, path, future = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if batch != self.batch or self.pending.get(path) is not future:
+                continue  # cancelled, or superseded by a newer upload of the same file
+            del self.pending[path]
+            self.done += 1
+            self._store_result(path, future)
+            changed = True
+
+        if changed:
+            self._sort_table()
+            self._update_progress()
+        if self.pending:
+            self.poll_id = self.root.after(POLL_MS, self._poll)
+        else:
+            self.poll_id = None
+            self.cancel_button.config(state=tk.DISABLED)
+
+    def _store_result(self, path, future):
+        try:
+            result = future.result()
+        except CancelledError:
+            return
+        except Exception as e:
+            self.resumes[path] = {"error": f"{type(e).__name__}: {e}"}
+        else:
+            self.resumes[path] = result["analysis"]
+            analysis = result["analysis"]
+            self.resume_index.add_resume(
+                path, result["text"],
+                skills=analysis["skills"], years=analysis["experience"]["years"],
+                mtime=result["mtime"], size=result["size"],
+            )
+        self._update_row(path)
+
+    def _update_progress(self):
+        self.progress["value"] = self.done
+        if self.pending:
+            self.set_status(f"Parsing resumes… {self.done}/{int(self.progress['maximum'])}", "#B8860B")
+        else:
+            parsed = sum(1 for a in self.resumes.values() if a and "error" not in a)
+            self.set_status(f"{parsed} resume(s) uploaded successfully ✔")
+
+    def cancel(self):
+        for future in self.pending.values():
+            future.cancel()  # queued jobs never start; running ones finish and are ignored
+        for path in self.pending:
+            if self.resumes.get(path) is None:
+                del self.resumes[path]
+                if self.table.exists(path):
+                    self.table.delete(path)
+        self.pending.clear()
+        self.batch += 1
+        if self.poll_id is not None:
+            self.root.after_cancel(self.poll_id)
+            self.poll_id = None
+        self.cancel_button.config(state=tk.DISABLED)
+        self._sort_table()
+        self.set_status(f"Cancelled after {self.done} resume(s)", "red")
+
+    def clear(self):
+        self.cancel()
+        self.resumes.clear()
+        self.table.delete(*self.table.get_children())
+        self.result_box.delete("1.0", tk.END)
+        self.progress["value"] = 0
+        self.set_status("No resume uploaded", "red")
+
+    # ---------------- Scoring ---------------- #
+    def _analyze_job(self, job_desc):
+        """Analyze the JD unless self.job was already built from this text; True if it changed."""
+        if job_desc == self.job_source:
+            return False
+        self.job = analyze_text(job_desc)
+        self.job_source = job_desc
+        return True
+
+    def _score(self, path):
+        analysis = self.resumes.get(path)
+        if not analysis or "error" in analysis or self.job is None:
+            return None
+        return score_match(
+            analysis["skills"],
+            analysis["experience"]["years"],
+            self.job["skills"],
+            self.job["experience"]["years"],
+        )
+
+    def _update_row(self, path):
+        analysis = self.resumes.get(path)
+        name = os.path.basename(path)
+        if analysis is None:
+            values = ("", name, "…", "", "", "")
+        elif "error" in analysis:
+            values = ("", name, "error", "", "", "")
+        else:
+            scored = self._score(path)
+            if scored is None:
+                values = ("", name, "-", len(analysis["skills"]), analysis["experience"]["years"], "-")
+            else:
+                score, explanation = scored
+                matched = len(explanation["matched_skills"])
+                required = matched + len(explanation["missing_skills"])
+                values = ("", name, score, f"{matched}/{required}",
+                          explanation["resume_experience"], explanation["experience_match"])
+        if self.table.exists(path):
+            self.table.item(path, values=values)
+        else:
+            self.table.insert("", tk.END, iid=path, values=values)
+
+    def _sort_table(self):
+        def rank_key(path):
+            score = self.table.set(path, "score")
+            try:
+                return (0, -float(score), path)
+            except ValueError:
+                return (1, 0.0, path)  # pending, unscored and failed resumes last
+
+        for index, path in enumerate(sorted(self.table.get_children(), key=rank_key)):
+            self.table.move(path, "", index)
+            scored = self.table.set(path, "score") not in ("…", "error", "-")
+            self.table.set(path, "rank", index + 1 if scored else "")
+        self.show_details()
+
+    def evaluate_match(self):
+        if not self.resumes:
+            messagebox.showerror("Error", "Please upload a resume first")
+            return
+
+        job_desc = self.job_text.get("1.0", tk.END).strip()
+        if not job_desc:
+            messagebox.showerror("Error", "Please enter a job description")
+            return
+
+        # the JD is analyzed once per edit; each resume is just a set comparison
+        self._analyze_job(job_desc)
+        for path in self.resumes:
+            self._update_row(path)
+        self._sort_table()
+        if not self.table.selection() and self.table.get_children():
+            self.table.selection_set(self.table.get_children()[0])
+
+    def show_details(self):
+        selection = self.table.selection()
+        if not selection:
+            return
+        path = selection[0]
+        self.result_box.delete("1.0", tk.END)
+        analysis = self.resumes.get(path)
+        if analysis is None:
+            self.result_box.insert(tk.END, f"{os.path.basename(path)}: still parsing…\n")
+            return
+        if "error" in analysis:
+            self.result_box.insert(tk.END, f"{os.path.basename(path)} could not be read:\n  {analysis['error']}\n")
+            return
+        scored = self._score(path)
+        if scored is None:
+            self.result_box.insert(tk.END, "Enter a job description and click Evaluate Match.\n")
+            return
+        final_score, explanation = scored
+
+        # --- Final Score ---
+        self.result_box.insert(tk.END, f"{os.path.basename(path)}\n")
+        self.result_box.insert(tk.END, f"Final Match Percentage: {final_score}%\n\n")
+
+        # --- Skills ---
+        self.result_box.insert(tk.END, "Matched Skills:\n")
+        if explanation["matched_skills"]:
+            for skill in explanation["matched_skills"]:
+                self.result_box.insert(tk.END, f"  ✔ {skill}\n")
+        else:
+            self.result_box.insert(tk.END, "  None\n")
+
+        self.result_box.insert(tk.END, "\nMissing Skills:\n")
+        if explanation["missing_skills"]:
+            for skill in explanation["missing_skills"]:
+                self.result_box.insert(tk.END, f"  ✖ {skill}\n")
+        else:
+            self.result_box.insert(tk.END, "  None\n")
+
+        # --- Experience ---
+        self.result_box.insert(tk.END, "\nExperience Analysis:\n")
+        self.result_box.insert(
+            tk.END,
+            f"  ✔ Resume Experience: {explanation['resume_experience']} years\n"
+        )
+        self.result_box.insert(
+            tk.END,
+            f"  ✔ Required Experience: {explanation['required_experience']} years\n"
+        )
+        self.result_box.insert(
+            tk.END,
+            f"  ✔ Experience Match: {explanation['experience_match']}%\n"
+        )
+
+    def close(self):
+        if self.poll_id is not None:
+            self.root.after_cancel(self.poll_id)
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+        self.resume_index.close()
+        self.root.destroy()
+
+
+def main():
+    root = tk.Tk()
+    MatchFinderApp(root)
+    root.mainloop()
+
+
+# the guard keeps worker processes (spawned on Windows/macOS) from opening windows
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,57 @@
-from skill_extractor import extract_skills
-from experience_extractor import extract_experience_years
+import os
 
-def calculate_match(resume_text, job_text):
-    # --- Skill extraction ---
-    resume_skills = set(extract_skills(resume_text))
-    job_skills = set(extract_skills(job_text))
+from experience_extractor import analyze_text
+from resume_parser import extract_resume_text
+
+SKILL_WEIGHT = 0.3
+EXPERIENCE_WEIGHT = 0.7
+
+def calculate_match(resume_text, job_text, semantic=False):
+    if semantic:
+        # optional mode, needs sentence-transformers (see semantic.py)
+        from semantic import semantic_match
+        return semantic_match(resume_text, job_text)
+
+    # one scan per text gives both skills and experience
+    resume = analyze_text(resume_text)
+    job = analyze_text(job_text)
+    return score_match(
+        resume["skills"],
+        resume["experience"]["years"],
+        job["skills"],
+        job["experience"]["years"],
+    )
+
+def score_many(resume_texts, job_text):
+    """calculate_match for many resumes against one JD; the JD is analyzed once."""
+    job = analyze_text(job_text)
+    results = []
+    for resume_text in resume_texts:
+        resume = analyze_text(resume_text)
+        results.append(score_match(
+            resume["skills"],
+            resume["experience"]["years"],
+            job["skills"],
+            job["experience"]["years"],
+        ))
+    return results
+
+def analyze_file(path):
+    """Parse and analyze one resume file; runs in the GUI's worker processes, so it returns plain data."""
+    st = os.stat(path)
+    text = extract_resume_text(path)
+    return {"text": text, "analysis": analyze_text(text), "mtime": st.st_mtime, "size": st.st_size}
+
+def score_match(resume_skills, resume_exp, job_skills, job_exp):
+    """Score already extracted skills/experience (used by calculate_match and the resume index)."""
+    resume_skills = set(resume_skills)
+    job_skills = set(job_skills)
 
     matched = resume_skills.intersection(job_skills)
-    missing = resume_skills - job_skills
+    missing = job_skills - resume_skills
 
     # --- Skill score ---
-    skill_score = (len(matched) / len(job_skills)) * 100
-
-    # --- Experience extraction ---
-    resume_exp = extract_experience_years(resume_text)
-    job_exp = extract_experience_years(job_text)
+    skill_score = (len(matched) / len(job_skills)) * 100 if job_skills else 0
 
     # --- Experience score ---
     if job_exp == 0:
@@ -25,7 +62,7 @@ def calculate_match(resume_text, job_text):
         exp_score = (resume_exp / job_exp) * 100
 
     # --- Final weighted score ---
-    final_score = round((0.3 * skill_score) + (0.7 * exp_score), 2)
+    final_score = round((SKILL_WEIGHT * skill_score) + (EXPERIENCE_WEIGHT * exp_score), 2)
 
     explanation = {
         "matched_skills": list(matched),
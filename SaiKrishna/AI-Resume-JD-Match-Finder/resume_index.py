@@ -0,0 +1,456 @@
+"""
+Persistent local index of ingested resumes (SQLite).
+
+    python resume_index.py ingest resumes/ more/cv.pdf
+    python resume_index.py search "docker AND aws" --min-years 3 -k 10
+    python resume_index.py search "python OR java AND NOT php" --jd jd.txt
+
+Tables:
+- resumes:        one row per file, with its extracted experience years
+- resume_skills:  inverted index skill -> resume ids (primary key on (skill, resume_id))
+- resume_text:    FTS5 full-text index of the resume text, when SQLite has FTS5
+
+Skill queries are boolean expressions (AND, OR, NOT, parentheses, quoted or
+bare multi-word skills) translated to INTERSECT / UNION / EXCEPT over the
+inverted index. Matches are ranked in SQL with the same formula as
+matcher.score_match, so no resume is re-parsed at query time.
+"""
+import argparse
+import os
+import re
+import sqlite3
+import time
+
+from experience_extractor import analyze_text
+from matcher import EXPERIENCE_WEIGHT, SKILL_WEIGHT, score_match
+from resume_parser import extract_resume_text
+from skill_extractor import get_skill_trie
+
+DEFAULT_INDEX_PATH = os.getenv("RESUME_INDEX", "resume_index.db")
+RESUME_EXTENSIONS = (".pdf", ".docx")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resumes (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime REAL,
+    size INTEGER,
+    experience_years REAL NOT NULL DEFAULT 0,
+    added_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS resumes_experience ON resumes(experience_years);
+CREATE TABLE IF NOT EXISTS resume_skills (
+    skill TEXT NOT NULL,
+    resume_id INTEGER NOT NULL REFERENCES resumes(id) ON DELETE CASCADE,
+    PRIMARY KEY (skill, resume_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS resume_skills_by_resume ON resume_skills(resume_id);
+"""
+
+
+# ---------------- QUERY PARSING ----------------
+QUERY_TOKEN_RE = re.compile(r'"([^"]+)"|(\()|(\))|([^\s()"]+)')
+OPERATORS = {"AND", "OR", "NOT"}
+
+
+def tokenize_query(query):
+    """Operators, parentheses and skill phrases; consecutive bare words form one phrase."""
+    tokens, phrase = [], []
+
+    def flush():
+        if phrase:
+            tokens.append(("SKILL", " ".join(phrase)))
+            phrase.clear()
+
+    for quoted, lparen, rparen, word in QUERY_TOKEN_RE.findall(query):
+        if quoted:
+            flush()
+            tokens.append(("SKILL", quoted))
+        elif lparen or rparen:
+            flush()
+            tokens.append((lparen or rparen, None))
+        elif word.upper() in OPERATORS:
+            flush()
+            tokens.append((word.upper(), None))
+        else:
+            phrase.append(word)
+    flush()
+    return tokens
+
+
+# experience part of matcher.score_match; params: job years, job years, job years or 1
+_EXPERIENCE_SCORE = f"""{EXPERIENCE_WEIGHT} * (CASE
+    WHEN ? = 0 OR r.experience_years >= ? THEN 100.0
+    ELSE r.experience_years * 100.0 / ? END)"""
+
+
+def canonical_skill(phrase):
+    """Map a query phrase to its taxonomy ID, e.g. "k8s" -> "kubernetes"."""
+    found = get_skill_trie().find(phrase)
+    return found[0] if len(found) == 1 else phrase.lower()
+
+
+class QueryParser:
+    """
+    expr := term (OR term)*
+    term := factor ((AND)? factor)*
+    factor := NOT factor | "(" expr ")" | SKILL
+
+    parse() builds (sql, params, positive_skills) where sql selects resume_id;
+    predicate() gives the same query as a per-row condition, for checking a
+    few rows without materializing the whole match set.
+    """
+
+    def __init__(self, query):
+        self.tokens = tokenize_query(query)
+        self.pos = 0
+        self.skills = []
+        self.negation_depth = 0
+        self.tree = None
+
+    def parse(self):
+        self.tree = self.expr()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Unexpected {self.tokens[self.pos][0]!r} in skill query")
+        sql, params = _to_sql(self.tree)
+        return sql, params, self.skills
+
+    def predicate(self, column):
+        """(condition, params) true for rows whose resume id in `column` matches the query."""
+        return _to_predicate(self.tree, column)
+
+    def peek(self):
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def take(self, kind):
+        if self.peek() != kind:
+            raise ValueError(f"Expected {kind!r} in skill query")
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def expr(self):
+        node = self.term()
+        while self.peek() == "OR":
+            self.take("OR")
+            node = ("OR", node, self.term())
+        return node
+
+    def term(self):
+        node = self.factor()
+        while self.peek() in ("AND", "NOT", "SKILL", "("):
+            if self.peek() == "AND":
+                self.take("AND")
+            if self.peek() == "NOT":
+                # "a AND NOT b" -> a EXCEPT b
+                self.take("NOT")
+                node = ("EXCEPT", node, self.negated_factor())
+            else:
+                node = ("AND", node, self.factor())
+        return node
+
+    def negated_factor(self):
+        # skills under NOT are filters only, they don't count towards the ranking
+        self.negation_depth += 1
+        try:
+            return self.factor()
+        finally:
+            self.negation_depth -= 1
+
+    def factor(self):
+        kind = self.peek()
+        if kind == "NOT":
+            self.take("NOT")
+            return ("NOT", self.negated_factor())
+        if kind == "(":
+            self.take("(")
+            node = self.expr()
+            self.take(")")
+            return node
+        if kind == "SKILL":
+            skill = canonical_skill(self.take("SKILL")[1])
+            if not self.negation_depth:
+                self.skills.append(skill)
+            return ("SKILL", skill)
+        raise ValueError("Incomplete skill query")
+
+
+_SET_OPS = {"OR": "UNION", "AND": "INTERSECT", "EXCEPT": "EXCEPT"}
+_ROW_OPS = {"OR": "({} OR {})", "AND": "({} AND {})", "EXCEPT": "({} AND NOT {})"}
+
+
+def _to_sql(node):
+    kind = node[0]
+    if kind == "SKILL":
+        return "SELECT resume_id FROM resume_skills WHERE skill = ?", [node[1]]
+    if kind == "NOT":
+        inner, params = _to_sql(node[1])
+        return _compound("SELECT id AS resume_id FROM resumes", "EXCEPT", inner), params
+    left, left_params = _to_sql(node[1])
+    right, right_params = _to_sql(node[2])
+    return _compound(left, _SET_OPS[kind], right), left_params + right_params
+
+
+def _to_predicate(node, column):
+    kind = node[0]
+    if kind == "SKILL":
+        return f"EXISTS (SELECT 1 FROM resume_skills WHERE skill = ? AND resume_id = {column})", [node[1]]
+    if kind == "NOT":
+        inner, params = _to_predicate(node[1], column)
+        return f"NOT {inner}", params
+    left, left_params = _to_predicate(node[1], column)
+    right, right_params = _to_predicate(node[2], column)
+    return _ROW_OPS[kind].format(left, right), left_params + right_params
+
+
+def _compound(left, op, right):
+    return f"SELECT resume_id FROM ({left}) {op} SELECT resume_id FROM ({right})"
+
+
+# ---------------- INDEX ----------------
+class ResumeIndex:
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+        try:
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS resume_text USING fts5(text)"
+            )
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.has_fts = False  # SQLite built without FTS5
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+    # -------- ingestion --------
+    def is_current(self, path):
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        row = self.conn.execute(
+            "SELECT mtime, size FROM resumes WHERE path = ?", (path,)
+        ).fetchone()
+        return row is not None and row[0] == st.st_mtime and row[1] == st.st_size
+
+    def add_resume(self, path, text, skills=None, years=None, mtime=None, size=None, commit=True):
+        """Insert or replace one resume; skills/years are extracted from text when not given."""
+        if skills is None or years is None:
+            analysis = analyze_text(text)
+            skills = analysis["skills"] if skills is None else skills
+            years = analysis["experience"]["years"] if years is None else years
+
+        cur = self.conn.execute(
+            """INSERT INTO resumes (path, mtime, size, experience_years, added_at)
+               VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(path) DO UPDATE SET
+                   mtime = excluded.mtime, size = excluded.size,
+                   experience_years = excluded.experience_years, added_at = excluded.added_at
+               RETURNING id""",
+            (path, mtime, size, years, time.time()),
+        )
+        resume_id = cur.fetchone()[0]
+
+        self.conn.execute("DELETE FROM resume_skills WHERE resume_id = ?", (resume_id,))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO resume_skills (skill, resume_id) VALUES (?, ?)",
+            [(skill, resume_id) for skill in set(skills)],
+        )
+        if self.has_fts:
+            self.conn.execute("DELETE FROM resume_text WHERE rowid = ?", (resume_id,))
+            self.conn.execute("INSERT INTO resume_text (rowid, text) VALUES (?, ?)", (resume_id, text))
+        if commit:
+            self.conn.commit()
+        return resume_id
+
+    def add_file(self, path, force=False, commit=True):
+        """Parse and index one resume file. Returns its id, or None if unchanged since last time."""
+        path = os.path.abspath(path)
+        if not force and self.is_current(path):
+            return None
+        st = os.stat(path)
+        text = extract_resume_text(path)
+        return self.add_resume(path, text, mtime=st.st_mtime, size=st.st_size, commit=commit)
+
+    def add_files(self, paths, force=False, batch_size=200):
+        """Index many files, committing every `batch_size`. Returns (added, skipped)."""
+        added = skipped = 0
+        for path in paths:
+            if self.add_file(path, force=force, commit=False) is None:
+                skipped += 1
+            else:
+                added += 1
+                if added % batch_size == 0:
+                    self.conn.commit()
+        self.conn.commit()
+        return added, skipped
+
+    def remove(self, path):
+        path = os.path.abspath(path)
+        row = self.conn.execute("SELECT id FROM resumes WHERE path = ?", (path,)).fetchone()
+        if row:
+            if self.has_fts:
+                self.conn.execute("DELETE FROM resume_text WHERE rowid = ?", row)
+            self.conn.execute("DELETE FROM resumes WHERE id = ?", row)
+            self.conn.commit()
+
+    # -------- search --------
+    def search(self, query="", min_years=0, job_text=None, k=10, text_query=None):
+        """
+        Top-k resumes matching the boolean skill `query`, with at least
+        `min_years` of experience and optionally an FTS5 `text_query`.
+
+        Ranked by the calculate_match score against `job_text` when given,
+        otherwise against a job made of the query's positive skills and
+        `min_years`. Returns [(score, path, explanation)].
+        """
+        # the same filters twice: as set membership for the full ranking, and
+        # as per-row conditions for the prefilter, which only looks at a few rows
+        where, params_where = ["r.experience_years >= ?"], [min_years]
+        row_where, params_row_where = ["r.experience_years >= ?"], [min_years]
+
+        positive_skills = []
+        if query.strip():
+            parser = QueryParser(query)
+            cand_sql, cand_params, positive_skills = parser.parse()
+            where.append(f"r.id IN ({cand_sql})")
+            params_where += cand_params
+            predicate, predicate_params = parser.predicate("r.id")
+            row_where.append(predicate)
+            params_row_where += predicate_params
+        if text_query:
+            if not self.has_fts:
+                raise RuntimeError("Full-text search needs SQLite with FTS5")
+            for conditions, params in ((where, params_where), (row_where, params_row_where)):
+                conditions.append("r.id IN (SELECT rowid FROM resume_text WHERE resume_text MATCH ?)")
+                params.append(text_query)
+
+        if job_text:
+            job = analyze_text(job_text)
+            job_skills, job_exp = job["skills"], job["experience"]["years"]
+        else:
+            job_skills = list(dict.fromkeys(positive_skills))
+            job_exp = min_years
+
+        rows = None
+        if job_skills:
+            rows = self._top_with_all_skills(job_skills, job_exp, row_where, params_row_where, k)
+        if rows is None:
+            placeholders = ",".join("?" * len(job_skills)) or "NULL"
+            sql = f"""
+                SELECT r.id, r.path, r.experience_years,
+                    {SKILL_WEIGHT} * (
+                        SELECT COUNT(*) FROM resume_skills s
+                        WHERE s.resume_id = r.id AND s.skill IN ({placeholders})
+                    ) * 100.0 / ?
+                    + {_EXPERIENCE_SCORE} AS score
+                FROM resumes r
+                WHERE {" AND ".join(where)}
+                ORDER BY score DESC, r.id
+                LIMIT ?
+            """
+            params = (
+                list(job_skills)
+                + [max(len(job_skills), 1), job_exp, job_exp, job_exp or 1]
+                + params_where
+                + [k]
+            )
+            rows = self.conn.execute(sql, params).fetchall()
+
+        results = []
+        for resume_id, path, years, _ in rows:
+            skills = [s for (s,) in self.conn.execute(
+                "SELECT skill FROM resume_skills WHERE resume_id = ?", (resume_id,)
+            )]
+            score, explanation = score_match(skills, years, job_skills, job_exp)
+            results.append((score, path, explanation))
+        return results
+
+    def _top_with_all_skills(self, job_skills, job_exp, where, params_where, k):
+        """
+        Top-k prefilter: the best k resumes among those holding every job
+        skill, walked from the first skill's postings with index probes for
+        the rest. Returns None when that is not provably the overall top-k
+        (fewer than k such resumes, or one missing a skill could still score
+        higher), and the caller ranks every match instead.
+        """
+        others = " AND ".join(
+            ["EXISTS (SELECT 1 FROM resume_skills t WHERE t.skill = ? AND t.resume_id = s.resume_id)"]
+            * (len(job_skills) - 1)
+        ) or "1"
+        # CROSS JOIN keeps the posting list as the outer loop
+        sql = f"""
+            SELECT r.id, r.path, r.experience_years, {SKILL_WEIGHT} * 100.0 + {_EXPERIENCE_SCORE} AS score
+            FROM resume_skills s CROSS JOIN resumes r ON r.id = s.resume_id
+            WHERE s.skill = ? AND {others} AND {" AND ".join(where)}
+            ORDER BY score DESC, r.id
+            LIMIT ?
+        """
+        params = [job_exp, job_exp, job_exp or 1] + list(job_skills) + params_where + [k]
+        rows = self.conn.execute(sql, params).fetchall()
+        # best possible score of a resume with one job skill fewer
+        bound = SKILL_WEIGHT * 100.0 * (len(job_skills) - 1) / len(job_skills) + EXPERIENCE_WEIGHT * 100.0
+        if len(rows) == k and rows[-1][3] > bound:
+            return rows
+        return None
+
+
+# ---------------- CLI ----------------
+def _expand(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, _, names in os.walk(path):
+                for name in sorted(names):
+                    if name.lower().endswith(RESUME_EXTENSIONS):
+                        yield os.path.join(dirpath, name)
+        else:
+            yield path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resume index")
+    parser.add_argument("--db", default=DEFAULT_INDEX_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="index resume files or folders (unchanged files are skipped)")
+    ingest.add_argument("paths", nargs="+")
+    ingest.add_argument("--force", action="store_true")
+
+    search = sub.add_parser("search", help='e.g. "docker AND aws" --min-years 3')
+    search.add_argument("query", nargs="?", default="")
+    search.add_argument("--min-years", type=float, default=0)
+    search.add_argument("--jd", help="rank against this job description file")
+    search.add_argument("--text", help="FTS5 full-text filter")
+    search.add_argument("-k", type=int, default=10)
+
+    args = parser.parse_args()
+    index = ResumeIndex(args.db)
+
+    if args.command == "ingest":
+        started = time.perf_counter()
+        added, skipped = index.add_files(_expand(args.paths), force=args.force)
+        print(f"indexed {added}, unchanged {skipped}, total {len(index)} in {time.perf_counter() - started:.1f}s")
+    else:
+        job_text = None
+        if args.jd:
+            with open(args.jd, encoding="utf-8") as f:
+                job_text = f.read()
+        started = time.perf_counter()
+        results = index.search(args.query, args.min_years, job_text, args.k, args.text)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        for score, path, explanation in results:
+            print(f"{score:6.2f}%  {explanation['resume_experience']:>4} yrs  {path}")
+        print(f"{len(results)} result(s) in {elapsed_ms:.1f} ms")
+
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
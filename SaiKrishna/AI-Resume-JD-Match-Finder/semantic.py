@@ -0,0 +1,284 @@
+"""
+Optional semantic resume/JD matching.
+
+    pip install sentence-transformers hnswlib   # hnswlib is optional
+    python semantic.py build                     # embed resumes already in resume_index.db
+    python semantic.py match jd.txt -k 10
+
+Texts are embedded with a small CPU sentence-embedding model. Long texts
+are split into word windows, encoded in batches and mean-pooled.
+Resume vectors live in an HNSW index (hnswlib) keyed by resume_index ids;
+without hnswlib an exact numpy inner-product search is used instead.
+The final score blends cosine similarity with the existing skill and
+experience score (matcher.score_match).
+"""
+import argparse
+import json
+import os
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from experience_extractor import analyze_text
+from matcher import score_match
+
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+DEFAULT_SEMANTIC_DIR = os.getenv("SEMANTIC_INDEX", "semantic_index")
+
+# share of the final score taken by semantic similarity; the rest is score_match
+SEMANTIC_WEIGHT = 0.4
+WINDOW_WORDS = 200
+BATCH_SIZE = 32
+
+
+# ---------------- EMBEDDING ----------------
+@lru_cache(maxsize=None)
+def load_encoder():
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError(
+            "Semantic matching needs sentence-transformers: pip install sentence-transformers"
+        ) from None
+    return SentenceTransformer(EMBEDDING_MODEL, device="cpu")
+
+
+def _windows(text):
+    words = text.split()
+    if not words:
+        return [""]
+    return [" ".join(words[i:i + WINDOW_WORDS]) for i in range(0, len(words), WINDOW_WORDS)]
+
+
+def embed_texts(texts, batch_size=BATCH_SIZE):
+    """Unit-length float32 vectors, one per text; all windows go through one batched encode."""
+    windows, owners = [], []
+    for i, text in enumerate(texts):
+        for window in _windows(text):
+            windows.append(window)
+            owners.append(i)
+
+    window_vecs = load_encoder().encode(
+        windows, batch_size=batch_size, normalize_embeddings=True,
+        convert_to_numpy=True, show_progress_bar=False,
+    ).astype(np.float32)
+
+    vectors = np.zeros((len(texts), window_vecs.shape[1]), dtype=np.float32)
+    np.add.at(vectors, np.asarray(owners), window_vecs)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def similarity(text_a, text_b):
+    a, b = embed_texts([text_a, text_b])
+    return float(np.dot(a, b))
+
+
+def blend(match_score, cosine):
+    """Blend a score_match percentage with cosine similarity (clipped to 0..1)."""
+    semantic_score = max(0.0, min(1.0, cosine)) * 100
+    return round(SEMANTIC_WEIGHT * semantic_score + (1 - SEMANTIC_WEIGHT) * match_score, 2)
+
+
+def semantic_match(resume_text, job_text):
+    """calculate_match with the semantic component blended in."""
+    resume, job = analyze_text(resume_text), analyze_text(job_text)
+    match_score, explanation = score_match(
+        resume["skills"], resume["experience"]["years"],
+        job["skills"], job["experience"]["years"],
+    )
+    cosine = similarity(resume_text, job_text)
+    explanation["semantic_similarity"] = round(cosine, 4)
+    explanation["skill_experience_score"] = match_score
+    return blend(match_score, cosine), explanation
+
+
+# ---------------- ANN INDEX ----------------
+class VectorIndex:
+    """
+    Inner-product index over unit vectors keyed by integer ids.
+    HNSW when hnswlib is installed, exact numpy search otherwise.
+    `versions` records which resume version (added_at) each vector was built from.
+    """
+
+    def __init__(self, directory=DEFAULT_SEMANTIC_DIR, dim=None):
+        self.directory = directory
+        self.meta_path = os.path.join(directory, "meta.json")
+        self.dim = dim
+        self.versions = {}
+        self.hnsw = None
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.vectors = None
+
+        try:
+            import hnswlib
+        except ImportError:
+            hnswlib = None
+        self._hnswlib = hnswlib
+
+        if os.path.exists(self.meta_path):
+            self._load()
+
+    @property
+    def backend(self):
+        return "hnsw" if self._hnswlib else "exact"
+
+    def __len__(self):
+        return len(self.versions)
+
+    def _load(self):
+        with open(self.meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        self.dim = meta["dim"]
+        self.versions = {int(k): v for k, v in meta["versions"].items()}
+        if not self.versions:
+            return  # saved before anything was embedded, so there are no data files
+        if meta["backend"] == "hnsw":
+            if not self._hnswlib:
+                raise ImportError("This semantic index was built with hnswlib: pip install hnswlib")
+            self.hnsw = self._hnswlib.Index(space="ip", dim=self.dim)
+            self.hnsw.load_index(os.path.join(self.directory, "hnsw.bin"), max_elements=meta["capacity"])
+            self.hnsw.set_ef(64)
+        else:
+            data = np.load(os.path.join(self.directory, "vectors.npz"))
+            self.ids, self.vectors = data["ids"], data["vectors"]
+            self._hnswlib = None  # stay on the backend the files were written with
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        meta = {"dim": self.dim, "backend": self.backend, "model": EMBEDDING_MODEL,
+                "versions": self.versions, "capacity": 0}
+        if self.hnsw is not None:
+            self.hnsw.save_index(os.path.join(self.directory, "hnsw.bin"))
+            meta["capacity"] = self.hnsw.get_max_elements()
+        elif self.vectors is not None:
+            np.savez(os.path.join(self.directory, "vectors.npz"), ids=self.ids, vectors=self.vectors)
+        with open(self.meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    def add(self, ids, vectors, versions):
+        ids = np.asarray(ids, dtype=np.int64)
+        self.dim = self.dim or vectors.shape[1]
+        if self._hnswlib:
+            if self.hnsw is None:
+                self.hnsw = self._hnswlib.Index(space="ip", dim=self.dim)
+                self.hnsw.init_index(max_elements=max(1024, 2 * len(ids)), ef_construction=200, M=16)
+                self.hnsw.set_ef(64)
+            needed = self.hnsw.get_current_count() + len(ids)
+            if needed > self.hnsw.get_max_elements():
+                self.hnsw.resize_index(2 * needed)
+            # an existing label is updated in place
+            self.hnsw.add_items(vectors, ids)
+        else:
+            keep = ~np.isin(self.ids, ids)
+            old = self.vectors[keep] if self.vectors is not None else np.zeros((0, self.dim), np.float32)
+            self.ids = np.concatenate([self.ids[keep], ids])
+            self.vectors = np.vstack([old, vectors]).astype(np.float32)
+        self.versions.update({int(i): v for i, v in zip(ids, versions)})
+
+    def search(self, vector, k=10):
+        """[(id, cosine)] of the k nearest vectors."""
+        if not self.versions:
+            return []
+        k = min(k, len(self.versions))
+        if self.hnsw is not None:
+            labels, distances = self.hnsw.knn_query(vector, k=k)
+            # hnswlib "ip" distance is 1 - inner product
+            return [(int(i), float(1 - d)) for i, d in zip(labels[0], distances[0])]
+        scores = self.vectors @ vector
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(self.ids[i]), float(scores[i])) for i in top]
+
+
+# ---------------- RESUME INDEX INTEGRATION ----------------
+def build(resume_index, vector_index, batch_size=BATCH_SIZE):
+    """Embed resumes that are new or changed since they were last embedded."""
+    if not resume_index.has_fts:
+        raise RuntimeError("Semantic index needs the resume text stored in the FTS5 table")
+
+    rows = resume_index.conn.execute(
+        "SELECT r.id, r.added_at, t.text FROM resumes r JOIN resume_text t ON t.rowid = r.id"
+    ).fetchall()
+    todo = [row for row in rows if vector_index.versions.get(row[0]) != row[1]]
+
+    # encode in slices so very large pools don't hold every window at once
+    step = batch_size * 32
+    for start in range(0, len(todo), step):
+        chunk = todo[start:start + step]
+        vectors = embed_texts([text for _, _, text in chunk], batch_size)
+        vector_index.add([i for i, _, _ in chunk], vectors, [added for _, added, _ in chunk])
+    if todo:
+        vector_index.save()
+    return len(todo)
+
+
+def match_job(job_text, resume_index, vector_index, k=10, candidates=100):
+    """
+    Top-k resumes for a JD: ANN retrieval of `candidates` by similarity,
+    then re-ranked by the blended semantic + skill + experience score.
+    Returns [(score, path, explanation)].
+    """
+    job_vec = embed_texts([job_text])[0]
+    job = analyze_text(job_text)
+    job_skills, job_exp = job["skills"], job["experience"]["years"]
+
+    results = []
+    for resume_id, cosine in vector_index.search(job_vec, candidates):
+        row = resume_index.conn.execute(
+            "SELECT path, experience_years FROM resumes WHERE id = ?", (resume_id,)
+        ).fetchone()
+        if row is None:
+            continue  # removed from the resume index since it was embedded
+        skills = [s for (s,) in resume_index.conn.execute(
+            "SELECT skill FROM resume_skills WHERE resume_id = ?", (resume_id,)
+        )]
+        match_score, explanation = score_match(skills, row[1], job_skills, job_exp)
+        explanation["semantic_similarity"] = round(cosine, 4)
+        explanation["skill_experience_score"] = match_score
+        results.append((blend(match_score, cosine), row[0], explanation))
+
+    results.sort(key=lambda r: -r[0])
+    return results[:k]
+
+
+# ---------------- CLI ----------------
+def main():
+    from resume_index import DEFAULT_INDEX_PATH, ResumeIndex
+
+    parser = argparse.ArgumentParser(description="Semantic resume matching")
+    parser.add_argument("--db", default=DEFAULT_INDEX_PATH)
+    parser.add_argument("--dir", default=DEFAULT_SEMANTIC_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="embed new/changed resumes from the resume index")
+    match = sub.add_parser("match", help="top-k resumes for a job description file")
+    match.add_argument("jd")
+    match.add_argument("-k", type=int, default=10)
+    match.add_argument("--candidates", type=int, default=100)
+    args = parser.parse_args()
+
+    resume_index = ResumeIndex(args.db)
+    vector_index = VectorIndex(args.dir)
+
+    if args.command == "build":
+        started = time.perf_counter()
+        added = build(resume_index, vector_index)
+        print(f"embedded {added} resume(s) in {time.perf_counter() - started:.1f}s, "
+              f"{len(vector_index)} in the {vector_index.backend} index")
+    else:
+        with open(args.jd, encoding="utf-8") as f:
+            job_text = f.read()
+        load_encoder()
+        started = time.perf_counter()
+        results = match_job(job_text, resume_index, vector_index, args.k, args.candidates)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        for score, path, explanation in results:
+            print(f"{score:6.2f}%  sim {explanation['semantic_similarity']:.3f}  {path}")
+        print(f"{len(results)} result(s) in {elapsed_ms:.1f} ms ({vector_index.backend})")
+
+    resume_index.close()
+
+
+if __name__ == "__main__":
+    main()
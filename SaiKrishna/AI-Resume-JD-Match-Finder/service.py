@@ -0,0 +1,260 @@
+"""
+Headless HTTP scoring service (no Tk).
+
+    pip install flask
+    python service.py --port 8000 --workers 4
+
+    POST /score          multipart: resume=<file>, job_description=<text>
+                         or JSON:   {"resume_text": ..., "job_description": ...}
+    POST /score/batch    multipart: resumes=<file> (repeated), job_description=<text>
+                         or JSON:   {"job_description": ..., "resumes": [{"name": ..., "text": ...}]}
+    GET  /health
+
+Client mistakes get a JSON error: 400 for a malformed request, 422 when an
+uploaded resume can't be parsed. In a batch, unreadable files and files of
+an unsupported type are listed under "errors" and the rest are still scored.
+
+Resume parsing (pdfminer / python-docx) is CPU bound, so uploads go to a
+process pool; scoring itself is cheap and runs in the request thread.
+Every response carries a Server-Timing header (parse / score / total ms).
+The Tk app and this service share the same core: resume_parser + matcher.
+"""
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from flask import Flask, g, jsonify, request
+
+from matcher import calculate_match, score_many
+from resume_parser import extract_resume_text
+from skill_extractor import get_skill_trie
+
+ALLOWED_EXTENSIONS = {".pdf", ".docx"}
+MAX_UPLOAD_MB = int(os.getenv("SCORING_MAX_UPLOAD_MB", "10"))
+PARSE_WORKERS = int(os.getenv("SCORING_WORKERS", str(os.cpu_count() or 1)))
+
+app = Flask(__name__)
+app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_MB * 1024 * 1024
+log = logging.getLogger("scoring")
+
+_pool = None
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+    return _pool
+
+
+class BadRequest(Exception):
+    status = 400
+
+
+class UnreadableResume(BadRequest):
+    status = 422
+
+
+# ---------------- TIMING ----------------
+class timed:
+    """Adds the elapsed ms of a block to g.timings[name]."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc):
+        elapsed = (time.perf_counter() - self.started) * 1000
+        g.timings[self.name] = g.timings.get(self.name, 0.0) + elapsed
+
+
+@app.before_request
+def start_timer():
+    g.started = time.perf_counter()
+    g.timings = {}
+
+
+@app.after_request
+def add_timing(response):
+    total = (time.perf_counter() - g.started) * 1000
+    parts = [f"{name};dur={ms:.2f}" for name, ms in g.timings.items()]
+    parts.append(f"total;dur={total:.2f}")
+    response.headers["Server-Timing"] = ", ".join(parts)
+    log.info("%s %s %s %.1fms", request.method, request.path, response.status_code, total)
+    return response
+
+
+@app.errorhandler(BadRequest)
+def bad_request(error):
+    return jsonify(error=str(error)), error.status
+
+
+@app.errorhandler(413)
+def too_large(error):
+    return jsonify(error=f"upload larger than {MAX_UPLOAD_MB} MB"), 413
+
+
+# ---------------- PARSING ----------------
+def _extension(upload):
+    return os.path.splitext(upload.filename or "")[1].lower()
+
+
+def _unsupported(upload):
+    """Why the upload can't be a resume going by its extension, or None."""
+    ext = _extension(upload)
+    if ext not in ALLOWED_EXTENSIONS:
+        return f"unsupported resume type {ext or '(none)'}; use PDF or DOCX"
+    return None
+
+
+def _save_upload(upload, directory):
+    ext = _extension(upload)
+    fd, path = tempfile.mkstemp(suffix=ext, dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        shutil.copyfileobj(upload.stream, f)
+    return path
+
+
+def _parse(path):
+    """(text, None), or (None, reason) when the file is corrupt or not what its extension says."""
+    try:
+        return extract_resume_text(path), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+
+
+def parse_uploads(uploads):
+    """
+    [(text, error)] for the uploaded files, in upload order. Files of a
+    supported type are parsed in the process pool; the rest get an error
+    without being read.
+    """
+    results = [(None, _unsupported(upload)) for upload in uploads]
+    readable = [i for i, (_, error) in enumerate(results) if error is None]
+    if not readable:
+        return results
+    directory = tempfile.mkdtemp(prefix="resume-upload-")
+    try:
+        paths = [_save_upload(uploads[i], directory) for i in readable]
+        with timed("parse"):
+            for i, parsed in zip(readable, get_pool().map(_parse, paths)):
+                results[i] = parsed
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return results
+
+
+def _json_body():
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        raise BadRequest("request body must be a JSON object")
+    return data
+
+
+def _string(value, field):
+    """A text field of the request body; missing or null counts as empty."""
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        raise BadRequest(f"{field} must be a string")
+    return value
+
+
+def _job_description(data):
+    job_text = _string(data.get("job_description"), "job_description").strip()
+    if not job_text:
+        raise BadRequest("job_description is required")
+    return job_text
+
+
+def _result(name, score, explanation):
+    return {"name": name, "score": score, **explanation}
+
+
+# ---------------- ROUTES ----------------
+@app.get("/health")
+def health():
+    return jsonify(status="ok", parse_workers=PARSE_WORKERS)
+
+
+@app.post("/score")
+def score():
+    if request.is_json:
+        data = _json_body()
+        resume_text, name = _string(data.get("resume_text"), "resume_text"), data.get("name")
+    else:
+        data = request.form
+        upload = request.files.get("resume")
+        if upload is None:
+            raise BadRequest("resume file or resume_text is required")
+        error = _unsupported(upload)
+        if error:
+            raise BadRequest(error)
+        (resume_text, error), = parse_uploads([upload])
+        if error:
+            raise UnreadableResume(f"could not read {upload.filename}: {error}")
+        name = upload.filename
+    job_text = _job_description(data)
+
+    with timed("score"):
+        final_score, explanation = calculate_match(resume_text, job_text)
+    return jsonify(_result(name, final_score, explanation))
+
+
+@app.post("/score/batch")
+def score_batch():
+    errors = []
+    if request.is_json:
+        data = _json_body()
+        resumes = data.get("resumes") or []
+        if not isinstance(resumes, list) or not all(isinstance(r, dict) for r in resumes):
+            raise BadRequest("resumes must be a list of {name, text} objects")
+        names = [r.get("name") for r in resumes]
+        texts = [_string(r.get("text"), f"resumes[{i}].text") for i, r in enumerate(resumes)]
+    else:
+        data = request.form
+        uploads = request.files.getlist("resumes")
+        names, texts = [], []
+        for upload, (text, error) in zip(uploads, parse_uploads(uploads)):
+            if error:
+                errors.append({"name": upload.filename, "error": error})
+            else:
+                names.append(upload.filename)
+                texts.append(text)
+    job_text = _job_description(data)
+    if not texts:
+        if errors:
+            raise UnreadableResume("none of the uploaded resumes could be read")
+        raise BadRequest("at least one resume is required")
+
+    with timed("score"):
+        scored = score_many(texts, job_text)
+    results = [_result(name, s, e) for name, (s, e) in zip(names, scored)]
+    results.sort(key=lambda r: -r["score"])
+    return jsonify(results=results, errors=errors)
+
+
+def main():
+    global PARSE_WORKERS
+    parser = argparse.ArgumentParser(description="Resume/JD scoring service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=PARSE_WORKERS, help="parser processes")
+    args = parser.parse_args()
+
+    PARSE_WORKERS = args.workers
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    # warm up before the first request: worker processes and the skill trie
+    get_pool()
+    get_skill_trie()
+    app.run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
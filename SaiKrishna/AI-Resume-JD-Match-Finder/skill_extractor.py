@@ -1,32 +1,20 @@
-import re
+import os
 
-SKILLS = [
-    # Programming
-    "c", "c++", "c#", "javascript",
+from skill_taxonomy import load_trie
 
-    # Data / Analytics
-    "pandas", "numpy", "data analysis", "data visualization",
-    "machine learning", "deep learning",
+# canonical skills and their aliases; point SKILL_TAXONOMY at a bigger JSON/CSV in production
+SKILLS_FILE = os.getenv(
+    "SKILL_TAXONOMY",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills.json")
+)
 
-    # Databases
-    "sql", "mysql", "postgresql", "mongodb",
+_trie = None
 
-    # Tools
-    "excel", "power bi", "tableau",
-
-    # Web
-    "html", "css", "react",
-
-    # Cloud / DevOps
-    "aws", "docker"
-]
+def get_skill_trie():
+    global _trie
+    if _trie is None:
+        _trie = load_trie(SKILLS_FILE)
+    return _trie
 
 def extract_skills(text):
-    found_skills = set()
-
-    for skill in SKILLS:
-        pattern = r"\b" + re.escape(skill) + r"\b"
-        if re.search(pattern, text):
-            found_skills.add(skill)
-
-    return list(found_skills)
+    return get_skill_trie().find(text)
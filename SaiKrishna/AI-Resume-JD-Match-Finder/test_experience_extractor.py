@@ -0,0 +1,16 @@
+import json
+from datetime import date
+
+import pytest
+
+from bench_experience import FIXTURES
+from experience_extractor import extract_experience_years
+
+with open(FIXTURES, encoding="utf-8") as f:
+    DATA = json.load(f)
+TODAY = date.fromisoformat(DATA["today"])
+
+
+@pytest.mark.parametrize("case", DATA["cases"], ids=lambda case: case["text"][:40])
+def test_fixture_case(case):
+    assert extract_experience_years(case["text"], today=TODAY) == pytest.approx(case["years"], abs=0.05)
@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+from resume_index import ResumeIndex
+
+SKILLS = ["python", "sql", "docker", "aws", "java", "react"]
+QUERIES = [
+    ("docker AND aws", 3),
+    ("python AND (sql OR docker) AND NOT java", 2),
+    ("react OR python", 0),
+    ("NOT java", 5),
+    ("sql", 0),
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = ResumeIndex(str(tmp_path / "index.db"))
+    rng = random.Random(0)
+    for i in range(400):
+        index.add_resume(f"/resumes/{i}.pdf", f"resume {i}", skills=rng.sample(SKILLS, rng.randint(1, 5)),
+                         years=rng.choice([0, 1, 2.5, 4, 6, 10]), commit=False)
+    index.conn.commit()
+    yield index
+    index.close()
+
+
+@pytest.mark.parametrize("query,min_years", QUERIES)
+@pytest.mark.parametrize("k", [1, 10, 1000])
+def test_prefilter_matches_full_ranking(index, monkeypatch, query, min_years, k):
+    prefiltered = index.search(query, min_years=min_years, k=k)
+    monkeypatch.setattr(index, "_top_with_all_skills", lambda *args: None)
+    assert prefiltered == index.search(query, min_years=min_years, k=k)
+
+
+def test_prefilter_answers_selective_queries(index):
+    rows = index._top_with_all_skills(["docker", "aws"], 3, ["r.experience_years >= ?"], [3], 10)
+    assert rows is not None and len(rows) == 10
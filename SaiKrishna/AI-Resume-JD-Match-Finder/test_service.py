@@ -0,0 +1,100 @@
+import io
+
+import docx
+
+from service import app
+
+JOB = "Python developer with 3+ years of SQL and Docker"
+
+
+def client():
+    return app.test_client()
+
+
+def docx_upload(text, name="good.docx"):
+    buf = io.BytesIO()
+    document = docx.Document()
+    document.add_paragraph(text)
+    document.save(buf)
+    buf.seek(0)
+    return buf, name
+
+
+def test_json_body_that_is_not_an_object_is_400():
+    for body in (["x"], "x", 3):
+        res = client().post("/score", json=body)
+        assert res.status_code == 400
+        assert "JSON object" in res.get_json()["error"]
+    assert client().post("/score/batch", json=["x"]).status_code == 400
+
+
+def test_batch_resumes_must_be_objects():
+    res = client().post("/score/batch", json={"job_description": JOB, "resumes": ["text"]})
+    assert res.status_code == 400
+
+
+def test_corrupt_pdf_is_422():
+    res = client().post("/score", data={
+        "job_description": JOB,
+        "resume": (io.BytesIO(b"%PDF-1.4 this is not really a pdf"), "broken.pdf"),
+    })
+    assert res.status_code == 422
+    assert "broken.pdf" in res.get_json()["error"]
+
+
+def test_batch_reports_unreadable_files_and_scores_the_rest():
+    res = client().post("/score/batch", data={
+        "job_description": JOB,
+        "resumes": [
+            (io.BytesIO(b"not a pdf"), "broken.pdf"),
+            docx_upload("Python and SQL developer, 4 years of Docker"),
+        ],
+    })
+    assert res.status_code == 200
+    body = res.get_json()
+    assert [r["name"] for r in body["results"]] == ["good.docx"]
+    assert [e["name"] for e in body["errors"]] == ["broken.pdf"]
+
+
+def test_batch_with_only_unreadable_files_is_422():
+    res = client().post("/score/batch", data={
+        "job_description": JOB,
+        "resumes": [(io.BytesIO(b"not a pdf"), "broken.pdf")],
+    })
+    assert res.status_code == 422
+
+
+def test_batch_reports_unsupported_files_and_scores_the_rest():
+    res = client().post("/score/batch", data={
+        "job_description": JOB,
+        "resumes": [
+            (io.BytesIO(b"plain text resume"), "notes.txt"),
+            docx_upload("Python and SQL developer, 4 years of Docker"),
+        ],
+    })
+    assert res.status_code == 200
+    body = res.get_json()
+    assert [r["name"] for r in body["results"]] == ["good.docx"]
+    assert [e["name"] for e in body["errors"]] == ["notes.txt"]
+    assert "unsupported" in body["errors"][0]["error"]
+
+
+def test_single_unsupported_file_is_400():
+    res = client().post("/score", data={
+        "job_description": JOB,
+        "resume": (io.BytesIO(b"plain text resume"), "notes.txt"),
+    })
+    assert res.status_code == 400
+
+
+def test_text_fields_must_be_strings():
+    for body in (
+        {"resume_text": ["python"], "job_description": JOB},
+        {"resume_text": "python", "job_description": 3},
+    ):
+        res = client().post("/score", json=body)
+        assert res.status_code == 400
+        assert "must be a string" in res.get_json()["error"]
+    res = client().post("/score/batch", json={"job_description": JOB, "resumes": [{"name": "a", "text": 5}]})
+    assert res.status_code == 400
+    assert "resumes[0].text" in res.get_json()["error"]
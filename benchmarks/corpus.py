@@ -0,0 +1,149 @@
+"""
+Synthetic resume / JD corpus for the benchmarks.
+
+    python benchmarks/corpus.py [--out benchmarks/corpus] [--seed 0]
+
+Writes resumes as PDF (PyMuPDF), DOCX (python-docx) and TXT at several
+sizes, plus plain-text job descriptions. The output is deterministic for a
+given seed, so timings from different commits are comparable. A manifest.json
+lists every file with its size class and format.
+"""
+import argparse
+import json
+import os
+import random
+
+# resume size classes: name -> (pages, number of files per format)
+SIZES = {
+    "small": (1, 20),
+    "medium": (5, 8),
+    "large": (25, 3),
+}
+WORDS_PER_PAGE = 450
+JOB_DESCRIPTIONS = 20
+
+SKILLS = [
+    "python", "java", "c++", "javascript", "sql", "mysql", "postgresql", "mongodb",
+    "machine learning", "deep learning", "nlp", "statistics", "data analysis",
+    "pandas", "numpy", "excel", "power bi", "tableau", "html", "css", "react",
+    "aws", "docker", "kubernetes", "k8s", "ml", "reactjs", "postgres",
+]
+FILLER = [
+    "designed", "implemented", "maintained", "reviewed", "services", "pipelines",
+    "features", "with", "the", "team", "for", "customers", "and", "reports",
+    "improved", "latency", "reliability", "across", "projects", "delivered",
+    "stakeholders", "requirements", "testing", "deployment", "documentation",
+]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def resume_text(rng, pages):
+    """Resume-like text of roughly `pages` pages: summary, dated jobs, skill-laden bullets."""
+    lines = [
+        f"Candidate {rng.randrange(10**6)}",
+        f"Summary: {rng.randint(1, 15)}+ years of experience with "
+        + ", ".join(rng.sample(SKILLS, 5)) + ".",
+    ]
+    year = rng.randint(2004, 2016)
+    words = sum(len(line.split()) for line in lines)
+    while words < pages * WORDS_PER_PAGE:
+        if rng.random() < 0.15:
+            end = year + rng.randint(1, 3)
+            line = f"Engineer, Company {rng.randrange(1000)}, {rng.choice(MONTHS)} {year} - {rng.choice(MONTHS)} {end}"
+            year = end
+        else:
+            bullet = [rng.choice(FILLER) for _ in range(rng.randint(8, 16))]
+            bullet.insert(rng.randrange(len(bullet)), rng.choice(SKILLS))
+            line = "- " + " ".join(bullet)
+        lines.append(line)
+        words += len(line.split())
+    return "\n".join(lines)
+
+
+def job_text(rng):
+    required = rng.sample(SKILLS, rng.randint(3, 8))
+    return (
+        f"We are looking for an engineer with {rng.randint(1, 8)}+ years of experience. "
+        f"Required: {', '.join(required)}. "
+        + " ".join(rng.choice(FILLER) for _ in range(rng.randint(40, 120)))
+    )
+
+
+def write_pdf(path, text):
+    import fitz
+
+    doc = fitz.open()
+    lines = text.split("\n")
+    per_page = 48
+    for start in range(0, len(lines), per_page):
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(40, 40, 555, 800), "\n".join(lines[start:start + per_page]), fontsize=9)
+    doc.save(path)
+    doc.close()
+
+
+def write_docx(path, text):
+    import docx
+
+    document = docx.Document()
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    document.save(path)
+
+
+def write_txt(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+WRITERS = {"pdf": write_pdf, "docx": write_docx, "txt": write_txt}
+
+
+def generate(out_dir, seed=0):
+    """Create the corpus (skipped if a manifest for this seed exists). Returns the manifest."""
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest["seed"] == seed and manifest["sizes"] == {k: list(v) for k, v in SIZES.items()}:
+            return manifest
+
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    resumes = []
+    for size, (pages, count) in SIZES.items():
+        for i in range(count):
+            text = resume_text(rng, pages)
+            for fmt, write in WRITERS.items():
+                name = f"resume_{size}_{i:03d}.{fmt}"
+                write(os.path.join(out_dir, name), text)
+                resumes.append({"file": name, "size": size, "format": fmt})
+
+    jobs = []
+    for i in range(JOB_DESCRIPTIONS):
+        name = f"jd_{i:03d}.txt"
+        write_txt(os.path.join(out_dir, name), job_text(rng))
+        jobs.append(name)
+
+    manifest = {
+        "seed": seed,
+        "sizes": {k: list(v) for k, v in SIZES.items()},
+        "resumes": resumes,
+        "jobs": jobs,
+    }
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--out", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus"))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    manifest = generate(args.out, args.seed)
+    print(f"{len(manifest['resumes'])} resumes and {len(manifest['jobs'])} JDs in {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Timing and memory measurement shared by the benchmark suites.
+"""
+import statistics
+import time
+import tracemalloc
+
+
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def measure(fn, inputs, repeat=3, min_time=0.5):
+    """
+    Call fn(x) for every x in inputs, `repeat` passes (more passes if a pass
+    is faster than min_time seconds), after one warm-up call.
+    Python heap peak comes from a separate tracemalloc pass so it does not
+    distort the timings.
+
+    Returns {calls, ops_per_s, mean_ms, p50_ms, p95_ms, p99_ms, peak_kb}.
+    """
+    fn(inputs[0])
+
+    latencies = []
+    elapsed = 0.0
+    passes = 0
+    while passes < repeat or elapsed < min_time:
+        for x in inputs:
+            started = time.perf_counter()
+            fn(x)
+            latency = time.perf_counter() - started
+            latencies.append(latency * 1000)
+            elapsed += latency
+        passes += 1
+
+    tracemalloc.start()
+    peak = 0
+    for x in inputs:
+        tracemalloc.reset_peak()
+        fn(x)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "calls": len(latencies),
+        "ops_per_s": round(len(latencies) / elapsed, 1),
+        "mean_ms": round(statistics.fmean(latencies), 4),
+        "p50_ms": round(percentile(latencies, 0.50), 4),
+        "p95_ms": round(percentile(latencies, 0.95), 4),
+        "p99_ms": round(percentile(latencies, 0.99), 4),
+        "peak_kb": round(peak / 1024, 1),
+    }
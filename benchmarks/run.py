@@ -0,0 +1,211 @@
+"""
+Benchmark suite for the two resume projects.
+
+    pip install pymupdf python-docx pdfminer.six
+    python benchmarks/run.py                               # full run, writes benchmarks/results.json
+    python benchmarks/run.py --quick                       # fewer inputs, one pass
+    python benchmarks/run.py --baseline old.json           # exit 1 on a regression
+    python benchmarks/run.py --only calculate_match
+
+Covers, per corpus size class (see corpus.py):
+    Nandana     extract_text (PDF), extract_skills, analyze_skills
+    SaiKrishna  extract_resume_text (PDF, DOCX), extract_skills,
+                extract_experience_years, calculate_match
+
+Both projects have modules with the same names (resume_parser, matcher,
+skill_extractor), so each project runs in its own subprocess with its
+directory on sys.path; the parent merges their JSON results.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+PROJECTS = {
+    "nandana": os.path.join(ROOT, "Nandana", "AI-resume-skill-gap-analyzer"),
+    "saikrishna": os.path.join(ROOT, "SaiKrishna", "AI-Resume-JD-Match-Finder"),
+}
+DEFAULT_CORPUS = os.path.join(BENCH_DIR, "corpus")
+DEFAULT_RESULTS = os.path.join(BENCH_DIR, "results.json")
+
+
+# ---------------- SUITES (run inside the project subprocess) ----------------
+def _corpus_files(corpus, manifest, fmt, limit):
+    files = {}
+    for entry in manifest["resumes"]:
+        if entry["format"] == fmt:
+            files.setdefault(entry["size"], []).append(os.path.join(corpus, entry["file"]))
+    return {size: paths[:limit] for size, paths in files.items()}
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def nandana_cases(corpus, manifest, limit):
+    from data.job_roles import JOB_ROLES
+    from matcher import analyze_skills
+    from resume_parser import extract_text
+    from skill_extractor import extract_skills
+
+    roles = list(JOB_ROLES)
+    for size, paths in _corpus_files(corpus, manifest, "pdf", limit).items():
+        yield f"extract_text[pdf-{size}]", extract_text, paths
+    for size, paths in _corpus_files(corpus, manifest, "txt", limit).items():
+        texts = [_read(p) for p in paths]
+        yield f"extract_skills[{size}]", extract_skills, texts
+        pairs = [(extract_skills(t), roles[i % len(roles)]) for i, t in enumerate(texts)]
+        yield f"analyze_skills[{size}]", lambda pair: analyze_skills(*pair), pairs
+
+
+def saikrishna_cases(corpus, manifest, limit):
+    from experience_extractor import extract_experience_years
+    from matcher import calculate_match
+    from resume_parser import extract_resume_text
+    from skill_extractor import extract_skills
+
+    jobs = [_read(os.path.join(corpus, name)) for name in manifest["jobs"]]
+    for fmt in ("pdf", "docx"):
+        for size, paths in _corpus_files(corpus, manifest, fmt, limit).items():
+            yield f"extract_resume_text[{fmt}-{size}]", extract_resume_text, paths
+    for size, paths in _corpus_files(corpus, manifest, "txt", limit).items():
+        texts = [_read(p) for p in paths]
+        yield f"extract_skills[{size}]", extract_skills, texts
+        yield f"extract_experience_years[{size}]", extract_experience_years, texts
+        pairs = [(t, jobs[i % len(jobs)]) for i, t in enumerate(texts)]
+        yield f"calculate_match[{size}]", lambda pair: calculate_match(*pair), pairs
+
+
+SUITES = {"nandana": nandana_cases, "saikrishna": saikrishna_cases}
+
+
+def run_project(project, corpus, quick, only, result_file):
+    """Subprocess entry: import the project's modules and write results as JSON."""
+    sys.path.insert(0, PROJECTS[project])
+    os.chdir(PROJECTS[project])
+    from harness import measure
+
+    with open(os.path.join(corpus, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    results = {}
+    limit = 3 if quick else None
+    for name, fn, inputs in SUITES[project](corpus, manifest, limit):
+        if only and not any(o in name for o in only):
+            continue
+        if quick:
+            stats = measure(fn, inputs, repeat=1, min_time=0)
+        else:
+            stats = measure(fn, inputs)
+        results[f"{project}.{name}"] = stats
+        print(f"  {project}.{name}: p50 {stats['p50_ms']} ms", flush=True)
+    with open(result_file, "w", encoding="utf-8") as f:
+        json.dump(results, f)
+
+
+# ---------------- DRIVER ----------------
+def compare(results, baseline, tolerance):
+    """Names whose p50 latency or peak memory grew by more than `tolerance`."""
+    regressions = []
+    for name, stats in results.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        for metric in ("p50_ms", "peak_kb"):
+            if old[metric] > 0 and stats[metric] > old[metric] * (1 + tolerance):
+                regressions.append((name, metric, old[metric], stats[metric]))
+    return regressions
+
+
+def print_table(results):
+    print(f"{'benchmark':52} {'ops/s':>10} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'peak KB':>10}")
+    for name, s in sorted(results.items()):
+        print(
+            f"{name:52} {s['ops_per_s']:>10} {s['p50_ms']:>10.3f} {s['p95_ms']:>10.3f} "
+            f"{s['p99_ms']:>10.3f} {s['peak_kb']:>10}"
+        )
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=DEFAULT_RESULTS)
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument("--only", nargs="*", help="substrings of benchmark names to run")
+    parser.add_argument("--projects", nargs="*", default=list(PROJECTS), choices=list(PROJECTS))
+    parser.add_argument("--baseline", help="results.json from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("--project", help=argparse.SUPPRESS)  # subprocess mode
+    args = parser.parse_args()
+
+    if args.project:
+        run_project(args.project, args.corpus, args.quick, args.only, args.out)
+        return
+
+    from corpus import generate
+
+    started = time.perf_counter()
+    generate(args.corpus, args.seed)
+    print(f"corpus ready in {time.perf_counter() - started:.1f}s ({args.corpus})")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for project in args.projects:
+            # results go through a file: imported libraries may print to stdout
+            result_file = os.path.join(tmp, f"{project}.json")
+            cmd = [
+                sys.executable, os.path.abspath(__file__), "--project", project,
+                "--corpus", os.path.abspath(args.corpus), "--out", result_file,
+            ]
+            if args.quick:
+                cmd.append("--quick")
+            if args.only:
+                cmd += ["--only", *args.only]
+            subprocess.run(cmd, check=True)
+            with open(result_file, encoding="utf-8") as f:
+                results.update(json.load(f))
+
+    print_table(results)
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "seed": args.seed,
+        "quick": args.quick,
+        "results": results,
+    }
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"wrote {args.out}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for name, metric, old, new in regressions:
+            print(f"REGRESSION {name} {metric}: {old} -> {new}")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Skill taxonomy compiled to a token trie.
+
+A taxonomy maps canonical skill IDs to their aliases, e.g.
+    {"javascript": ["js", "ecmascript"], "kubernetes": ["k8s"]}
+and is loaded from JSON or CSV. Canonical names and aliases are tokenized
+the same way as resume text and inserted into a nested-dict trie, so one
+left-to-right pass over the tokens finds every skill (longest match wins).
+
+The compiled trie is pickled next to the taxonomy file together with a
+hash of the file contents and is only rebuilt when the taxonomy changes.
+"""
+import csv
+import hashlib
+import json
+import os
+import pickle
+import re
+
+FORMAT_VERSION = b"skill-trie-v1"
+
+# keeps "c++", "c#", "node.js" and "3.5" together; splits on spaces, "/", "-", ","
+TOKEN_RE = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+
+# trie key holding the canonical ID of the phrase ending at that node
+END = ""
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+# ---------------- LOADING ----------------
+def read_taxonomy(path):
+    """
+    JSON: {"skill": ["alias", ...]}, ["skill", ...] or
+          [{"id": "skill", "aliases": [...]}, ...]
+    CSV:  columns skill,aliases with aliases separated by "|"
+    Returns {canonical_id: [aliases]}.
+    """
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            return {
+                row["skill"].strip().lower(): [
+                    a.strip() for a in (row.get("aliases") or "").split("|") if a.strip()
+                ]
+                for row in csv.DictReader(f)
+                if row.get("skill", "").strip()
+            }
+
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        return {k.lower(): list(v or []) for k, v in data.items()}
+    taxonomy = {}
+    for item in data:
+        if isinstance(item, str):
+            taxonomy[item.lower()] = []
+        else:
+            taxonomy[item["id"].lower()] = list(item.get("aliases", []))
+    return taxonomy
+
+
+def compile_trie(taxonomy):
+    """{canonical_id: [aliases]} -> nested dict trie over tokens."""
+    root = {}
+    for canonical, aliases in taxonomy.items():
+        for phrase in [canonical, *aliases]:
+            tokens = tokenize(phrase)
+            if not tokens:
+                continue
+            node = root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            # first taxonomy entry to claim an alias keeps it
+            node.setdefault(END, canonical)
+    return root
+
+
+class SkillTrie:
+    def __init__(self, root, version="", size=0):
+        self.root = root
+        self.version = version
+        self.size = size
+
+    @classmethod
+    def from_skills(cls, skills):
+        """Build from an in-memory list of names or {name: aliases} dict."""
+        taxonomy = skills if isinstance(skills, dict) else {s.lower(): [] for s in skills}
+        return cls(compile_trie(taxonomy), version="inline", size=len(taxonomy))
+
+    def find_spans(self, tokens):
+        """Yield (start_token, end_token, canonical_id) for every longest match."""
+        root = self.root
+        i, n = 0, len(tokens)
+        while i < n:
+            node = root.get(tokens[i])
+            match = None
+            j = i
+            while node is not None:
+                j += 1
+                if END in node:
+                    match = (j, node[END])
+                node = node.get(tokens[j]) if j < n else None
+            if match:
+                yield i, match[0], match[1]
+                i = match[0]
+            else:
+                i += 1
+
+    def find_in_tokens(self, tokens):
+        """Canonical IDs in already tokenized text, unique, in order of first appearance."""
+        found = {}
+        for _, _, canonical in self.find_spans(tokens):
+            found.setdefault(canonical)
+        return list(found)
+
+    def find(self, text):
+        return self.find_in_tokens(tokenize(text))
+
+
+# ---------------- COMPILED CACHE ----------------
+def taxonomy_version(path):
+    digest = hashlib.sha256(FORMAT_VERSION)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def load_trie(path, cache_path=None):
+    """
+    Load the compiled trie for the taxonomy at `path`, rebuilding and
+    re-saving it when the cache is missing or its version hash is stale.
+    """
+    cache_path = cache_path or path + ".trie.pickle"
+    version = taxonomy_version(path)
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("version") == version:
+            return SkillTrie(cached["root"], version, cached["size"])
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError):
+        pass
+
+    taxonomy = read_taxonomy(path)
+    trie = SkillTrie(compile_trie(taxonomy), version, len(taxonomy))
+
+    tmp = cache_path + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump(
+                {"version": version, "size": trie.size, "root": trie.root},
+                f, protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass  # read-only checkout: keep the in-memory trie
+
+    return trie